@@ -9,6 +9,13 @@ from ._field_conversion import EmailStr, URLStr
 from ._field_classes import NestedOptional
 from ._schema_classes import DataSchema
 from ._load_dataclass import MISSING
+from ._handler_registry import HandlerRegistry
+from ._warm_up import warm_up, WarmUp, WarmUpProgress
+from ._records import RecordLayout, RecordReader, RecordWriter
+from ._compact_errors import CompactValidationError
+from ._metrics import MetricsRegistry
+from ._tracing import Tracer, TraceEvent
+from ._bulk import bulk_ingestion
 
 (
     DataSchemaConcrete,
@@ -21,4 +28,16 @@ from ._load_dataclass import MISSING
     MISSING,
     NestedOptional,
     DataSchema,
+    HandlerRegistry,
+    warm_up,
+    WarmUp,
+    WarmUpProgress,
+    RecordLayout,
+    RecordReader,
+    RecordWriter,
+    CompactValidationError,
+    MetricsRegistry,
+    Tracer,
+    TraceEvent,
+    bulk_ingestion,
 )
@@ -0,0 +1,54 @@
+import contextlib
+import gc
+import threading
+from typing import Iterator
+
+
+class _GCPause:
+    """
+    Keeps the cyclic garbage collector disabled while any bulk ingestion is running.
+    The collector is process-wide, so nested and concurrent ingestions share one
+    pause, and it is only restored when the last one exits.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._was_enabled = False
+
+    def enter(self) -> None:
+        with self._lock:
+            if self._depth == 0:
+                self._was_enabled = gc.isenabled()
+                gc.disable()
+            self._depth += 1
+
+    def exit(self, freeze: bool) -> None:
+        with self._lock:
+            if freeze:
+                gc.freeze()
+            self._depth -= 1
+            if self._depth == 0 and self._was_enabled:
+                gc.enable()
+
+
+_GC_PAUSE = _GCPause()
+
+
+@contextlib.contextmanager
+def bulk_ingestion(freeze: bool = False) -> Iterator[None]:
+    """
+    Pauses the cyclic garbage collector, which otherwise runs over and over on the
+    growing graph of loaded objects. Objects are still freed as soon as they are no
+    longer referenced; only reference cycles wait until the collector is back on.
+
+    :param freeze: Move everything alive on exit, including the loaded objects, into
+        the permanent generation with ``gc.freeze()``, so later collections skip them.
+        Reference cycles among frozen objects are not collected until
+        ``gc.unfreeze()`` is called.
+    """
+    _GC_PAUSE.enter()
+    try:
+        yield
+    finally:
+        _GC_PAUSE.exit(freeze)
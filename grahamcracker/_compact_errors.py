@@ -0,0 +1,131 @@
+from functools import partial
+from marshmallow import fields, ValidationError
+from marshmallow.exceptions import SCHEMA
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+
+ErrorPath = Tuple[Union[str, int], ...]
+CompactError = Tuple[ErrorPath, Optional[str], Dict[str, Any]]
+
+
+class _LazyMessage:
+    """Field error message that is formatted only when rendered"""
+
+    __slots__ = ("code", "template", "kwargs")
+
+    def __init__(self, code: str, template: str, kwargs: Dict[str, Any]) -> None:
+        self.code = code
+        self.template = template
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return self.template.format(**self.kwargs)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.code!r}>"
+
+
+def _lazy_make_error(field: fields.Field, key: str, **kwargs: Any) -> ValidationError:
+    """``Field.make_error`` that defers formatting the message"""
+    template = field.error_messages.get(key)
+    if not isinstance(template, str):
+        # Missing keys and non-string messages are handled as usual.
+        return type(field).make_error(field, key, **kwargs)
+    return ValidationError([_LazyMessage(key, template, kwargs)])
+
+
+def _iter_fields(field: fields.Field) -> Iterable[fields.Field]:
+    """``field`` and the fields it delegates to, like a list's inner field"""
+    yield field
+
+    inner: List[Optional[fields.Field]] = [
+        getattr(field, "inner", None),
+        getattr(field, "key_field", None),
+        getattr(field, "value_field", None),
+    ]
+    inner.extend(getattr(field, "tuple_fields", None) or ())
+
+    for each in inner:
+        if isinstance(each, fields.Field):
+            yield from _iter_fields(each)
+
+
+def install_lazy_errors(field: fields.Field) -> None:
+    """Makes ``field`` and its inner fields raise lazily formatted errors"""
+    for each in _iter_fields(field):
+        each.make_error = partial(_lazy_make_error, each)  # type: ignore
+
+
+def render_messages(messages: Any) -> Any:
+    """Formats lazy field errors in ``messages``"""
+    if isinstance(messages, dict):
+        return {key: render_messages(value) for key, value in messages.items()}
+    if isinstance(messages, list):
+        return [render_messages(value) for value in messages]
+    if isinstance(messages, _LazyMessage):
+        return str(messages)
+    return messages
+
+
+def _compact(messages: Any, path: ErrorPath, errors: List[CompactError]) -> None:
+    if isinstance(messages, dict):
+        for key, value in messages.items():
+            _compact(value, path + (key,), errors)
+    elif isinstance(messages, list):
+        for value in messages:
+            _compact(value, path, errors)
+    elif isinstance(messages, _LazyMessage):
+        errors.append((path, messages.code, messages.kwargs))
+    else:
+        errors.append((path, None, {"message": messages}))
+
+
+class CompactValidationError(ValidationError):
+    """
+    ``ValidationError`` raised by schemas with ``compact_errors`` turned on. Field
+    error messages are formatted the first time ``messages`` is accessed, and
+    ``compact()`` lists errors without formatting them at all. Rendered messages are
+    the same as a regular ``ValidationError``.
+    """
+
+    raw_messages: Any
+    """Error messages, with field errors not yet formatted."""
+
+    def __init__(
+        self,
+        message: Any,
+        field_name: str = SCHEMA,
+        data: Any = None,
+        valid_data: Any = None,
+        **kwargs: Any,
+    ) -> None:
+        self._rendered: Any = None
+        super().__init__(
+            message, field_name, data=data, valid_data=valid_data, **kwargs
+        )
+
+    @property  # type: ignore
+    def messages(self) -> Any:  # type: ignore
+        """Error messages, formatted on first access"""
+        if self._rendered is None:
+            self._rendered = render_messages(self.raw_messages)
+        return self._rendered
+
+    @messages.setter
+    def messages(self, value: Any) -> None:
+        self.raw_messages = value
+        self._rendered = None
+
+    def compact(self) -> List[CompactError]:
+        """
+        Errors as ``(path, error code, format kwargs)`` tuples, where ``path`` is a
+        tuple of field names and indexes. Error code is the field's
+        ``error_messages`` key, or ``None`` for messages that were raised already
+        formatted, like those from validators, whose kwargs are ``{"message": str}``.
+        """
+        errors: List[CompactError] = list()
+        _compact(self.raw_messages, tuple(), errors)
+        return errors
+
+    def __str__(self) -> str:
+        return str(self.messages)
@@ -1,7 +1,9 @@
+import os
 import sys
 import ast
 import inspect
 import textwrap
+import threading
 from typing_inspect_isle import class_typevar_mapping
 from dataclasses import (
     is_dataclass,
@@ -17,6 +19,7 @@ from typing import (
     cast,
     Union,
     Mapping,
+    MutableMapping,
     Optional,
     TypeVar,
     Tuple,
@@ -30,6 +33,7 @@ from typing_inspect_isle import (
     is_generic_type,
     get_origin,
     is_typevar,
+    get_parameters,
 )
 from marshmallow import fields, Schema
 from marshmallow.fields import Field
@@ -42,22 +46,46 @@ from ._settings_classes import (
     Garams,
     DEFAULT,
 )
-from ._field_conversion import FIELD_CONVERSION
+from ._field_conversion import (
+    FIELD_CONVERSION,
+    FAST_PRIMITIVE_FIELDS,
+    ARRAY_DTYPES,
+    _import_numpy,
+    _register_array_type,
+    _GCEnum,
+    _GCArray,
+    _GCFastPrimitiveMixin,
+)
 from ._schema_classes import DataSchemaConcrete
-from ._field_classes import NestedOptional
+from ._field_classes import NestedOptional, _BulkList, _BulkDict, _BulkLoadable
 from ._schema_classes import DataSchema
 from ._fast_conversion import FastEncoder
+from ._handler_registry import HandlerRegistry
 
 DEFAULT_SCHEMA: Type[DataSchemaConcrete] = DataSchema
 
 
 SchemaType = TypeVar("SchemaType", bound=DataSchemaConcrete)
 
+# Default for schema_for(lazy=...), for startup-sensitive programs like CLI tools.
+LAZY_SCHEMAS: bool = os.environ.get("GRAHAMCRACKER_LAZY_SCHEMAS", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Garams that steer schema generation rather than being passed to the field.
+_GENERATION_GARAMS = frozenset({"as_array", "by_value"})
+
+# Guards source parsing in _recurse_dataclass_for_docstrings during concurrent
+# schema generation.
+_PARSE_LOCK = threading.Lock()
+
 
 def dataclass_schema(
     data_class: Any,
     schema_base: Type[SchemaType] = DEFAULT_SCHEMA,  # type: ignore
-    type_handlers: "Optional[Dict[Type[Any], Type[HandlerType]]]" = None,
+    type_handlers: "Optional[MutableMapping[Type[Any], Type[HandlerType]]]" = None,
     add_handler: bool = True,
 ) -> Type[SchemaType]:
     """
@@ -66,21 +94,56 @@ def dataclass_schema(
     :param data_class: dataclass to convert
     :param schema_base: ``marshmallow.Schema`` class to subclass
     :param type_handlers: ``{type, Schema}`` mapping of existing schemas to use for
-        given type.
+        given type. Pass a ``HandlerRegistry`` when generating from several threads;
+        threads generating the same dataclass at once then share one schema.
     :param add_handler: Whether to add this schema to ``type_handlers``.
 
     :return: Subclass of ``schema_base`` with dataclass fields converted to Marshmallow
         fields.
     """
+    # Concrete parameterizations of generic dataclasses, like ``Page[Item]``, are
+    # cached in type_handlers.
+    if type_handlers is not None and _is_dataclass_alias(data_class):
+        cached = type_handlers.get(data_class)
+        if isinstance(cached, type) and issubclass(cached, schema_base):
+            return cached  # type: ignore
+
+    if not add_handler or not isinstance(type_handlers, HandlerRegistry):
+        return _build_schema(data_class, schema_base, type_handlers, add_handler)
+
+    # Threads generating the same dataclass at the same time share one schema, as
+    # long as it was generated from the same base.
+    shared = type_handlers.generate(
+        data_class,
+        lambda: _build_schema(data_class, schema_base, type_handlers, add_handler),
+        use_existing=False,
+    )
+    if isinstance(shared, type) and issubclass(shared, schema_base):
+        return shared
+    return _build_schema(data_class, schema_base, type_handlers, add_handler)
 
+
+def _build_schema(
+    data_class: Any,
+    schema_base: Type[SchemaType],
+    type_handlers: "Optional[MutableMapping[Type[Any], Type[HandlerType]]]",
+    add_handler: bool,
+) -> Type[SchemaType]:
+    """Generates the schema for ``dataclass_schema``"""
     settings = _configure_settings(data_class, schema_base, type_handlers)
     class_dict = _get_schema_dict(schema_base, settings)
 
-    this_schema = type(f"{data_class.__name__}Schema", (schema_base,), class_dict)
+    if isinstance(type_handlers, HandlerRegistry) and type_handlers.bounded:
+        # marshmallow's class registry would hold on to every generated schema.
+        class_dict["Meta"] = type("Meta", (schema_base.Meta,), {"register": False})
+
+    this_schema = type(_schema_name(data_class), (schema_base,), class_dict)
     this_schema = cast(Type[Schema], this_schema)
 
     # add schema as new type handler.
-    if add_handler and type_handlers is not None:
+    if add_handler and isinstance(type_handlers, HandlerRegistry):
+        type_handlers.add_generated(data_class, this_schema)
+    elif add_handler and type_handlers is not None:
         type_handlers[data_class] = this_schema
 
     # generate the fast encoder for this schema.
@@ -94,8 +157,9 @@ def dataclass_schema(
 
 def schema_for(
     data_class: Any,
-    type_handlers: "Optional[Dict[Type[Any], Type[HandlerType]]]" = None,
+    type_handlers: "Optional[MutableMapping[Type[Any], Type[HandlerType]]]" = None,
     add_handler: bool = True,
+    lazy: Optional[bool] = None,
 ) -> Callable[[Type[SchemaType]], Type[SchemaType]]:
     """
     Class decorator for Schema class that adds marshmallow fields for ``data_class``
@@ -103,28 +167,27 @@ def schema_for(
     :param data_class: class to alter schema for
     :param type_handlers: ``{type, Schema}`` mapping of existing schemas to use for
         given type.
+    :param lazy: Defer generating the fields until the schema is first instantiated,
+        or its fields or model are first accessed. Defaults to ``True`` when the
+        ``GRAHAMCRACKER_LAZY_SCHEMAS`` environment variable is set to ``1``.
     :return: Same schema class object passed in, with added fields for ``data_class``
     """
+    if lazy is None:
+        lazy = LAZY_SCHEMAS
 
     def class_gen(schema_class: Type[SchemaType]) -> Type[SchemaType]:
-        gen_class = dataclass_schema(
-            data_class, schema_class, type_handlers, add_handler=add_handler
-        )
-
-        existing_dict = dict(schema_class.__dict__)
-        existing_dict.update(gen_class.__dict__)
-
-        existing_dict.pop("__doc__")
-
-        for name, item in existing_dict.items():
-            setattr(schema_class, name, item)
+        if lazy:
+            _DeferredSchema(schema_class, data_class, type_handlers, add_handler)
+        else:
+            _install_schema(schema_class, data_class, type_handlers, add_handler)
 
         # If the schema doesn't have it's own doc string, use the one from the
         # dataclass.
         if schema_class.__doc__ is None:
             schema_class.__doc__ = data_class.__doc__
 
-        # add schema as new type handler.
+        # add schema as new type handler, so other schemas can nest it before its
+        # fields are generated.
         if add_handler and type_handlers is not None:
             type_handlers[data_class] = schema_class
 
@@ -133,21 +196,147 @@ def schema_for(
     return class_gen
 
 
+def _install_schema(
+    schema_class: Type[SchemaType],
+    data_class: Any,
+    type_handlers: "Optional[MutableMapping[Type[Any], Type[HandlerType]]]",
+    add_handler: bool,
+) -> None:
+    """Generates the fields for ``data_class`` and adds them to ``schema_class``"""
+    gen_class = dataclass_schema(
+        data_class, schema_class, type_handlers, add_handler=add_handler
+    )
+
+    existing_dict = dict(schema_class.__dict__)
+    existing_dict.update(gen_class.__dict__)
+
+    existing_dict.pop("__doc__")
+
+    for name, item in existing_dict.items():
+        setattr(schema_class, name, item)
+
+    # dataclass_schema registers gen_class, but the decorated class should be used.
+    if add_handler and type_handlers is not None:
+        type_handlers[data_class] = schema_class
+
+
+class _DeferredSchema:
+    """
+    Holds off on ``schema_for`` generation. Stands in for the generated class
+    attributes until one of them is first read, then installs the real schema.
+    """
+
+    # Class attributes that schema_for generates. Schema.__init__ reads
+    # _declared_fields, so instantiation also triggers generation.
+    ATTRIBUTES = ("_declared_fields", "_dump_only", "__model__", "_FAST_ENCODER")
+
+    def __init__(
+        self,
+        schema_class: Type[SchemaType],
+        data_class: Any,
+        type_handlers: "Optional[MutableMapping[Type[Any], Type[HandlerType]]]",
+        add_handler: bool,
+    ) -> None:
+        self.schema_class = schema_class
+        self.data_class = data_class
+        self.type_handlers = type_handlers
+        self.add_handler = add_handler
+
+        self.lock = threading.RLock()
+        self.generating: Optional[int] = None
+        self.done = False
+        # Values the schema class had before decoration, served while generating.
+        self.originals: Dict[str, Any] = dict()
+
+        for name in self.ATTRIBUTES:
+            if name in schema_class.__dict__:
+                self.originals[name] = schema_class.__dict__[name]
+            setattr(schema_class, name, _DeferredAttribute(self, name))
+
+    def install(self) -> bool:
+        """
+        Generates and installs the schema. Returns ``False`` if this thread is already
+        generating it.
+        """
+        with self.lock:
+            if self.done:
+                return True
+            if self.generating == threading.get_ident():
+                return False
+
+            self.generating = threading.get_ident()
+            try:
+                _install_schema(
+                    self.schema_class,
+                    self.data_class,
+                    self.type_handlers,
+                    self.add_handler,
+                )
+            finally:
+                self.generating = None
+
+            # Anything generation didn't replace goes back to how it was.
+            for name in self.ATTRIBUTES:
+                if isinstance(self.schema_class.__dict__.get(name), _DeferredAttribute):
+                    delattr(self.schema_class, name)
+                    if name in self.originals:
+                        setattr(self.schema_class, name, self.originals[name])
+
+            self.done = True
+            return True
+
+    def original(self, name: str) -> Any:
+        """Class attribute ``name`` from before decoration"""
+        try:
+            return self.originals[name]
+        except KeyError:
+            pass
+
+        for base in self.schema_class.__mro__[1:]:
+            if name in base.__dict__:
+                return base.__dict__[name]
+        raise AttributeError(name)
+
+
+class _DeferredAttribute:
+    """Placeholder class attribute that triggers deferred schema generation"""
+
+    def __init__(self, deferred: _DeferredSchema, name: str) -> None:
+        self.deferred = deferred
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if not self.deferred.install():
+            # Generation reads the attributes of the class it subclasses.
+            return self.deferred.original(self.name)
+
+        if instance is None:
+            return getattr(owner, self.name)
+        return getattr(instance, self.name)
+
+
 def _configure_settings(
     data_class: Type[Any],
     schema_base: Type[SchemaType],
-    type_handlers: "Optional[Dict[Type[Any], Type[HandlerType]]]",
+    type_handlers: "Optional[MutableMapping[Type[Any], Type[HandlerType]]]",
 ) -> _SchemaGenSettings:
     """sets up schema settings based on params"""
-    if not is_dataclass(data_class) or not isinstance(data_class, type):
+    model = get_origin(data_class) if _is_dataclass_alias(data_class) else data_class
+    if not is_dataclass(model) or not isinstance(model, type):
         raise ValueError(f"{data_class} is not dataclass type")
 
     if type_handlers is None:
         type_handlers = dict()
 
-    docstrings = get_dataclass_field_docstrings(data_class)
+    docstrings = get_dataclass_field_docstrings(model)
+
+    settings = _SchemaGenSettings(model, schema_base, type_handlers, docstrings)
 
-    settings = _SchemaGenSettings(data_class, schema_base, type_handlers, docstrings)
+    if model is not data_class:
+        settings.alias = data_class
+        settings.type_var_index.update(zip(get_parameters(model), get_args(data_class)))
+
+    _register_array_type()
 
     # remove any handlers who's types are being properly handled.
     default_converters = {
@@ -166,9 +355,21 @@ def _get_schema_dict(
     if sys.version_info[:2] >= (3, 7):
         class_typevar_mapping(settings.data_class, settings.type_var_index)
 
+    template = _generic_field_template(settings)
+    generic_fields: Dict[str, Field] = dict()
+
     this_field: DCField
     for this_field in dc_fields(settings.data_class):
-        class_dict[this_field.name] = _convert_type(this_field, settings)
+        try:
+            class_dict[this_field.name] = template[this_field.name]
+        except KeyError:
+            class_dict[this_field.name] = _convert_type(this_field, settings)
+
+        if settings.alias is not None and not _has_typevar(this_field.type):
+            generic_fields[this_field.name] = class_dict[this_field.name]
+
+    if settings.alias is not None:
+        class_dict["__generic_fields__"] = generic_fields
 
     if issubclass(schema, DataSchemaConcrete):
         class_dict["__model__"] = settings.data_class
@@ -177,18 +378,87 @@ def _get_schema_dict(
         class_dict["_dump_only"] = [
             f.name
             for f in dc_fields(settings.data_class)
-            if f.metadata is not None and f.metadata.get("garams", Garams()).dump_only
+            if f.metadata is not None
+            and f.metadata.get("garams", Garams()).dump_only is True
         ]
 
     return class_dict
 
 
+def _is_dataclass_alias(data_type: Any) -> bool:
+    """Whether ``data_type`` is a parameterized generic dataclass, like Page[Item]"""
+    origin = get_origin(data_type)
+    return origin is not None and isinstance(origin, type) and is_dataclass(origin)
+
+
+def _schema_name(data_class: Any) -> str:
+    """Class name for a dataclass' schema. ``Page[Item]`` gets 'PageItemSchema'"""
+    if not _is_dataclass_alias(data_class):
+        return f"{data_class.__name__}Schema"
+
+    names = [get_origin(data_class).__name__]
+    names.extend(getattr(arg, "__name__", str(arg)) for arg in get_args(data_class))
+    return "".join(names) + "Schema"
+
+
+def _nested_schema(data_class: Any, schema_settings: _SchemaGenSettings) -> Any:
+    """
+    Generates the schema for a nested dataclass. A ``HandlerRegistry`` makes sure
+    only one thread generates a given dataclass at a time.
+    """
+    # We need to pass a clean base here, as the incoming one might have validators and
+    # the like attached to it from a decorated schema.
+    type_handlers = schema_settings.type_handlers
+    if not isinstance(type_handlers, HandlerRegistry):
+        return dataclass_schema(
+            data_class, schema_base=DataSchemaConcrete, type_handlers=type_handlers
+        )
+
+    return type_handlers.generate(
+        data_class,
+        lambda: _build_schema(data_class, DataSchemaConcrete, type_handlers, True),
+    )
+
+
+def _has_typevar(field_type: Any) -> bool:
+    """Whether a field type depends on any type variables"""
+    if is_typevar(field_type):
+        return True
+    return any(_has_typevar(arg) for arg in get_args(field_type))
+
+
+def _generic_field_template(settings: _SchemaGenSettings) -> Dict[str, Field]:
+    """
+    Fields that don't depend on type variables, taken from a schema already generated
+    for another parameterization of the same generic dataclass.
+    """
+    if settings.alias is None:
+        return dict()
+
+    for handler_type, handler in settings.type_handlers.items():
+        if get_origin(handler_type) is settings.data_class:
+            generic_fields = getattr(handler, "__generic_fields__", None)
+            if generic_fields is not None:
+                return generic_fields
+
+    return dict()
+
+
 def _convert_type(
-    data_field: Union[DCField, Type], schema_settings: _SchemaGenSettings
+    data_field: Union[DCField, Type],
+    schema_settings: _SchemaGenSettings,
+    by_value: bool = True,
 ) -> fields.Field:
-    """Converts dataclass field to Marshmallow field"""
+    """
+    Converts dataclass field to Marshmallow field. ``by_value`` is passed to enum
+    fields, including those inside containers, unless the field's garams set it.
+    """
     settings = _FieldGenSettings(data_field, schema_settings)
 
+    garams = _get_garams(settings)
+    if garams is not None and garams.by_value is not DEFAULT:
+        by_value = bool(garams.by_value)
+
     if is_typevar(settings.type) and sys.version_info[:2] >= (3, 7):
         _unpack_type_var(settings)
     settings.type, settings.optional = _unpack_optional(settings.type)
@@ -205,29 +475,76 @@ def _convert_type(
     if issubclass(settings.data_handler, Schema):
         settings.args = (settings.data_handler,)
         settings.data_handler = fields.Nested
-    elif (
-        is_dataclass(settings.type)
-        and settings.type not in settings.schema_settings.type_handlers
-    ):
+    elif is_dataclass(settings.type) and settings.data_handler is NestedOptional:
         # We make a nested schema if a dataclass does not already have a type handler
-        nested_schema = dataclass_schema(
-            settings.type,
-            # We need to pass a clean base here, as the incoming one might have
-            # validators and the like attached to it from a decorated schema.
-            schema_base=DataSchemaConcrete,
-            type_handlers=schema_settings.type_handlers,
-        )
-        settings.args = (nested_schema,)
+        settings.args = (_nested_schema(settings.type, schema_settings),)
+    elif _is_dataclass_alias(settings.type):
+        # Each concrete parameterization of a generic dataclass gets its own nested
+        # schema, which dataclass_schema caches in type_handlers.
+        settings.args = (_nested_schema(settings.type, schema_settings),)
+    elif issubclass(settings.data_handler, _GCEnum):
+        # The enum field builds its lookup tables from the concrete enum type.
+        settings.args = (settings.type,)
+        settings.kwargs["by_value"] = by_value
+    elif issubclass(settings.data_handler, _GCArray):
+        settings.args = (fields.Float(),)
     elif is_generic_type(settings.type):
-        _get_interior_fields(settings)
+        _get_interior_fields(settings, by_value)
 
     _generate_field_options(settings)
+    _use_fast_primitive(settings)
 
     marshmallow_field = settings.data_handler(*settings.args, **settings.kwargs)
+    _mark_passthrough(marshmallow_field)
 
     return marshmallow_field
 
 
+def _use_fast_primitive(settings: _FieldGenSettings) -> None:
+    """
+    Swaps stock primitive fields for their fast versions if they have no validators or
+    custom error messages.
+    """
+    try:
+        fast_handler = FAST_PRIMITIVE_FIELDS[settings.data_handler]  # type: ignore
+    except KeyError:
+        return
+
+    if settings.kwargs.get("validate") is not None:
+        return
+    if settings.kwargs.get("error_messages") is not None:
+        return
+
+    settings.data_handler = fast_handler
+
+
+def _mark_passthrough(field: fields.Field) -> None:
+    """
+    Marks fields whose JSON values dump as themselves: fast str, int, float and bool
+    fields, and bulk lists and dicts of them. Schemas copy these values straight
+    through on dump.
+    """
+    if isinstance(field, _GCFastPrimitiveMixin):
+        passthrough = field._JSON_TYPE is not None and not getattr(
+            field, "as_string", False
+        )
+    elif isinstance(field, _BulkList):
+        passthrough = _is_passthrough(field.inner)
+    elif isinstance(field, _BulkDict):
+        passthrough = _is_passthrough(field.key_field) and _is_passthrough(
+            field.value_field
+        )
+    else:
+        passthrough = False
+
+    if passthrough:
+        field._json_passthrough = True  # type: ignore
+
+
+def _is_passthrough(field: Optional[fields.Field]) -> bool:
+    return getattr(field, "_json_passthrough", False)
+
+
 def _unpack_type_var(settings: _FieldGenSettings) -> None:
     try:
         settings.type = settings.schema_settings.type_var_index[settings.type]
@@ -250,10 +567,24 @@ def _validate_type(field_type: Any) -> None:
 
 def _get_handler_type(settings: _FieldGenSettings) -> Type[HandlerType]:
     """Gets Marshmallow field/schema based on type"""
-    for handler_type, handler in settings.schema_settings.type_handlers.items():
+    type_handlers = settings.schema_settings.type_handlers
+    if _is_dataclass_alias(settings.type):
+        return type_handlers.get(settings.type, NestedOptional)
+
+    if isinstance(type_handlers, HandlerRegistry):
+        candidates = type_handlers.candidates(settings.type)
+    else:
+        candidates = type_handlers.items()
+
+    for handler_type, handler in candidates:
         test_type = get_origin(settings.type) or settings.type
-        if issubclass(test_type, handler_type):
-            return handler
+        try:
+            if issubclass(test_type, handler_type):
+                return handler
+        except TypeError:
+            # Parameterized generics registered by dataclass_schema can't be used
+            # with issubclass, and are looked up directly above.
+            continue
 
     if is_dataclass(settings.type):
         return NestedOptional
@@ -314,7 +645,7 @@ def _generate_field_options(settings: _FieldGenSettings) -> None:
     settings.kwargs.update(
         (key, value)
         for key, value in asdict(passed_kwargs).items()
-        if value is not DEFAULT
+        if value is not DEFAULT and key not in _GENERATION_GARAMS
     )
 
     # if something is required, marshmallow disallows defaults, so we'll remove those.
@@ -323,18 +654,24 @@ def _generate_field_options(settings: _FieldGenSettings) -> None:
         settings.kwargs.pop("default", None)
 
 
-def _get_interior_fields(settings: _FieldGenSettings) -> None:
+def _get_interior_fields(settings: _FieldGenSettings, by_value: bool) -> None:
     """
     Converts inner fields of a generic to options/arguments for it's Marshmallow
     container.
     """
     inner_fields: List[Field] = [
-        _convert_type(t, settings.schema_settings) for t in get_args(settings.type)
+        _convert_type(t, settings.schema_settings, by_value)
+        for t in get_args(settings.type)
     ]
 
     if get_origin(settings.type) in [Mapping, dict, MappingABC]:
         settings.kwargs["keys"] = inner_fields[0]
         settings.kwargs["values"] = inner_fields[1]
+
+        if settings.data_handler in (fields.Dict, fields.Mapping) and all(
+            isinstance(f, _BulkLoadable) for f in inner_fields
+        ):
+            settings.data_handler = _BulkDict
     elif len(inner_fields) == 1 and isinstance(inner_fields[0], fields.Nested):
         # We need to handle lists of schemas differently, so that kwargs are passed
         # to them at runtime.
@@ -348,14 +685,44 @@ def _get_interior_fields(settings: _FieldGenSettings) -> None:
     else:
         settings.args = tuple(inner_fields)
 
+        garams = _get_garams(settings)
+        if garams is not None and garams.as_array is True:
+            _use_array_field(settings)
+        elif (
+            settings.data_handler is fields.List
+            and len(inner_fields) == 1
+            and isinstance(inner_fields[0], _BulkLoadable)
+        ):
+            settings.data_handler = _BulkList
+
+
+def _get_garams(settings: _FieldGenSettings) -> Optional[Garams]:
+    """Gets the Garams passed in a dataclass field's metadata, if any"""
+    if settings.data_field is None or settings.data_field.metadata is None:
+        return None
+    return settings.data_field.metadata.get("garams")
+
+
+def _use_array_field(settings: _FieldGenSettings) -> None:
+    """Swaps a list field for a numpy array field."""
+    if _import_numpy() is None:
+        raise TypeError("Garams(as_array=True) requires numpy to be installed")
+
+    inner_type, inner_optional = _unpack_optional(get_args(settings.type)[0])
+    if (
+        get_origin(settings.type) not in (list, List)
+        or inner_optional
+        or inner_type not in ARRAY_DTYPES
+    ):
+        raise TypeError("as_array is only supported for List[float] and List[int]")
+
+    settings.data_handler = _GCArray
+    settings.kwargs["dtype"] = ARRAY_DTYPES[inner_type]
+
 
 def _filter_none_type(data_type: Type) -> bool:
     """Filters out NoneType when getting union args"""
-    if is_typevar(data_type):
-        return True
-    if issubclass(data_type, type(None)):
-        return False
-    return True
+    return data_type is not type(None)
 
 
 def _unpack_optional(data_type: Type) -> Tuple[Type, bool]:
@@ -406,12 +773,14 @@ def _recurse_dataclass_for_docstrings(
     if is_dataclass(data_class):
 
         try:
-            source = inspect.getsource(data_class)
+            # Parsing source in several threads at once can fail on some Python
+            # versions, and inspect.getsource parses the whole module.
+            with _PARSE_LOCK:
+                source = inspect.getsource(data_class)
+                parsed = ast.parse(textwrap.dedent(source))
         except OSError:
             pass
         else:
-            source = textwrap.dedent(source)
-            parsed = ast.parse(source)
             is_attr = False
 
             for item in parsed.body[0].body:  # type: ignore
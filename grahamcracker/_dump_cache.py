@@ -0,0 +1,209 @@
+import datetime
+import enum
+import threading
+import types
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Set,
+    Union,
+    get_type_hints,
+)
+from typing_inspect_isle import get_args, get_origin
+
+
+class _StrongRef:
+    """Stands in for a weak reference to objects that don't support them"""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __call__(self) -> Any:
+        return self.obj
+
+
+class DumpCacheEntry:
+    """Cached dump results for a single instance"""
+
+    __slots__ = ("ref", "dumped", "json")
+
+    def __init__(self, ref: Callable[[], Any], dumped: Any) -> None:
+        self.ref = ref
+        self.dumped = dumped
+        self.json: Optional[str] = None
+
+
+class DumpCache:
+    """
+    Least-recently-used cache of dump results, keyed by instance identity.
+
+    Instances are held through weak references where they support them, and their
+    entries are dropped when they are garbage collected. Instances without weak
+    reference support are held strongly until they fall out of the cache.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, DumpCacheEntry]" = OrderedDict()
+        # Re-entrant, as garbage collection can run a weakref callback while the lock
+        # is held.
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, obj: Any) -> Optional[DumpCacheEntry]:
+        """Entry for ``obj``, if it has been cached"""
+        key = id(obj)
+        entry = self._entries.get(key)
+        # Ids can be reused once an object is collected, so make sure this is the
+        # same object.
+        if entry is None or entry.ref() is not obj:
+            return None
+
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                pass
+        return entry
+
+    def put(self, obj: Any, dumped: Any) -> DumpCacheEntry:
+        """Caches ``dumped`` for ``obj``, evicting the oldest entries over the bound"""
+        key = id(obj)
+        try:
+            ref: Callable[[], Any] = weakref.ref(obj, partial(self._discard, key))
+        except TypeError:
+            ref = _StrongRef(obj)
+
+        entry = DumpCacheEntry(ref, dumped)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _discard(self, key: int, ref: Any) -> None:
+        """Weakref callback for collected instances"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.ref is ref:
+                del self._entries[key]
+
+
+# {schema class: {schema variant: cache}}
+_CACHES: "weakref.WeakKeyDictionary[type, Dict[Hashable, DumpCache]]" = (
+    weakref.WeakKeyDictionary()
+)
+_CACHES_LOCK = threading.Lock()
+
+
+def dump_cache_for(schema_class: type, variant: Hashable, max_size: int) -> DumpCache:
+    """Shared cache for all instances of ``schema_class`` with the same variant"""
+    with _CACHES_LOCK:
+        variants = _CACHES.setdefault(schema_class, dict())
+        try:
+            return variants[variant]
+        except KeyError:
+            cache = DumpCache(max_size)
+            variants[variant] = cache
+            return cache
+
+
+# Field types whose values can't be changed once they are created.
+_IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    bool,
+    int,
+    float,
+    complex,
+    Decimal,
+    uuid.UUID,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    enum.Enum,
+    type(None),
+)
+
+# Generic types whose values are immutable if their arguments are.
+_IMMUTABLE_ORIGINS = {Union, getattr(types, "UnionType", Union), tuple, frozenset}
+
+# {dataclass: whether its dumps can be cached}
+_CACHEABLE: "weakref.WeakKeyDictionary[type, bool]" = weakref.WeakKeyDictionary()
+
+
+def cacheable_class(data_class: type) -> bool:
+    """
+    Whether dumps of ``data_class`` instances can be cached: it must be a frozen
+    dataclass with every field typed as immutable, like scalars, frozen dataclasses,
+    or tuples and frozensets of them. Fields that could hold a list or dict, which
+    can change after the dump is cached, make the class uncacheable.
+    """
+    try:
+        return _CACHEABLE[data_class]
+    except KeyError:
+        pass
+
+    cacheable = _immutable_dataclass(data_class, set())
+    _CACHEABLE[data_class] = cacheable
+    return cacheable
+
+
+def _immutable_dataclass(data_class: type, checking: Set[type]) -> bool:
+    params = getattr(data_class, "__dataclass_params__", None)
+    if params is None or not params.frozen:
+        return False
+    if data_class in checking:
+        # Recursive references are decided by the class's other fields.
+        return True
+
+    try:
+        hints = get_type_hints(data_class)
+    except Exception:
+        # Annotations that can't be resolved can't be checked.
+        return False
+
+    checking.add(data_class)
+    try:
+        return all(
+            _immutable_type(hints.get(f.name, Any), checking)
+            for f in fields(data_class)
+        )
+    finally:
+        checking.discard(data_class)
+
+
+def _immutable_type(field_type: Any, checking: Set[type]) -> bool:
+    origin = get_origin(field_type)
+    if origin is not None:
+        args = [arg for arg in get_args(field_type) if arg is not Ellipsis]
+        return (
+            origin in _IMMUTABLE_ORIGINS
+            and bool(args)
+            and all(_immutable_type(arg, checking) for arg in args)
+        )
+
+    if not isinstance(field_type, type):
+        return False
+    if is_dataclass(field_type):
+        return _immutable_dataclass(field_type, checking)
+    return issubclass(field_type, _IMMUTABLE_TYPES)
@@ -1,9 +1,17 @@
+import base64
+import functools
+import operator
+import threading
 import marshmallow
-from dataclasses import is_dataclass, asdict
+from collections import OrderedDict
+from decimal import Decimal
+from enum import Enum
+from dataclasses import is_dataclass, fields
 from json import JSONEncoder
-from typing import Any, Type, Optional, Tuple, Dict
+from typing import Any, Callable, Type, Optional, Tuple, Dict, FrozenSet, Mapping
 
-from ._field_conversion import FIELD_CONVERSION, HandlerType
+from ._field_conversion import FIELD_CONVERSION, HandlerType, _loaded_numpy
+from ._handler_registry import HandlerRegistry
 from ._load_dataclass import MISSING
 
 
@@ -20,27 +28,88 @@ JSON_TYPES: Tuple[Type, ...] = (
 )
 
 
+# Converter fields are stateless when dumping, so one instance of each handler class is
+# shared by every converter table.
+_CONVERTER_FIELDS: "Dict[Type[HandlerType], HandlerType]" = dict()
+
+_TableKey = FrozenSet[Tuple[Type[Any], Any]]
+
+# {(type, handler) pairs: converter table}, least recently used first. Registries with
+# the same field handlers share a table, whatever schemas they also hold. Bounded, as
+# keys hold on to their types; encoders keep their own reference to their table.
+_CONVERTER_TABLES: "OrderedDict[_TableKey, Dict[Type[Any], HandlerType]]" = (
+    OrderedDict()
+)
+_MAX_CONVERTER_TABLES = 128
+
+_TABLES_LOCK = threading.Lock()
+
+
+def _needs_converter(t: Any, c: Any, numpy: Any) -> bool:
+    """Whether the fast encoder converts values of type ``t`` with handler ``c``"""
+    if not isinstance(t, type):
+        return False
+    # Dataclasses are encoded directly by FastEncoder.default, so their schemas are
+    # never needed.
+    if isinstance(c, type) and issubclass(c, marshmallow.Schema):
+        return False
+    # Enum members and numpy arrays are encoded directly by FastEncoder.default,
+    # and their fields cannot be built without a concrete enum type or dtype.
+    if issubclass(t, Enum):
+        return False
+    if numpy is not None and issubclass(t, numpy.ndarray):
+        return False
+    return not issubclass(t, JSON_TYPES)
+
+
+def _converter_field(handler: Type[HandlerType]) -> HandlerType:
+    converter = _CONVERTER_FIELDS.get(handler)
+    if converter is None:
+        converter = _CONVERTER_FIELDS.setdefault(handler, handler())
+    return converter
+
+
+def _converter_items(
+    type_handlers: "Mapping[Type[Any], Type[HandlerType]]",
+) -> _TableKey:
+    """The ``(type, handler)`` pairs of ``type_handlers`` the fast encoder needs"""
+    if isinstance(type_handlers, HandlerRegistry):
+        # Schemas are never needed, and a registry's snapshot leaves them out, so
+        # this doesn't grow with the number of schemas generated.
+        items: Any = type_handlers.field_handlers
+    else:
+        items = list(type_handlers.items())
+
+    numpy = _loaded_numpy()
+    return frozenset((t, c) for t, c in items if _needs_converter(t, c, numpy))
+
+
+def _converter_table(items: _TableKey) -> "Dict[Type[Any], HandlerType]":
+    with _TABLES_LOCK:
+        table = _CONVERTER_TABLES.get(items)
+        if table is not None:
+            _CONVERTER_TABLES.move_to_end(items)
+            return table
+
+        table = {t: _converter_field(c) for t, c in items}
+        _CONVERTER_TABLES[items] = table
+        if len(_CONVERTER_TABLES) > _MAX_CONVERTER_TABLES:
+            _CONVERTER_TABLES.popitem(last=False)
+    return table
+
+
 def generate_converter_dict(
-    type_handlers: "Dict[Type[Any], Type[HandlerType]]",
+    type_handlers: "Mapping[Type[Any], Type[HandlerType]]",
 ) -> "Dict[Type[Any], HandlerType]":
     """
     Takes the type handlers used to generate data schemas and weeds out the ones
     needed to generate a fast encoder, then initialized them.
-    """
-    result: "Dict[Type[Any], HandlerType]" = dict()
-
-    for t, c in type_handlers.items():
-        if not isinstance(t, type):
-            continue
-        if t not in JSON_TYPES:
-            add = True
-            for json_type in JSON_TYPES:
-                if issubclass(t, json_type):
-                    add = False
-            if add:
-                result[t] = c()
 
-    return result
+    Tables are shared between registries with the same field handlers, and each
+    handler class is only initialized once, so adding a handler only initializes that
+    handler. The returned table must not be mutated.
+    """
+    return _converter_table(_converter_items(type_handlers))
 
 
 DEFAULT_CONVERTERS: "Dict[Type[Any], HandlerType]" = generate_converter_dict(
@@ -48,32 +117,125 @@ DEFAULT_CONVERTERS: "Dict[Type[Any], HandlerType]" = generate_converter_dict(
 )
 
 
+def _encode_enum(obj: Enum) -> Any:
+    return obj.value
+
+
+def _encode_bytes(obj: Any) -> str:
+    return base64.b64encode(obj).decode("ascii")
+
+
+BUILTIN_ENCODERS: "Dict[Type[Any], Callable[[Any], Any]]" = {
+    Enum: _encode_enum,
+    Decimal: str,
+    set: list,
+    frozenset: list,
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+}
+"""
+Encoders for types with no type handler. Decimals are encoded as strings so no
+precision is lost, and bytes as base64.
+"""
+
+# Marks dataclass types in the dispatch cache.
+_DATACLASS = object()
+
+_encode_array = operator.methodcaller("tolist")
+
+
 class FastEncoder(JSONEncoder):
     """Meant to be subclassed for any given Dataschema"""
 
     CONVERTERS: "Dict[Type[Any], HandlerType]" = DEFAULT_CONVERTERS
 
+    # {type: encoder} of every type this encoder class has seen, resolved by MRO.
+    _dispatch: "Dict[Type[Any], Any]" = dict()
+
+    # Handlers CONVERTERS has yet to be generated from, as taken from type_handlers
+    # when the class was created. Generated encoders build their table the first time
+    # they convert a value, so generating a schema only costs the snapshot.
+    _pending_handlers: Optional[_TableKey] = None
+
     def __init_subclass__(
         cls,
-        type_handlers: Optional["Dict[Type[Any], Type[HandlerType]]"] = None,
+        type_handlers: Optional["Mapping[Type[Any], Type[HandlerType]]"] = None,
         **kwargs: Any
     ):
-        if type_handlers is None:
-            cls.CONVERTERS = DEFAULT_CONVERTERS
-        else:
-            cls.CONVERTERS = generate_converter_dict(type_handlers)
+        cls.CONVERTERS = DEFAULT_CONVERTERS
+        cls._pending_handlers = (
+            None if type_handlers is None else _converter_items(type_handlers)
+        )
+        cls._dispatch = dict()
+
+    def __init__(self, *args: Any, memoize: bool = False, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # {id(obj): (obj, data)} of dataclasses already converted by this encoder.
+        self._memo: Optional[Dict[int, Tuple[Any, Any]]] = dict() if memoize else None
 
     def default(self, obj: Any) -> Any:
-        if is_dataclass(obj):
-            data = {k: v for k, v in asdict(obj).items() if v is not MISSING}
-            return data
-        else:
-            converter = self.CONVERTERS[type(obj)]
-
-            # Schemas are only registered for dataclasses, so we are safe to assume
-            # the converter will always be a field. since dict objects will get the
-            # dict field.
-            assert not isinstance(converter, marshmallow.Schema)
-
-            value = converter._serialize(obj, "attr", {})
-            return value
+        encode = self._dispatch.get(type(obj))
+        if encode is None:
+            encode = self._resolve(type(obj))
+            if encode is None:
+                return super().default(obj)
+
+        if encode is _DATACLASS:
+            return self._encode_dataclass(obj)
+        return encode(obj)
+
+    def _encode_dataclass(self, obj: Any) -> Dict[str, Any]:
+        if self._memo is not None:
+            seen = self._memo.get(id(obj))
+            if seen is not None and seen[0] is obj:
+                return seen[1]
+
+        # Nested dataclasses come back through default(), so they are memoized too.
+        data = {
+            f.name: getattr(obj, f.name)
+            for f in fields(obj)
+            if getattr(obj, f.name) is not MISSING
+        }
+        if self._memo is not None:
+            self._memo[id(obj)] = (obj, data)
+        return data
+
+    @classmethod
+    def _resolve(cls, obj_type: Type[Any]) -> Any:
+        """
+        Finds the encoder for ``obj_type`` by walking its MRO, so subclasses of
+        handled types are encoded like their base, and caches it. Returns ``None`` if
+        the type can't be encoded.
+        """
+        encode = cls._find_encoder(obj_type)
+        if encode is not None:
+            cls._dispatch[obj_type] = encode
+        return encode
+
+    @classmethod
+    def _find_encoder(cls, obj_type: Type[Any]) -> Any:
+        if is_dataclass(obj_type):
+            return _DATACLASS
+
+        handlers = cls._pending_handlers
+        if handlers is not None:
+            cls.CONVERTERS = _converter_table(handlers)
+            cls._pending_handlers = None
+
+        for base in obj_type.__mro__:
+            converter = cls.CONVERTERS.get(base)
+            if converter is not None:
+                # Schemas are only registered for dataclasses, so we are safe to
+                # assume the converter will always be a field, since dict objects
+                # will get the dict field.
+                assert not isinstance(converter, marshmallow.Schema)
+                return functools.partial(converter._serialize, attr="attr", obj={})
+
+            encode = BUILTIN_ENCODERS.get(base)
+            if encode is not None:
+                return encode
+
+        numpy = _loaded_numpy()
+        if numpy is not None and issubclass(obj_type, (numpy.ndarray, numpy.generic)):
+            return _encode_array
+        return None
@@ -12,6 +12,8 @@ from typing import (
     Generator,
 )
 
+from ._tracing import trace_nested
+
 
 ObjType = TypeVar("ObjType")
 
@@ -32,6 +34,92 @@ def _filter_nested_item_list(
         return True
 
 
+class _BulkLoadable:
+    """
+    Mixin for fields that can load and dump a whole list of values in one tight loop.
+    ``_BulkList`` hands its values to these methods before falling back to
+    element-by-element (de)serialization.
+    """
+
+    def load_many(self, values: List[Any]) -> Optional[List[Any]]:
+        """
+        Loads ``values``, or returns ``None`` if any value needs the regular,
+        element-by-element path.
+        """
+        return None
+
+    def dump_many(self, values: List[Any]) -> Optional[List[Any]]:
+        """
+        Dumps ``values``, or returns ``None`` if any value needs the regular,
+        element-by-element path.
+        """
+        return None
+
+
+class _BulkList(fields.List):
+    """
+    As ``marshmallow.fields.List``, but loads and dumps the list in bulk through its
+    ``_BulkLoadable`` inner field. Values the inner field can't handle in bulk fall
+    back to ``fields.List``, so error messages are unchanged.
+    """
+
+    def _serialize(  # type: ignore
+        self, value: Any, attr: str, obj: Any, **kwargs: Any
+    ) -> Optional[List[Any]]:
+        if isinstance(value, list):
+            dumped = cast(_BulkLoadable, self.inner).dump_many(value)
+            if dumped is not None:
+                return dumped
+        return super()._serialize(value, attr, obj, **kwargs)
+
+    def _deserialize(  # type: ignore
+        self, value: Any, attr: Optional[str], data: Any, **kwargs: Any
+    ) -> List[Any]:
+        if isinstance(value, list):
+            loaded = cast(_BulkLoadable, self.inner).load_many(value)
+            if loaded is not None:
+                return loaded
+        return super()._deserialize(value, attr, data, **kwargs)
+
+
+class _BulkDict(fields.Dict):
+    """
+    As ``marshmallow.fields.Dict``, but loads and dumps keys and values in bulk
+    through its ``_BulkLoadable`` key and value fields. Mappings the inner fields
+    can't handle in bulk fall back to ``fields.Dict``, so error messages are
+    unchanged.
+    """
+
+    def _serialize(  # type: ignore
+        self, value: Any, attr: str, obj: Any, **kwargs: Any
+    ) -> Optional[Dict[Any, Any]]:
+        if isinstance(value, dict):
+            bulk = self._bulk_map(value, "dump_many")
+            if bulk is not None:
+                return bulk
+        return super()._serialize(value, attr, obj, **kwargs)
+
+    def _deserialize(  # type: ignore
+        self, value: Any, attr: Optional[str], data: Any, **kwargs: Any
+    ) -> Dict[Any, Any]:
+        if isinstance(value, dict):
+            bulk = self._bulk_map(value, "load_many")
+            if bulk is not None:
+                return bulk
+        return super()._deserialize(value, attr, data, **kwargs)
+
+    def _bulk_map(self, value: Dict[Any, Any], method: str) -> Optional[Dict[Any, Any]]:
+        keys = getattr(self.key_field, method)(list(value.keys()))
+        if keys is None:
+            return None
+
+        values = getattr(self.value_field, method)(list(value.values()))
+        if values is None:
+            return None
+
+        return dict(zip(keys, values))
+
+
 class NestedOptional(fields.Nested):
     """
     As ``marshmallow.fields.Nested``, but allows for None values if ``allow_none`` is
@@ -66,6 +154,28 @@ class NestedOptional(fields.Nested):
         data: Union[dict, List],
         partial: Optional[Union[bool, List[str]]] = None,
         **kwargs: Any
+    ) -> DeserializeResult:
+        tracer = getattr(self.root, "_tracer", None)
+        if tracer is not None:
+            return trace_nested(
+                tracer,
+                type(self.schema).__name__,
+                self.name or "",
+                "nested_load",
+                value,
+                lambda: self._deserialize_optional(
+                    value, attr, data, partial, **kwargs
+                ),
+            )
+        return self._deserialize_optional(value, attr, data, partial, **kwargs)
+
+    def _deserialize_optional(
+        self,
+        value: SerializeResult,
+        attr: str,
+        data: Union[dict, List],
+        partial: Optional[Union[bool, List[str]]] = None,
+        **kwargs: Any
     ) -> DeserializeResult:
         none_indexes: Set[int] = set()
 
@@ -88,6 +198,21 @@ class NestedOptional(fields.Nested):
 
     def _serialize(  # type: ignore
         self, nested_obj: DeserializeResult, attr: str, obj: Any, **kwargs: Any
+    ) -> SerializeResult:
+        tracer = getattr(self.root, "_tracer", None)
+        if tracer is not None:
+            return trace_nested(
+                tracer,
+                type(self.schema).__name__,
+                self.name or "",
+                "nested_dump",
+                nested_obj,
+                lambda: self._serialize_optional(nested_obj, attr, obj, **kwargs),
+            )
+        return self._serialize_optional(nested_obj, attr, obj, **kwargs)
+
+    def _serialize_optional(
+        self, nested_obj: DeserializeResult, attr: str, obj: Any, **kwargs: Any
     ) -> SerializeResult:
         none_indexes: Set[int] = set()
 
@@ -1,10 +1,36 @@
 import datetime
+import enum
+import math
+import re
+import sys
 import uuid
 from collections import OrderedDict
-from marshmallow import fields
-from typing import Type, Any, Mapping, List, Optional
+from contextvars import ContextVar
+from marshmallow import fields, missing
+from typing import (
+    TYPE_CHECKING,
+    Type,
+    Any,
+    Mapping,
+    List,
+    Optional,
+    Dict,
+    Union,
+    Callable,
+    Pattern,
+)
 
 from ._settings_classes import HandlerType
+from ._field_classes import _BulkLoadable
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+
+
+# Set while dumping for a binary format that can carry some values natively, like
+# aware datetimes and UUIDs for MessagePack. Fields that support it return those values
+# as-is instead of as strings.
+_NATIVE_DUMP: ContextVar[bool] = ContextVar("grahamcracker_native_dump", default=False)
 
 
 # These types exist so we can signal that str fields are e-mails or URLs
@@ -41,8 +67,463 @@ class _GCURL(fields.URL):
         return URLStr(value)
 
 
+class _GCEnum(fields.Field):
+    """
+    Loads and dumps members of ``enum_type``. Value and name lookup tables are built
+    once when the field is created, so loading a value is a single dict lookup rather
+    than a scan over the enum's members.
+
+    :param enum_type: ``enum.Enum`` subclass to load members of.
+    :param by_value: Whether members are encoded by value (default) or by name.
+    """
+
+    default_error_messages = {"unknown": "Must be one of: {choices}."}
+
+    def __init__(
+        self, enum_type: Type[enum.Enum], by_value: bool = True, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.enum_type: Type[enum.Enum] = enum_type
+        self.by_value: bool = by_value
+
+        self.value_lookup: Dict[Any, enum.Enum] = {
+            member.value: member for member in enum_type.__members__.values()
+        }
+        self.name_lookup: Dict[str, enum.Enum] = dict(enum_type.__members__)
+
+        self._lookup = self.value_lookup if by_value else self.name_lookup
+        self._choices = ", ".join(str(key) for key in self._lookup)
+
+    def _serialize(  # type: ignore
+        self, value: Optional[enum.Enum], attr: str, obj: Any, **kwargs: Any
+    ) -> Any:
+        if value is None:
+            return None
+        if self.by_value:
+            return value.value
+        return value.name
+
+    def _deserialize(  # type: ignore
+        self,
+        value: Any,
+        attr: Optional[str] = None,
+        data: Optional[dict] = None,
+        **kwargs: Any
+    ) -> enum.Enum:
+        try:
+            return self._lookup[value]
+        except (KeyError, TypeError):
+            # Members passed in directly (from a dict that was never dumped, for
+            # instance) are already loaded.
+            if isinstance(value, self.enum_type):
+                return value
+            raise self.make_error("unknown", choices=self._choices)
+
+
+# Returned by fast primitive conversions for values that need the regular load path.
+_SLOW_PATH = object()
+
+
+_NoneType = type(None)
+
+
+class _GCFastPrimitiveMixin(_BulkLoadable):
+    """
+    Minimal load path for primitive fields with no validators or custom error
+    messages. Values that are already of the right type are converted directly,
+    skipping ``Field.deserialize``'s missing and validator checks. Anything else
+    (missing, None, values that need coercion, bad values) takes the regular path, so
+    behavior and error messages are unchanged.
+
+    Lists of values whose elements are all already of the field's JSON type are
+    loaded and dumped as a plain copy.
+    """
+
+    # JSON type the field loads to and dumps from without any conversion.
+    _JSON_TYPE: Optional[type] = None
+
+    allow_none: bool
+
+    @staticmethod
+    def _convert_fast(value: Any) -> Any:
+        return _SLOW_PATH
+
+    def _is_native(self, values: List[Any]) -> bool:
+        """Whether every value is already of the field's JSON type"""
+        if self._JSON_TYPE is None:
+            return False
+        value_types = set(map(type, values))
+        if self.allow_none:
+            value_types.discard(_NoneType)
+        return value_types <= {self._JSON_TYPE}
+
+    def _native_valid(self, values: List[Any]) -> bool:
+        """Final checks for values already of the field's JSON type"""
+        return True
+
+    def load_many(self, values: List[Any]) -> Optional[List[Any]]:
+        if self._is_native(values) and self._native_valid(values):
+            return list(values)
+
+        allow_none = self.allow_none
+        convert = self._convert_fast
+        loaded: List[Any] = []
+        append = loaded.append
+
+        for value in values:
+            if value is None and allow_none:
+                append(None)
+                continue
+            converted = convert(value)
+            if converted is _SLOW_PATH:
+                return None
+            append(converted)
+
+        return loaded
+
+    def dump_many(self, values: List[Any]) -> Optional[List[Any]]:
+        if self._is_native(values):
+            return list(values)
+        return None
+
+    def deserialize(
+        self,
+        value: Any,
+        attr: Optional[str] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any
+    ) -> Any:
+        if value is not missing and value is not None:
+            converted = self._convert_fast(value)
+            if converted is not _SLOW_PATH:
+                return converted
+        return super().deserialize(value, attr, data, **kwargs)  # type: ignore
+
+
+def _convert_str(value: Any) -> Any:
+    return value if type(value) is str else _SLOW_PATH
+
+
+def _convert_int(value: Any) -> Any:
+    return value if type(value) is int else _SLOW_PATH
+
+
+def _convert_float(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is float:
+        # Subtracting a value from itself only gives 0 for finite values. nan and
+        # infinity get the regular path, which rejects them.
+        return value if value - value == 0.0 else _SLOW_PATH
+    if value_type is int:
+        try:
+            return float(value)
+        except OverflowError:
+            return _SLOW_PATH
+    return _SLOW_PATH
+
+
+def _convert_bool(value: Any) -> Any:
+    return value if value is True or value is False else _SLOW_PATH
+
+
+def _convert_uuid(value: Any) -> Any:
+    value_type = type(value)
+    if value_type is str:
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            return _SLOW_PATH
+    if value_type is uuid.UUID:
+        return value
+    if value_type is bytes and len(value) == 16:
+        return uuid.UUID(bytes=value)
+    return _SLOW_PATH
+
+
+class _GCStr(_GCFastPrimitiveMixin, fields.String):
+    _JSON_TYPE = str
+    _convert_fast = staticmethod(_convert_str)
+
+
+class _GCInt(_GCFastPrimitiveMixin, fields.Integer):
+    _JSON_TYPE = int
+    _convert_fast = staticmethod(_convert_int)
+
+
+class _GCFloat(_GCFastPrimitiveMixin, fields.Float):
+    _JSON_TYPE = float
+    _convert_fast = staticmethod(_convert_float)
+
+    def _native_valid(self, values: List[Any]) -> bool:
+        # nan and infinity are rejected by the regular path.
+        return all(math.isfinite(value) for value in values if value is not None)
+
+
+class _GCBool(_GCFastPrimitiveMixin, fields.Boolean):
+    _JSON_TYPE = bool
+    _convert_fast = staticmethod(_convert_bool)
+
+
+class _GCUUID(_GCFastPrimitiveMixin, fields.UUID):
+    _convert_fast = staticmethod(_convert_uuid)
+
+    def _serialize(  # type: ignore
+        self, value: Any, attr: str, obj: Any, **kwargs: Any
+    ) -> Any:
+        if type(value) is uuid.UUID and _NATIVE_DUMP.get():
+            return value
+        return super()._serialize(value, attr, obj, **kwargs)
+
+    def dump_many(self, values: List[Any]) -> Optional[List[Any]]:
+        if set(map(type, values)) <= {uuid.UUID, _NoneType}:
+            if _NATIVE_DUMP.get():
+                return list(values)
+            return [None if value is None else str(value) for value in values]
+        return None
+
+
+# Primitive fields that are swapped for their fast versions when a field has no
+# validators or custom error messages.
+FAST_PRIMITIVE_FIELDS: Dict[Type[fields.Field], Type[fields.Field]] = {
+    fields.String: _GCStr,
+    fields.Integer: _GCInt,
+    fields.Float: _GCFloat,
+    fields.Boolean: _GCBool,
+    fields.UUID: _GCUUID,
+}
+
+
+# Marshmallow's ISO-8601 formats, restricted to the zero-padded forms that
+# ``fromisoformat`` parses identically. Anything else goes through marshmallow's parser.
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}"
+    r"(?::\d{2}(?:\.\d{1,6}\d{0,6})?)?"
+    r"(?:Z|[+-]\d{2}:?\d{2})?"
+)
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_ISO_TIME_RE = re.compile(r"\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?")
+
+_ISO_FORMATS = {None, "iso", "iso8601"}
+
+
+class _GCTemporalMixin(_BulkLoadable):
+    """
+    Fast ISO-8601 codec for date, time and datetime fields. Values in the common
+    zero-padded ISO-8601 form are parsed directly with ``fromisoformat``. Each value
+    that isn't, or that ``fromisoformat`` rejects on this Python version, falls back
+    to marshmallow's parser on its own.
+    """
+
+    _ISO_RE: Pattern
+    _FROM_ISO: Callable[[str], Any]
+    _NATIVE_TYPE: type
+
+    format: Optional[str]
+
+    def _load_iso(self, value: Any) -> Any:
+        """Returns the parsed value, or None if it is not in the fast-path format"""
+        if type(value) is self._NATIVE_TYPE:
+            # Already loaded by a binary format.
+            return value
+        if type(value) is not str or self._ISO_RE.fullmatch(value) is None:
+            return None
+        if value[-1] == "Z":
+            # fromisoformat only accepts "Z" from Python 3.11.
+            value = value[:-1] + "+00:00"
+        try:
+            return type(self)._FROM_ISO(value)
+        except ValueError:
+            return None
+
+    def _serialize(
+        self, value: Any, attr: Optional[str], obj: Any, **kwargs: Any
+    ) -> Any:
+        if value is None:
+            return None
+        if _NATIVE_DUMP.get() and self._dumps_natively(value):
+            return value
+        if self.format in _ISO_FORMATS:
+            return value.isoformat()
+        return super()._serialize(value, attr, obj, **kwargs)  # type: ignore
+
+    def _dumps_natively(self, value: Any) -> bool:
+        """Whether ``value`` is returned as-is by native dumps"""
+        return False
+
+    def _deserialize(  # type: ignore
+        self, value: Any, attr: Optional[str], data: Any, **kwargs: Any
+    ) -> Any:
+        if type(value) is self._NATIVE_TYPE:
+            return value
+        if self.format in _ISO_FORMATS:
+            loaded = self._load_iso(value)
+            if loaded is not None:
+                return loaded
+
+        return super()._deserialize(value, attr, data, **kwargs)  # type: ignore
+
+    def load_many(self, values: List[Any]) -> Optional[List[Any]]:
+        if self.format not in _ISO_FORMATS:
+            return None
+
+        allow_none: bool = self.allow_none  # type: ignore
+        load_iso = self._load_iso
+        loaded: List[Any] = []
+        append = loaded.append
+
+        for value in values:
+            if value is None and allow_none:
+                append(None)
+                continue
+            this_loaded = load_iso(value)
+            if this_loaded is None:
+                return None
+            append(this_loaded)
+
+        return loaded
+
+    def dump_many(self, values: List[Any]) -> Optional[List[Any]]:
+        if self.format not in _ISO_FORMATS:
+            return None
+        if _NATIVE_DUMP.get():
+            dumps_natively = self._dumps_natively
+            return [
+                value if value is None or dumps_natively(value) else value.isoformat()
+                for value in values
+            ]
+        return [None if value is None else value.isoformat() for value in values]
+
+
+class _GCDateTime(_GCTemporalMixin, fields.DateTime):
+    _ISO_RE = _ISO_DATETIME_RE
+    _FROM_ISO = datetime.datetime.fromisoformat
+    _NATIVE_TYPE = datetime.datetime
+
+    def _dumps_natively(self, value: Any) -> bool:
+        # Binary timestamps are points in time, so naive values stay strings.
+        return value.tzinfo is not None
+
+
+class _GCDate(_GCTemporalMixin, fields.Date):
+    _ISO_RE = _ISO_DATE_RE
+    _FROM_ISO = datetime.date.fromisoformat
+    _NATIVE_TYPE = datetime.date
+
+
+class _GCTime(_GCTemporalMixin, fields.Time):
+    _ISO_RE = _ISO_TIME_RE
+    _FROM_ISO = datetime.time.fromisoformat
+    _NATIVE_TYPE = datetime.time
+
+
+# Array dtypes used for List fields loaded with Garams(as_array=True).
+ARRAY_DTYPES: Dict[Type[Any], str] = {float: "float64", int: "int64"}
+
+_ARRAY_ELEMENT_TYPES = {int, float}
+
+
+class _GCArray(fields.List):
+    """
+    As ``marshmallow.fields.List``, but loads a list of numbers into a
+    ``numpy.ndarray``. Well-formed lists are converted and range-checked in a single
+    vectorized pass. Anything else is loaded element-by-element through the inner
+    field, so error messages match ``fields.List``.
+
+    :param cls_or_instance: Inner number field, used when falling back to
+        element-by-element loading.
+    :param dtype: numpy dtype of loaded arrays.
+    """
+
+    default_error_messages = {"out_of_range": "Values must fit in {dtype}."}
+
+    def __init__(
+        self,
+        cls_or_instance: Union[fields.Field, type],
+        dtype: str = "float64",
+        **kwargs: Any
+    ) -> None:
+        import numpy
+
+        super().__init__(cls_or_instance, **kwargs)
+        self.dtype = numpy.dtype(dtype)
+
+    def _serialize(  # type: ignore
+        self, value: Any, attr: str, obj: Any, **kwargs: Any
+    ) -> Optional[List[Any]]:
+        import numpy
+
+        if isinstance(value, numpy.ndarray):
+            return value.tolist()
+        return super()._serialize(value, attr, obj, **kwargs)
+
+    def _deserialize(  # type: ignore
+        self, value: Any, attr: Optional[str], data: Optional[dict], **kwargs: Any
+    ) -> "numpy.ndarray":
+        import numpy
+
+        array = self._load_vectorized(value)
+        if array is not None:
+            return array
+
+        loaded = super()._deserialize(value, attr, data, **kwargs)
+        try:
+            return numpy.asarray(loaded, dtype=self.dtype)
+        except OverflowError:
+            raise self.make_error("out_of_range", dtype=self.dtype.name)
+
+    def _load_vectorized(self, value: Any) -> "Optional[numpy.ndarray]":
+        """
+        Converts ``value`` in one pass. Returns ``None`` if ``value`` needs to be
+        loaded element-by-element, either because it is malformed or because the
+        vectorized checks cannot vouch for it.
+        """
+        import numpy
+
+        if isinstance(value, list):
+            # Checking element types up front keeps bools and numeric strings, which
+            # numpy would happily coerce, on the element-by-element path.
+            if not set(map(type, value)) <= _ARRAY_ELEMENT_TYPES:
+                return None
+            array = numpy.asarray(value)
+        elif isinstance(value, numpy.ndarray):
+            array = value
+        else:
+            return None
+
+        if array.ndim != 1 or array.dtype.kind not in "iuf":
+            return None
+
+        if self.dtype.kind == "f":
+            return self._as_float_array(array)
+        return self._as_int_array(array)
+
+    def _as_float_array(self, array: "numpy.ndarray") -> "Optional[numpy.ndarray]":
+        import numpy
+
+        array = array.astype(self.dtype, copy=False)
+        if not getattr(self.inner, "allow_nan", False):
+            if not numpy.isfinite(array).all():
+                return None
+        return array
+
+    def _as_int_array(self, array: "numpy.ndarray") -> "Optional[numpy.ndarray]":
+        import numpy
+
+        # Like fields.Int, floats are truncated, so long as they are finite and fit.
+        if array.dtype.kind == "f" and not numpy.isfinite(array).all():
+            return None
+        if array.size:
+            info = numpy.iinfo(self.dtype)
+            if array.min() < info.min or array.max() > info.max:
+                return None
+        return array.astype(self.dtype, copy=False)
+
+
 FIELD_CONVERSION: "OrderedDict[Type[Any], Type[HandlerType]]" = OrderedDict(
     (
+        # Enum goes first so that mixed-in enums like IntEnum are not picked up by the
+        # int or str handlers.
+        (enum.Enum, _GCEnum),
         (EmailStr, _GCEmail),
         (URLStr, _GCURL),
         (bool, fields.Bool),
@@ -51,12 +532,39 @@ FIELD_CONVERSION: "OrderedDict[Type[Any], Type[HandlerType]]" = OrderedDict(
         (float, fields.Float),
         (list, fields.List),
         (dict, fields.Dict),
-        (datetime.datetime, fields.DateTime),
-        (datetime.date, fields.Date),
-        (datetime.time, fields.Time),
+        (datetime.datetime, _GCDateTime),
+        (datetime.date, _GCDate),
+        (datetime.time, _GCTime),
         (datetime.timedelta, fields.TimeDelta),
         (uuid.UUID, fields.UUID),
         (Mapping, fields.Mapping),
         (List, fields.List),
     )
 )
+
+
+def _import_numpy() -> Any:
+    """
+    Imports numpy on first use, so importing grahamcracker doesn't pay for it. Returns
+    ``None`` if numpy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def _loaded_numpy() -> Any:
+    """
+    numpy, if the application has already imported it. Arrays can't exist before then,
+    so checks for them never need to import it.
+    """
+    return sys.modules.get("numpy")
+
+
+def _register_array_type() -> None:
+    """Adds the ``numpy.ndarray`` handler once the application has imported numpy"""
+    numpy = _loaded_numpy()
+    if numpy is not None and numpy.ndarray not in FIELD_CONVERSION:
+        FIELD_CONVERSION[numpy.ndarray] = _GCArray
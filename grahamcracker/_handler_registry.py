@@ -0,0 +1,399 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from marshmallow import Schema
+
+from ._settings_classes import HandlerType
+
+
+GenType = TypeVar("GenType")
+
+_NOT_FOUND = object()
+
+
+def _is_schema(handler: Any) -> bool:
+    return isinstance(handler, type) and issubclass(handler, Schema)
+
+
+class _Generation:
+    """Tracks a handler that is being generated by a thread"""
+
+    __slots__ = ("owner", "done", "result", "error")
+
+    def __init__(self, owner: int) -> None:
+        self.owner = owner
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class HandlerRegistry(MutableMapping):
+    """
+    Thread-safe ``{type, handler}`` mapping that can be passed as ``type_handlers``
+    wherever a dict is accepted.
+
+    Reads never lock: every write swaps in an updated copy of the underlying dict, so
+    lookups and iteration always see a consistent snapshot. Writes are serialized by a
+    lock.
+
+    Nested schemas generated through the registry are deduplicated: if a thread asks
+    for a dataclass another thread is already generating, it waits for that result
+    instead of generating it again.
+
+    For processes that create dataclasses at runtime, the schemas generated for
+    dataclasses can be bounded with ``max_generated`` and / or ``weak_generated``, so
+    the registry doesn't hold on to every model forever. Only schemas generated by
+    ``dataclass_schema`` can be evicted; handlers passed in or set on the registry,
+    including ``schema_for`` schemas, are kept. Evicted schemas are generated again
+    when next needed. Generated entries of a bounded registry only
+    handle their exact dataclass, not its subclasses, and their schemas are not added
+    to marshmallow's class registry, so they can't be referenced by name.
+
+    :param handlers: Initial handlers.
+    :param max_generated: Keep at most this many generated schemas, evicting the least
+        recently used. Looking up a schema counts as using it, and takes the lock.
+    :param weak_generated: Hold generated schemas through weak references, so they are
+        dropped once nothing else uses them.
+    """
+
+    def __init__(
+        self,
+        handlers: "Optional[Mapping[Type[Any], Type[HandlerType]]]" = None,
+        max_generated: Optional[int] = None,
+        weak_generated: bool = False,
+    ) -> None:
+        self.max_generated = max_generated
+        self.weak_generated = weak_generated
+
+        # All handlers, or only the declared ones when bounded.
+        self._handlers: "Dict[Type[Any], Type[HandlerType]]" = dict()
+        # Generated schemas when bounded, least recently used first. Values are weak
+        # references with weak_generated.
+        self._generated: "OrderedDict[Any, Any]" = OrderedDict()
+        # Whether a generated schema was collected since dead references were last
+        # dropped.
+        self._collected = False
+
+        self._lock = threading.RLock()
+        self._in_flight: Dict[Any, _Generation] = dict()
+        # thread id -> key that thread is waiting on.
+        self._waiting: Dict[int, Any] = dict()
+
+        # Handlers that aren't schemas, kept apart so fast encoders don't have to scan
+        # every generated schema for them.
+        self._field_handlers: Dict[Any, Any] = dict()
+        self._field_items: FrozenSet[Tuple[Any, Any]] = frozenset()
+
+        if handlers:
+            self.update(handlers)
+
+    @property
+    def bounded(self) -> bool:
+        """Whether generated schemas are held separately and can be evicted"""
+        return self.max_generated is not None or self.weak_generated
+
+    def _get_generated(self, key: Any) -> Any:
+        """The generated schema for ``key``, or ``_NOT_FOUND``"""
+        entry = self._generated.get(key, _NOT_FOUND)
+        if entry is _NOT_FOUND:
+            return entry
+        if self.weak_generated:
+            entry = entry()
+            if entry is None:
+                return _NOT_FOUND
+
+        if self.max_generated is not None:
+            with self._lock:
+                if key in self._generated:
+                    self._generated.move_to_end(key)
+        return entry
+
+    def _generated_items(self) -> "List[Tuple[Any, Any]]":
+        with self._lock:
+            entries = list(self._generated.items())
+        if not self.weak_generated:
+            return entries
+
+        items = [(key, ref()) for key, ref in entries]
+        return [(key, value) for key, value in items if value is not None]
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._handlers[key]
+        except KeyError:
+            if not self._generated:
+                raise
+
+        value = self._get_generated(key)
+        if value is _NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _NOT_FOUND) is not _NOT_FOUND
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self.bounded:
+            return iter(self._handlers)
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        if not self.bounded:
+            return len(self._handlers)
+        return len(self._handlers) + len(self._generated_items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self) -> Any:
+        if not self.bounded:
+            return self._handlers.items()
+        return list(self._handlers.items()) + self._generated_items()
+
+    def keys(self) -> Any:
+        if not self.bounded:
+            return self._handlers.keys()
+        return [key for key, _ in self.items()]
+
+    def values(self) -> Any:
+        if not self.bounded:
+            return self._handlers.values()
+        return [value for _, value in self.items()]
+
+    @property
+    def field_handlers(self) -> FrozenSet[Tuple[Any, Any]]:
+        """
+        Snapshot of the ``(type, handler)`` pairs whose handler is not a schema. It is
+        updated as handlers are added and removed, so reading it doesn't scan the
+        registry.
+        """
+        return self._field_items
+
+    def candidates(self, data_type: Any) -> "Iterable[Tuple[Any, Any]]":
+        """
+        ``(type, handler)`` pairs to match ``data_type`` against by subclass, in
+        priority order. Generated schemas of a bounded registry are only matched by
+        exact type, so the number of generated models doesn't slow this down.
+        """
+        if not self.bounded:
+            return self._handlers.items()
+
+        try:
+            generated = self._get_generated(data_type)
+        except TypeError:
+            # Unhashable types, like some generic aliases.
+            generated = _NOT_FOUND
+        if generated is not _NOT_FOUND:
+            return [(data_type, generated)]
+        return self._handlers.items()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.update({key: value})
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            if key in self._handlers:
+                handlers = dict(self._handlers)
+                del handlers[key]
+                self._handlers = handlers
+                self._update_field_handlers({key: _NOT_FOUND})
+            else:
+                del self._generated[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        """Adds all entries with a single copy of the underlying dict"""
+        new = dict(*args, **kwargs)
+        if not new:
+            return
+
+        with self._lock:
+            for key in new:
+                self._generated.pop(key, None)
+
+            handlers = dict(self._handlers)
+            handlers.update(new)
+            self._handlers = handlers
+            self._update_field_handlers(new)
+
+    def _update_field_handlers(self, changes: Mapping[Any, Any]) -> None:
+        """
+        Applies ``{key: handler}`` changes to the field handler snapshot, where
+        ``_NOT_FOUND`` removes a key. Lock must be held.
+        """
+        field_handlers = None
+        for key, handler in changes.items():
+            is_field = handler is not _NOT_FOUND and not _is_schema(handler)
+            if not is_field and key not in self._field_handlers:
+                continue
+
+            if field_handlers is None:
+                field_handlers = dict(self._field_handlers)
+            if is_field:
+                field_handlers[key] = handler
+            else:
+                del field_handlers[key]
+
+        if field_handlers is not None:
+            self._field_handlers = field_handlers
+            self._field_items = frozenset(field_handlers.items())
+
+    def add_generated(self, key: Any, handler: Any) -> None:
+        """
+        Adds a schema generated for a dataclass. Unlike handlers set any other way, it
+        can be evicted when the registry is bounded.
+        """
+        if not self.bounded:
+            self[key] = handler
+            return
+
+        with self._lock:
+            self._set_generated(key, handler)
+
+    def _set_generated(self, key: Any, value: Any) -> None:
+        """Adds a generated schema, evicting others if needed. Lock must be held"""
+        if key in self._handlers:
+            handlers = dict(self._handlers)
+            del handlers[key]
+            self._handlers = handlers
+            self._update_field_handlers({key: _NOT_FOUND})
+
+        if self._collected:
+            self._drop_collected()
+
+        if self.weak_generated:
+            value = weakref.ref(value, self._on_collected)
+        self._generated[key] = value
+        self._generated.move_to_end(key)
+
+        if self.max_generated is not None:
+            while len(self._generated) > self.max_generated:
+                self._generated.popitem(last=False)
+
+    def _on_collected(self, ref: Any) -> None:
+        # Garbage collection can run this while the registry is being changed, so
+        # dead entries are only dropped on the next write.
+        self._collected = True
+
+    def _drop_collected(self) -> None:
+        self._collected = False
+        dead = [key for key, ref in self._generated.items() if ref() is None]
+        for key in dead:
+            del self._generated[key]
+
+    def generate(
+        self, key: Any, factory: Callable[[], GenType], use_existing: bool = True
+    ) -> GenType:
+        """
+        Returns the handler registered for ``key``, calling ``factory`` to create it if
+        it is missing. ``factory`` is responsible for registering its result.
+
+        Only one thread runs ``factory`` for a given key at a time; other threads
+        asking for the same key wait for and share its result.
+
+        :param use_existing: Return a handler already registered for ``key``. If
+            ``False``, ``factory`` is always called, unless another thread is already
+            generating ``key``.
+        """
+        if use_existing:
+            existing = self.get(key, _NOT_FOUND)
+            if existing is not _NOT_FOUND:
+                return existing
+
+        this_thread = threading.get_ident()
+        generation, is_owner = self._claim(key, this_thread, use_existing)
+
+        if generation is None:
+            # Re-entrant or cyclic request: waiting would never return.
+            return factory()
+        if not is_owner:
+            return self._wait(generation, this_thread)
+
+        try:
+            generation.result = factory()
+        except BaseException as error:
+            generation.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            generation.done.set()
+
+        return generation.result
+
+    def _claim(
+        self, key: Any, this_thread: int, use_existing: bool
+    ) -> "Tuple[Optional[_Generation], bool]":
+        """
+        Returns the in-flight generation for ``key`` and whether this thread owns it.
+        The generation is ``None`` if waiting on it would deadlock.
+        """
+        with self._lock:
+            existing = self.get(key, _NOT_FOUND) if use_existing else _NOT_FOUND
+            if existing is not _NOT_FOUND:
+                generation = _Generation(this_thread)
+                generation.result = existing
+                generation.done.set()
+                return generation, False
+
+            in_flight: Optional[_Generation] = self._in_flight.get(key)
+            if in_flight is None:
+                generation = _Generation(this_thread)
+                self._in_flight[key] = generation
+                return generation, True
+
+            if self._would_deadlock(in_flight.owner, this_thread):
+                return None, False
+
+            self._waiting[this_thread] = key
+            return in_flight, False
+
+    def _wait(self, generation: _Generation, this_thread: int) -> Any:
+        """Waits for another thread's generation to finish"""
+        generation.done.wait()
+        with self._lock:
+            self._waiting.pop(this_thread, None)
+
+        if generation.error is not None:
+            raise generation.error
+        return generation.result
+
+    def _would_deadlock(self, owner: int, this_thread: int) -> bool:
+        """
+        Follows the chain of threads waiting on each other's generations from
+        ``owner``. Must be called with the lock held.
+        """
+        seen = set()
+        while owner not in seen:
+            if owner == this_thread:
+                return True
+            seen.add(owner)
+
+            try:
+                generation = self._in_flight[self._waiting[owner]]
+            except KeyError:
+                return False
+            owner = generation.owner
+
+        return False
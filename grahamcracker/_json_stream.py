@@ -0,0 +1,213 @@
+import codecs
+import contextlib
+import io
+import json
+import mmap
+import os
+import re
+from typing import IO, Any, Iterator, Optional, Tuple, Union
+
+
+FileType = Union[str, "os.PathLike[str]", IO[Any]]
+BufferType = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_BOM = codecs.BOM_UTF8
+
+
+@contextlib.contextmanager
+def open_buffer(file: FileType) -> Iterator[Union[str, memoryview]]:
+    """
+    Yields the contents of a path or file object. Regular files are memory-mapped
+    and yielded as a ``memoryview`` of the map, so nothing is copied. Streams that
+    can't be mapped are read, and text streams yield a ``str``.
+    """
+    if isinstance(file, str) or hasattr(file, "__fspath__"):
+        fp: IO[Any] = open(file, "rb")  # type: ignore
+        owns_file = True
+    else:
+        fp = file  # type: ignore
+        owns_file = False
+
+    try:
+        mapped = _map_file(fp)
+        if mapped is None:
+            data = fp.read()
+            yield data if isinstance(data, str) else memoryview(data)
+            return
+
+        view = memoryview(mapped)
+        body = view[fp.tell():]
+        try:
+            yield body
+        finally:
+            body.release()
+            view.release()
+            mapped.close()
+    finally:
+        if owns_file:
+            fp.close()
+
+
+def _map_file(fp: IO[Any]) -> Optional[mmap.mmap]:
+    """Maps a binary file object read-only, or returns ``None`` if it can't be"""
+    if isinstance(fp, io.TextIOBase):
+        return None
+    try:
+        fileno = fp.fileno()
+        if os.fstat(fileno).st_size == 0:
+            # Empty files can't be mapped.
+            return None
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return None
+
+
+def decode_buffer(data: BufferType) -> str:
+    """Decodes UTF-8 JSON straight from a buffer, skipping a leading BOM"""
+    return str(data, "utf-8-sig")
+
+
+def is_json_array(data: Union[str, BufferType]) -> bool:
+    """Whether the JSON document in ``data`` is an array"""
+    if isinstance(data, str):
+        return data.lstrip(" \t\n\r\ufeff")[:1] == "["
+
+    view = memoryview(data)
+    start = len(_BOM) if view[: len(_BOM)] == _BOM else 0
+    for index in range(start, len(view)):
+        byte = view[index]
+        if byte not in b" \t\n\r":
+            return byte == ord("[")
+    return False
+
+
+class _ChunkedText:
+    """Text decoded incrementally from a UTF-8 buffer"""
+
+    def __init__(self, data: Union[str, BufferType], chunk_size: int) -> None:
+        self.text = ""
+        self.position = 0
+
+        self._data: Any = data if isinstance(data, str) else memoryview(data)
+        self._read = 0
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    @property
+    def at_end(self) -> bool:
+        return self.position >= len(self.text)
+
+    def more(self) -> bool:
+        """
+        Decodes the next chunk, dropping text before ``position``. Returns ``False``
+        if the buffer is exhausted.
+        """
+        if self._read >= len(self._data):
+            return False
+
+        # Read at least as much as is held, so a value spanning many chunks is
+        # re-parsed a logarithmic number of times.
+        held = self.text[self.position:]
+        end = self._read + max(self._chunk_size, len(held))
+        chunk = self._data[self._read:end]
+        self._read = end
+
+        if isinstance(chunk, str):
+            decoded = chunk
+        else:
+            decoded = self._decoder.decode(chunk, final=self._read >= len(self._data))
+
+        self.text = held + decoded
+        self.position = 0
+        return True
+
+    def skip_whitespace(self) -> None:
+        while True:
+            match = _WHITESPACE.match(self.text, self.position)
+            self.position = match.end()  # type: ignore
+            if not self.at_end or not self.more():
+                return
+
+    def release(self) -> None:
+        if isinstance(self._data, memoryview):
+            self._data.release()
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, self.position)
+
+
+def iter_json_array(
+    data: Union[str, BufferType],
+    chunk_size: int = 1 << 20,
+    decoder: Optional[json.JSONDecoder] = None,
+) -> Iterator[Any]:
+    """
+    Yields the items of a JSON array one at a time, decoding ``data`` in chunks so
+    only about ``chunk_size`` characters of text are held at once.
+
+    :raises json.JSONDecodeError: If ``data`` is not a valid JSON array. Positions in
+        the error are relative to the chunk being parsed.
+    """
+    if decoder is None:
+        decoder = json.JSONDecoder()
+    stream = _ChunkedText(data, chunk_size)
+
+    try:
+        stream.skip_whitespace()
+        if stream.at_end or stream.text[stream.position] != "[":
+            raise stream.error("Expecting '['")
+        stream.position += 1
+        stream.skip_whitespace()
+
+        if not stream.at_end and stream.text[stream.position] == "]":
+            stream.position += 1
+        else:
+            yield from _iter_items(stream, decoder)
+
+        stream.skip_whitespace()
+        if not stream.at_end:
+            raise stream.error("Extra data")
+    finally:
+        # Tracebacks keep the stream alive, so let go of the buffer now, or a
+        # memory-mapped file couldn't be closed.
+        stream.release()
+
+
+def _iter_items(stream: _ChunkedText, decoder: json.JSONDecoder) -> Iterator[Any]:
+    """Yields array items until the closing bracket has been consumed"""
+    while True:
+        value, end = _decode_item(stream, decoder)
+        stream.position = end
+        yield value
+
+        stream.skip_whitespace()
+        if stream.at_end:
+            raise stream.error("Expecting ',' delimiter")
+
+        delimiter = stream.text[stream.position]
+        stream.position += 1
+        if delimiter == "]":
+            return
+        if delimiter != ",":
+            stream.position -= 1
+            raise stream.error("Expecting ',' delimiter")
+        stream.skip_whitespace()
+
+
+def _decode_item(stream: _ChunkedText, decoder: json.JSONDecoder) -> Tuple[Any, int]:
+    """Decodes the item at the stream position, reading more text as needed"""
+    while True:
+        try:
+            value, end = decoder.raw_decode(stream.text, stream.position)
+        except json.JSONDecodeError:
+            if stream.more():
+                continue
+            raise
+
+        # A number or literal at the end of the text may continue in the next chunk,
+        # so only accept a value once something follows it.
+        after = _WHITESPACE.match(stream.text, end).end()  # type: ignore
+        if after >= len(stream.text) and stream.more():
+            continue
+        return value, end
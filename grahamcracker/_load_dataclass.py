@@ -5,7 +5,13 @@
 # that is handled through marshamllow. Neither does any validation occur -- again, that
 # is handled by marshmallow.
 
-from dataclasses import fields, Field, FrozenInstanceError, MISSING as DC_MISSING
+from dataclasses import (
+    fields,
+    replace,
+    Field,
+    FrozenInstanceError,
+    MISSING as DC_MISSING,
+)
 from typing import Dict, Any, TypeVar, Type, Tuple
 
 
@@ -88,3 +94,33 @@ def _build_attribute_dicts(
             post_init_values[data_field.name] = value
 
     return kwargs, post_init_values
+
+
+def dataclass_update(
+    instance: DataClassType, data: Dict[str, Any], replace_frozen: bool
+) -> DataClassType:
+    """
+    Assigns validated / deserialized values onto an existing dataclass instance.
+
+    Frozen instances are updated through ``object.__setattr__``, like post-init fields
+    in ``dataclass_from_dict``, unless ``replace_frozen`` is set, in which case an
+    updated copy is returned.
+    """
+    if not data:
+        return instance
+
+    if replace_frozen and instance.__dataclass_params__.frozen:  # type: ignore
+        init_names = {f.name for f in fields(instance) if f.init}  # type: ignore
+        init_values = {k: v for k, v in data.items() if k in init_names}
+        post_init_values = {k: v for k, v in data.items() if k not in init_names}
+
+        instance = replace(instance, **init_values)  # type: ignore
+        data = post_init_values
+
+    for name, value in data.items():
+        try:
+            setattr(instance, name, value)
+        except FrozenInstanceError:
+            object.__setattr__(instance, name, value)  # type: ignore
+
+    return instance
@@ -0,0 +1,319 @@
+import bisect
+import math
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+class _MetricInfo(NamedTuple):
+    kind: str
+    help: str
+    labels: Tuple[str, ...]
+
+
+CALLS = "grahamcracker_calls_total"
+RECORDS = "grahamcracker_records_total"
+BYTES_IN = "grahamcracker_bytes_in_total"
+BYTES_OUT = "grahamcracker_bytes_out_total"
+FAILURES = "grahamcracker_validation_failures_total"
+LATENCY = "grahamcracker_latency_seconds"
+
+METRICS: Dict[str, _MetricInfo] = {
+    CALLS: _MetricInfo("counter", "Schema method calls.", ("schema", "operation")),
+    RECORDS: _MetricInfo(
+        "counter", "Records loaded or dumped.", ("schema", "operation")
+    ),
+    BYTES_IN: _MetricInfo("counter", "Bytes of input to loads.", ("schema",)),
+    BYTES_OUT: _MetricInfo("counter", "Bytes of output from dumps.", ("schema",)),
+    FAILURES: _MetricInfo(
+        "counter", "Validation failures by top-level field.", ("schema", "field")
+    ),
+    LATENCY: _MetricInfo(
+        "histogram", "Schema method latency in seconds.", ("schema", "operation")
+    ),
+}
+
+# (metric name, label values)
+_Key = Tuple[str, Tuple[str, ...]]
+
+
+class _Shard:
+    """Metrics recorded by a single thread"""
+
+    __slots__ = ("generation", "counters", "histograms")
+
+    def __init__(self, generation: int) -> None:
+        # Shards of earlier generations were discarded by reset().
+        self.generation = generation
+        self.counters: Dict[_Key, float] = dict()
+        # Per-bucket counts, then sum and count.
+        self.histograms: Dict[_Key, List[float]] = dict()
+
+
+class _Measurement:
+    """Times one schema method call. Returned by ``MetricsRegistry.measure``"""
+
+    __slots__ = (
+        "registry",
+        "schema",
+        "operation",
+        "records",
+        "bytes_in",
+        "bytes_out",
+        "failed_fields",
+        "start",
+    )
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        schema: str,
+        operation: str,
+        records: int,
+        bytes_in: int,
+    ) -> None:
+        self.registry = registry
+        self.schema = schema
+        self.operation = operation
+        self.records = records
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+        self.failed_fields: Iterable[str] = ()
+        self.start = 0.0
+
+    def __enter__(self) -> "_Measurement":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.registry._record(self, time.perf_counter() - self.start)
+
+
+class MetricsRegistry:
+    """
+    Counters and latency histograms for schema calls. Pass one to a schema's
+    ``metrics`` init param, or set it as the ``METRICS`` class attribute.
+
+    Each thread records into its own shard without locking. Shards are summed when
+    the metrics are read.
+
+    :param buckets: Upper bounds in seconds of the latency histogram buckets.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: List[_Shard] = list()
+        self._generation = 0
+        # Only taken when a thread records for the first time after a reset.
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard: Optional[_Shard] = getattr(self._local, "shard", None)
+        if shard is not None and shard.generation == self._generation:
+            return shard
+
+        with self._lock:
+            shard = _Shard(self._generation)
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def measure(
+        self, schema: str, operation: str, records: int = 0, bytes_in: int = 0
+    ) -> _Measurement:
+        """
+        Context manager that records a call of ``operation`` on ``schema`` when it
+        exits. Set ``bytes_out`` and ``failed_fields`` on it before then.
+        """
+        return _Measurement(self, schema, operation, records, bytes_in)
+
+    def _record(self, measurement: _Measurement, elapsed: float) -> None:
+        shard = self._shard()
+        counters = shard.counters
+        schema = measurement.schema
+        op_labels = (schema, measurement.operation)
+
+        for key, amount in (
+            ((CALLS, op_labels), 1),
+            ((RECORDS, op_labels), measurement.records),
+            ((BYTES_IN, (schema,)), measurement.bytes_in),
+            ((BYTES_OUT, (schema,)), measurement.bytes_out),
+        ):
+            if amount:
+                counters[key] = counters.get(key, 0) + amount
+
+        for field in measurement.failed_fields:
+            key = (FAILURES, (schema, str(field)))
+            counters[key] = counters.get(key, 0) + 1
+
+        key = (LATENCY, op_labels)
+        histogram = shard.histograms.get(key)
+        if histogram is None:
+            histogram = shard.histograms[key] = [0.0] * (len(self.buckets) + 3)
+        histogram[bisect.bisect_left(self.buckets, elapsed)] += 1
+        histogram[-2] += elapsed
+        histogram[-1] += 1
+
+    def _collect(self) -> Tuple[Dict[_Key, float], Dict[_Key, List[float]]]:
+        """Sums the shards of all threads"""
+        counters: Dict[_Key, float] = dict()
+        histograms: Dict[_Key, List[float]] = dict()
+
+        with self._lock:
+            shards = list(self._shards)
+
+        for shard in shards:
+            # Copies are atomic, so other threads can keep recording.
+            for key, value in shard.counters.copy().items():
+                counters[key] = counters.get(key, 0) + value
+            for key, values in shard.histograms.copy().items():
+                total = histograms.setdefault(key, [0.0] * len(values))
+                for index, value in enumerate(list(values)):
+                    total[index] += value
+
+        return counters, histograms
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        ``{metric name: {"type": str, "help": str, "samples": [sample, ...]}}``.
+        Counter samples are ``{"labels": dict, "value": number}``. Histogram samples
+        are ``{"labels": dict, "buckets": {upper bound: cumulative count}, "sum":
+        float, "count": int}``.
+        """
+        counters, histograms = self._collect()
+        result: Dict[str, Dict[str, Any]] = {
+            name: {"type": info.kind, "help": info.help, "samples": list()}
+            for name, info in METRICS.items()
+        }
+
+        for (name, label_values), value in sorted(counters.items()):
+            labels = dict(zip(METRICS[name].labels, label_values))
+            result[name]["samples"].append({"labels": labels, "value": value})
+
+        for (name, label_values), values in sorted(histograms.items()):
+            labels = dict(zip(METRICS[name].labels, label_values))
+            cumulative = 0.0
+            buckets: Dict[float, int] = dict()
+            for bound, count in zip(self.buckets + (math.inf,), values):
+                cumulative += count
+                buckets[bound] = int(cumulative)
+            result[name]["samples"].append(
+                {
+                    "labels": labels,
+                    "buckets": buckets,
+                    "sum": values[-2],
+                    "count": int(values[-1]),
+                }
+            )
+
+        return result
+
+    def render_text(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format"""
+        lines: List[str] = list()
+
+        for name, metric in self.as_dict().items():
+            if not metric["samples"]:
+                continue
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+
+            for sample in metric["samples"]:
+                labels = sample["labels"]
+                if metric["type"] == "counter":
+                    lines.append(
+                        f"{name}{_render_labels(labels)} {_number(sample['value'])}"
+                    )
+                    continue
+
+                for bound, count in sample["buckets"].items():
+                    le = "+Inf" if bound == math.inf else _number(bound)
+                    bucket_labels = _render_labels(dict(labels, le=le))
+                    lines.append(f"{name}_bucket{bucket_labels} {count}")
+                lines.append(
+                    f"{name}_sum{_render_labels(labels)} {_number(sample['sum'])}"
+                )
+                lines.append(f"{name}_count{_render_labels(labels)} {sample['count']}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """
+        Clears all recorded metrics. Shards are replaced rather than cleared, as other
+        threads may be writing to them; those threads move to new shards on their
+        next record.
+        """
+        with self._lock:
+            self._shards = list()
+            self._generation += 1
+
+
+def _render_labels(labels: Dict[str, str]) -> str:
+    rendered = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items()
+    )
+    return "{" + rendered + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def failed_fields(messages: Any) -> List[str]:
+    """Top-level field names in validation error ``messages``, once per record"""
+    if not isinstance(messages, dict):
+        return list()
+
+    names: List[str] = list()
+    for key, value in messages.items():
+        if isinstance(key, int) and isinstance(value, dict):
+            # Errors of a record in a many load.
+            names.extend(value)
+        else:
+            names.append(key)
+    return names
+
+
+def byte_size(data: Any) -> int:
+    """Size in bytes of ``loads`` input or ``dumps`` output. Strings count as UTF-8"""
+    if not isinstance(data, str):
+        return len(data)
+    if data.isascii():
+        return len(data)
+    return len(data.encode("utf-8", "surrogatepass"))
+
+
+def record_count(data: Any, many: bool) -> int:
+    """Number of records in load or dump input"""
+    if not many:
+        return 1
+    try:
+        return len(data)
+    except TypeError:
+        return 0
@@ -0,0 +1,396 @@
+# A small MessagePack codec, so binary dumps need no extra dependencies. If the
+# ``msgpack`` package is installed, it is used instead.
+#
+# Besides the standard types, aware datetimes are packed with the timestamp extension
+# type (-1), and UUIDs as 16-byte binary. Naive datetimes have no MessagePack
+# representation and are rejected.
+
+import datetime
+import struct
+import uuid
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type, Union
+
+
+BinaryType = Union[bytes, bytearray, memoryview]
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_TIMESTAMP_EXT = -1
+
+
+class ExtType(NamedTuple):
+    """Extension value with a type code this codec doesn't know"""
+
+    code: int
+    data: bytes
+
+
+class _Backend:
+    """Lazily imported ``msgpack`` package, if it is installed"""
+
+    module: Any = None
+    resolved: bool = False
+
+
+def _backend() -> Any:
+    if not _Backend.resolved:
+        try:
+            import msgpack
+        except ImportError:
+            msgpack = None
+        _Backend.module = msgpack
+        _Backend.resolved = True
+    return _Backend.module
+
+
+def packb(obj: Any, use_backend: bool = True) -> bytes:
+    """
+    Packs ``obj`` into MessagePack bytes.
+
+    :param use_backend: Use the ``msgpack`` package if it is installed.
+    """
+    msgpack = _backend() if use_backend else None
+    if msgpack is not None:
+        return msgpack.packb(
+            obj, use_bin_type=True, datetime=True, default=_backend_default
+        )
+
+    buffer = bytearray()
+    _pack(obj, buffer)
+    return bytes(buffer)
+
+
+def unpackb(data: BinaryType, use_backend: bool = True) -> Any:
+    """
+    Unpacks MessagePack bytes. Timestamps are returned as aware UTC datetimes.
+
+    :param use_backend: Use the ``msgpack`` package if it is installed.
+    """
+    msgpack = _backend() if use_backend else None
+    if msgpack is not None:
+        return msgpack.unpackb(
+            data, raw=False, timestamp=3, strict_map_key=False, use_list=True
+        )
+
+    unpacker = _Unpacker(data)
+    value = unpacker.unpack()
+    if unpacker.position != len(unpacker.data):
+        raise ValueError("extra data after MessagePack value")
+    return value
+
+
+def _backend_default(obj: Any) -> Any:
+    if isinstance(obj, uuid.UUID):
+        return obj.bytes
+    raise TypeError(f"can not serialize {type(obj).__name__!r} object")
+
+
+# ------------------------------------------------------------------------------------
+# Packing
+# ------------------------------------------------------------------------------------
+
+
+def _pack_none(obj: None, buffer: bytearray) -> None:
+    buffer.append(0xC0)
+
+
+def _pack_bool(obj: bool, buffer: bytearray) -> None:
+    buffer.append(0xC3 if obj else 0xC2)
+
+
+_UINT_FORMATS = [
+    (0xFF, struct.Struct(">BB"), 0xCC),
+    (0xFFFF, struct.Struct(">BH"), 0xCD),
+    (0xFFFFFFFF, struct.Struct(">BI"), 0xCE),
+    (0xFFFFFFFFFFFFFFFF, struct.Struct(">BQ"), 0xCF),
+]
+_INT_FORMATS = [
+    (-0x80, struct.Struct(">Bb"), 0xD0),
+    (-0x8000, struct.Struct(">Bh"), 0xD1),
+    (-0x80000000, struct.Struct(">Bi"), 0xD2),
+    (-0x8000000000000000, struct.Struct(">Bq"), 0xD3),
+]
+
+
+def _pack_int(obj: int, buffer: bytearray) -> None:
+    # Positive and negative fixint.
+    if -0x20 <= obj < 0x80:
+        buffer.append(obj & 0xFF)
+        return
+
+    if obj >= 0:
+        for limit, packer, code in _UINT_FORMATS:
+            if obj <= limit:
+                buffer += packer.pack(code, obj)
+                return
+    else:
+        for limit, packer, code in _INT_FORMATS:
+            if obj >= limit:
+                buffer += packer.pack(code, obj)
+                return
+
+    raise OverflowError("int out of range for MessagePack")
+
+
+def _pack_float(obj: float, buffer: bytearray) -> None:
+    buffer += struct.pack(">Bd", 0xCB, obj)
+
+
+def _pack_header(
+    size: int, buffer: bytearray, fix: Optional[int], fix_max: int, codes: List[int]
+) -> None:
+    """Writes a str, bin, array or map header"""
+    if fix is not None and size <= fix_max:
+        buffer.append(fix | size)
+    elif size <= 0xFF and codes[0]:
+        buffer += struct.pack(">BB", codes[0], size)
+    elif size <= 0xFFFF:
+        buffer += struct.pack(">BH", codes[1], size)
+    elif size <= 0xFFFFFFFF:
+        buffer += struct.pack(">BI", codes[2], size)
+    else:
+        raise ValueError("value too large for MessagePack")
+
+
+def _pack_str(obj: str, buffer: bytearray) -> None:
+    encoded = obj.encode("utf-8")
+    _pack_header(len(encoded), buffer, 0xA0, 0x1F, [0xD9, 0xDA, 0xDB])
+    buffer += encoded
+
+
+def _pack_bin(obj: BinaryType, buffer: bytearray) -> None:
+    _pack_header(len(obj), buffer, None, 0, [0xC4, 0xC5, 0xC6])
+    buffer += obj
+
+
+def _pack_array(obj: Union[list, tuple], buffer: bytearray) -> None:
+    # Arrays and maps have no 8-bit size form.
+    _pack_header(len(obj), buffer, 0x90, 0x0F, [0, 0xDC, 0xDD])
+    for item in obj:
+        _pack(item, buffer)
+
+
+def _pack_map(obj: dict, buffer: bytearray) -> None:
+    _pack_header(len(obj), buffer, 0x80, 0x0F, [0, 0xDE, 0xDF])
+    for key, value in obj.items():
+        _pack(key, buffer)
+        _pack(value, buffer)
+
+
+def _pack_datetime(obj: datetime.datetime, buffer: bytearray) -> None:
+    if obj.tzinfo is None:
+        raise TypeError("naive datetimes can not be packed as MessagePack timestamps")
+
+    delta = obj - _EPOCH
+    seconds = delta.days * 86400 + delta.seconds
+    nanoseconds = delta.microseconds * 1000
+
+    if seconds >> 34 == 0:
+        packed = (nanoseconds << 34) | seconds
+        if packed <= 0xFFFFFFFF:
+            # timestamp 32
+            buffer += struct.pack(">BbI", 0xD6, _TIMESTAMP_EXT, packed)
+        else:
+            # timestamp 64
+            buffer += struct.pack(">BbQ", 0xD7, _TIMESTAMP_EXT, packed)
+    else:
+        # timestamp 96
+        buffer += struct.pack(">BBbIq", 0xC7, 12, _TIMESTAMP_EXT, nanoseconds, seconds)
+
+
+def _pack_uuid(obj: uuid.UUID, buffer: bytearray) -> None:
+    _pack_bin(obj.bytes, buffer)
+
+
+def _pack_ext(obj: ExtType, buffer: bytearray) -> None:
+    size = len(obj.data)
+    fixed = {1: 0xD4, 2: 0xD5, 4: 0xD6, 8: 0xD7, 16: 0xD8}
+    if size in fixed:
+        buffer += struct.pack(">Bb", fixed[size], obj.code)
+    elif size <= 0xFF:
+        buffer += struct.pack(">BBb", 0xC7, size, obj.code)
+    elif size <= 0xFFFF:
+        buffer += struct.pack(">BHb", 0xC8, size, obj.code)
+    else:
+        buffer += struct.pack(">BIb", 0xC9, size, obj.code)
+    buffer += obj.data
+
+
+_PACKERS: Dict[Type[Any], Callable[[Any, bytearray], None]] = {
+    type(None): _pack_none,
+    bool: _pack_bool,
+    int: _pack_int,
+    float: _pack_float,
+    str: _pack_str,
+    bytes: _pack_bin,
+    bytearray: _pack_bin,
+    memoryview: _pack_bin,
+    list: _pack_array,
+    tuple: _pack_array,
+    dict: _pack_map,
+    datetime.datetime: _pack_datetime,
+    uuid.UUID: _pack_uuid,
+    ExtType: _pack_ext,
+}
+
+
+def _pack(obj: Any, buffer: bytearray) -> None:
+    try:
+        packer = _PACKERS[type(obj)]
+    except KeyError:
+        # Subclasses, like str enums or EmailStr, pack as their base type.
+        for base in type(obj).__mro__[1:]:
+            if base in _PACKERS:
+                packer = _PACKERS[base]
+                break
+        else:
+            raise TypeError(f"can not serialize {type(obj).__name__!r} object")
+    packer(obj, buffer)
+
+
+# ------------------------------------------------------------------------------------
+# Unpacking
+# ------------------------------------------------------------------------------------
+
+
+class _Unpacker:
+    """Reads one MessagePack value at a time from a buffer"""
+
+    def __init__(self, data: BinaryType) -> None:
+        self.data = memoryview(data).cast("B")
+        self.position = 0
+
+    def read(self, size: int) -> memoryview:
+        start = self.position
+        end = start + size
+        if end > len(self.data):
+            raise ValueError("truncated MessagePack data")
+        self.position = end
+        return self.data[start:end]
+
+    def read_struct(self, fmt: struct.Struct) -> Any:
+        start = self.position
+        self.position += fmt.size
+        if self.position > len(self.data):
+            raise ValueError("truncated MessagePack data")
+        return fmt.unpack_from(self.data, start)[0]
+
+    def unpack(self) -> Any:
+        code = self.read_struct(_UINT8)
+
+        if code <= 0x7F:
+            return code
+        if code >= 0xE0:
+            return code - 0x100
+        if 0x80 <= code <= 0xBF:
+            return self._unpack_fix(code)
+
+        try:
+            kind, detail = _TYPED_CODES[code]
+        except KeyError:
+            raise ValueError(f"invalid MessagePack type code: {code:#x}")
+
+        if kind == "const":
+            return detail
+        if kind == "num":
+            return self.read_struct(detail)
+        if kind == "ext":
+            return self._ext(detail)
+
+        size = self.read_struct(detail)
+        if kind == "ext_var":
+            return self._ext(size)
+        return _SIZED_READERS[kind](self, size)
+
+    def _unpack_fix(self, code: int) -> Any:
+        """Reads a fixstr, fixarray or fixmap"""
+        if code >= 0xA0:
+            return self._str(code & 0x1F)
+        if code >= 0x90:
+            return self._array(code & 0x0F)
+        return self._map(code & 0x0F)
+
+    def _bin(self, size: int) -> bytes:
+        return bytes(self.read(size))
+
+    def _str(self, size: int) -> str:
+        return str(self.read(size), "utf-8")
+
+    def _array(self, size: int) -> List[Any]:
+        return [self.unpack() for _ in range(size)]
+
+    def _map(self, size: int) -> Dict[Any, Any]:
+        result: Dict[Any, Any] = dict()
+        for _ in range(size):
+            key = self.unpack()
+            result[key] = self.unpack()
+        return result
+
+    def _ext(self, size: int) -> Any:
+        code = self.read_struct(_INT8)
+        data = self.read(size)
+        if code != _TIMESTAMP_EXT:
+            return ExtType(code, bytes(data))
+
+        if size == 4:
+            seconds, nanoseconds = _UINT32.unpack(data)[0], 0
+        elif size == 8:
+            packed = _UINT64.unpack(data)[0]
+            seconds, nanoseconds = packed & 0x3FFFFFFFF, packed >> 34
+        elif size == 12:
+            nanoseconds, seconds = _TIMESTAMP96.unpack(data)
+        else:
+            raise ValueError("invalid MessagePack timestamp")
+
+        return _EPOCH + datetime.timedelta(
+            seconds=seconds, microseconds=nanoseconds // 1000
+        )
+
+
+_SIZED_READERS: Dict[str, Callable[[_Unpacker, int], Any]] = {
+    "str": _Unpacker._str,
+    "bin": _Unpacker._bin,
+    "array": _Unpacker._array,
+    "map": _Unpacker._map,
+}
+
+_UINT8 = struct.Struct(">B")
+_INT8 = struct.Struct(">b")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_TIMESTAMP96 = struct.Struct(">Iq")
+
+# {code: (kind, detail)}. The detail is the value of constants, the struct of numbers,
+# the fixed size of fixext, or the struct of the size of everything else.
+_TYPED_CODES: Dict[int, Any] = {
+    0xC0: ("const", None),
+    0xC2: ("const", False),
+    0xC3: ("const", True),
+    0xCA: ("num", struct.Struct(">f")),
+    0xCB: ("num", struct.Struct(">d")),
+    0xCC: ("num", _UINT8),
+    0xCD: ("num", struct.Struct(">H")),
+    0xCE: ("num", _UINT32),
+    0xCF: ("num", _UINT64),
+    0xD0: ("num", _INT8),
+    0xD1: ("num", struct.Struct(">h")),
+    0xD2: ("num", struct.Struct(">i")),
+    0xD3: ("num", struct.Struct(">q")),
+    0xD9: ("str", _UINT8),
+    0xDA: ("str", struct.Struct(">H")),
+    0xDB: ("str", _UINT32),
+    0xC4: ("bin", _UINT8),
+    0xC5: ("bin", struct.Struct(">H")),
+    0xC6: ("bin", _UINT32),
+    0xDC: ("array", struct.Struct(">H")),
+    0xDD: ("array", _UINT32),
+    0xDE: ("map", struct.Struct(">H")),
+    0xDF: ("map", _UINT32),
+    0xD4: ("ext", 1),
+    0xD5: ("ext", 2),
+    0xD6: ("ext", 4),
+    0xD7: ("ext", 8),
+    0xD8: ("ext", 16),
+    0xC7: ("ext_var", _UINT8),
+    0xC8: ("ext_var", struct.Struct(">H")),
+    0xC9: ("ext_var", _UINT32),
+}
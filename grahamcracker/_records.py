@@ -0,0 +1,349 @@
+import datetime
+import hashlib
+import mmap
+import struct
+import uuid
+from marshmallow import fields
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ._load_dataclass import dataclass_from_dict
+from ._schema_classes import DataSchemaConcrete
+
+
+_MAGIC = b"GCRECRD1"
+# magic, layout fingerprint, record size
+_HEADER = struct.Struct("<8s32sI")
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _encode_datetime(value: datetime.datetime) -> int:
+    if value.tzinfo is None:
+        raise ValueError("naive datetimes can not be written to a record file")
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _decode_datetime(value: int) -> datetime.datetime:
+    return _EPOCH + datetime.timedelta(microseconds=value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class _Kind(NamedTuple):
+    """How values of one field type are stored"""
+
+    code: str
+    """``struct`` format code."""
+    zero: Any
+    """Stored in place of ``None``."""
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+
+
+# Checked in order, so subclasses must come before their bases.
+_KINDS: List[Tuple[Type[fields.Field], _Kind]] = [
+    (fields.Boolean, _Kind("?", False, bool, _identity)),
+    (fields.Integer, _Kind("q", 0, _identity, _identity)),
+    (fields.Float, _Kind("d", 0.0, float, _identity)),
+    (
+        fields.UUID,
+        _Kind("16s", bytes(16), lambda v: v.bytes, lambda v: uuid.UUID(bytes=v)),
+    ),
+    (fields.Date, _Kind("i", 0, lambda v: v.toordinal(), datetime.date.fromordinal)),
+    (fields.DateTime, _Kind("q", 0, _encode_datetime, _decode_datetime)),
+]
+
+
+# Subclasses of fields above that have no layout, like Time, which subclasses DateTime.
+_NO_LAYOUT: Tuple[Type[fields.Field], ...] = (fields.Time,)
+
+
+class _RecordField(NamedTuple):
+    name: str
+    kind: _Kind
+    optional: bool
+
+
+def _kind_for(name: str, field: fields.Field) -> _Kind:
+    for field_type, kind in _KINDS:
+        if isinstance(field, field_type) and not isinstance(field, _NO_LAYOUT):
+            return kind
+    raise TypeError(
+        f"field {name!r} ({type(field).__name__}) has no fixed-width record layout"
+    )
+
+
+class RecordLayout:
+    """
+    Fixed-width binary layout of a flat dataclass, derived from its schema.
+
+    Supports int, float, bool, UUID, aware datetime and date fields. Datetimes are
+    stored as microseconds since the epoch and read back in UTC. Optional fields take
+    an extra byte to flag ``None``.
+
+    :param schema: ``DataSchemaConcrete`` class or instance for the dataclass.
+
+    :raises TypeError: If the schema has no fields, or a field with no fixed-width
+        layout.
+    """
+
+    def __init__(
+        self, schema: Union[DataSchemaConcrete, Type[DataSchemaConcrete]]
+    ) -> None:
+        if isinstance(schema, type):
+            schema = schema()
+
+        model = getattr(schema, "__model__", None)
+        self.model: Any = model if schema.load_dataclass else None
+        """Dataclass records are read as. Records are read as dicts if ``None``."""
+        self._model_name = "" if model is None else model.__qualname__
+        self._use_defaults = schema.use_defaults
+
+        self._fields: List[_RecordField] = list()
+        struct_format = "<"
+        for name, field in schema.load_fields.items():
+            kind = _kind_for(name, field)
+            optional = bool(field.allow_none)
+            self._fields.append(_RecordField(field.attribute or name, kind, optional))
+            struct_format += ("?" if optional else "") + kind.code
+
+        if not self._fields:
+            raise TypeError("record layouts need at least one field")
+
+        self.struct = struct.Struct(struct_format)
+        """``struct.Struct`` of a single record."""
+        self.names: List[str] = [f.name for f in self._fields]
+        """Attribute names of the record fields, in record order."""
+        self.fingerprint: bytes = self._fingerprint()
+        """Digest of the layout, written to the header of record files."""
+
+    @property
+    def record_size(self) -> int:
+        """Size of a single record in bytes"""
+        return self.struct.size
+
+    def _fingerprint(self) -> bytes:
+        description = ";".join(
+            f"{f.name}:{'?' if f.optional else ''}{f.kind.code}" for f in self._fields
+        )
+        return hashlib.sha256(
+            f"{self._model_name}|{self.struct.format}|{description}".encode()
+        ).digest()
+
+    def pack(self, obj: Any) -> bytes:
+        """Packs a dataclass instance or dict into a record"""
+        return self.struct.pack(*self._values(obj))
+
+    def pack_into(self, buffer: Any, offset: int, obj: Any) -> None:
+        """Packs a record into ``buffer`` at ``offset``"""
+        self.struct.pack_into(buffer, offset, *self._values(obj))
+
+    def unpack(self, record: Any) -> Any:
+        """Unpacks a record into the dataclass, or a dict if there is no dataclass"""
+        return self._build(self.struct.unpack(record))
+
+    def _values(self, obj: Any) -> List[Any]:
+        get: Callable[[str], Any]
+        if isinstance(obj, dict):
+            get = obj.__getitem__
+        else:
+            get = obj.__getattribute__
+
+        values: List[Any] = list()
+        for record_field in self._fields:
+            value = get(record_field.name)
+            kind = record_field.kind
+            if record_field.optional:
+                values.append(value is not None)
+                values.append(kind.zero if value is None else kind.encode(value))
+            else:
+                values.append(kind.encode(value))
+        return values
+
+    def _build(self, values: Tuple[Any, ...]) -> Any:
+        loaded: Dict[str, Any] = dict()
+        index = 0
+        for record_field in self._fields:
+            if record_field.optional:
+                present = values[index]
+                index += 1
+                if not present:
+                    loaded[record_field.name] = None
+                    index += 1
+                    continue
+            loaded[record_field.name] = record_field.kind.decode(values[index])
+            index += 1
+
+        if self.model is None:
+            return loaded
+        return dataclass_from_dict(self.model, loaded, use_defaults=self._use_defaults)
+
+
+class RecordWriter:
+    """
+    Writes a record file: a header with the layout fingerprint, followed by packed
+    records. Usable as a context manager, which closes files opened by the writer.
+
+    :param file: Path, or binary file object open for writing.
+    :param layout: Layout of the records.
+    :param buffer_records: Number of records packed into memory before each write.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, IO[bytes]],
+        layout: RecordLayout,
+        buffer_records: int = 4096,
+    ) -> None:
+        self.layout = layout
+        self.count = 0
+        """Number of records written."""
+
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            self._file: IO[bytes] = open(file, "wb")
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+
+        self._buffer = bytearray(layout.record_size * buffer_records)
+        self._buffered = 0
+        self._file.write(_HEADER.pack(_MAGIC, layout.fingerprint, layout.record_size))
+
+    def write(self, obj: Any) -> None:
+        """Writes one dataclass instance or dict"""
+        size = self.layout.record_size
+        try:
+            self.layout.pack_into(self._buffer, self._buffered * size, obj)
+        except struct.error as error:
+            raise ValueError(f"record {self.count} does not fit the layout: {error}")
+
+        self._buffered += 1
+        self.count += 1
+        if self._buffered * size == len(self._buffer):
+            self.flush()
+
+    def write_many(self, objs: Iterable[Any]) -> None:
+        """Writes every dataclass instance or dict in ``objs``"""
+        for obj in objs:
+            self.write(obj)
+
+    def flush(self) -> None:
+        """Writes buffered records to the file"""
+        if self._buffered:
+            view = memoryview(self._buffer)
+            self._file.write(view[: self._buffered * self.layout.record_size])
+            self._buffered = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class RecordReader:
+    """
+    Memory-mapped reader for record files made by ``RecordWriter``. Records are
+    decoded only when accessed, so files larger than memory can be scanned.
+
+    Supports ``len()``, indexing, slicing and iteration. Usable as a context manager.
+
+    :param path: Path of the record file.
+    :param layout: Layout of the records. Must match the layout the file was
+        written with.
+
+    :raises ValueError: If the file is not a record file, or was written with a
+        different layout.
+    """
+
+    def __init__(self, path: Any, layout: RecordLayout) -> None:
+        self.layout = layout
+
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._view = memoryview(self._mmap)
+            self._check_header()
+        except BaseException:
+            self.close()
+            raise
+
+    def _check_header(self) -> None:
+        if len(self._view) < _HEADER.size:
+            raise ValueError("file is too short to be a record file")
+
+        magic, fingerprint, record_size = _HEADER.unpack_from(self._view)
+        if magic != _MAGIC:
+            raise ValueError("file is not a record file")
+        if fingerprint != self.layout.fingerprint:
+            raise ValueError("record file was written with a different layout")
+
+        body_size = len(self._view) - _HEADER.size
+        if record_size != self.layout.record_size or body_size % record_size:
+            raise ValueError("record file is truncated or corrupt")
+        self._count = body_size // record_size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def raw(self, index: int) -> Tuple[Any, ...]:
+        """Undecoded struct values of a record"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("record index out of range")
+        offset = _HEADER.size + index * self.layout.record_size
+        return self.layout.struct.unpack_from(self._view, offset)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        return self.layout._build(self.raw(index))
+
+    def __iter__(self) -> Iterator[Any]:
+        build = self.layout._build
+        body = self._view[_HEADER.size:]
+        records = self.layout.struct.iter_unpack(body)
+        try:
+            for values in records:
+                yield build(values)
+        finally:
+            # Release the buffer so the file can be unmapped.
+            del records
+            body.release()
+
+    def close(self) -> None:
+        view: Optional[memoryview] = getattr(self, "_view", None)
+        if view is not None:
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -1,5 +1,8 @@
 import dataclasses
+import functools
 import json
+import mmap
+from contextvars import ContextVar
 from typing import (
     TypeVar,
     Generic,
@@ -9,16 +12,46 @@ from typing import (
     Any,
     Tuple,
     List,
+    Callable,
     Dict,
+    Iterable,
     Mapping,
     Sequence,
     Set,
+    FrozenSet,
 )
-from marshmallow import Schema, pre_load, post_load, pre_dump
+from marshmallow import Schema, ValidationError, fields, pre_load, post_load, pre_dump
+from marshmallow import missing
 
-from ._load_dataclass import dataclass_from_dict
+from ._load_dataclass import dataclass_from_dict, dataclass_update
 from ._load_dataclass import _MissingType, MISSING
 from ._fast_conversion import FastEncoder
+from ._field_classes import _BulkList, _BulkDict
+from ._dump_cache import DumpCache, cacheable_class, dump_cache_for
+from ._field_conversion import _NATIVE_DUMP, _GCEnum
+from ._msgpack import packb, unpackb
+from ._metrics import MetricsRegistry, byte_size, failed_fields, record_count
+from ._tracing import (
+    TraceEvent,
+    Tracer,
+    active_tracer,
+    current_trace_path,
+    trace_call,
+)
+from ._compact_errors import (
+    CompactValidationError,
+    install_lazy_errors,
+    render_messages,
+)
+from ._trusted import TrustedLoader, check_trusted_options
+from ._bulk import bulk_ingestion
+from ._json_stream import (
+    FileType,
+    decode_buffer,
+    is_json_array,
+    iter_json_array,
+    open_buffer,
+)
 
 
 ObjType = TypeVar("ObjType")
@@ -35,6 +68,398 @@ DumpType = Union[RecordType, List[RecordType], ObjType, List[ObjType]]
 # be ignored.
 
 
+def _changed_fields(
+    new: Any,
+    old: Any,
+    allowed: Optional[Set[str]],
+    schema: Optional[Schema],
+    prefix: str = "",
+) -> Dict[str, Any]:
+    """
+    ``{name: value}`` of fields in dataclass ``new`` that differ from ``old``. Changed
+    nested dataclasses are returned as dicts of their own changed fields. ``old`` may
+    be ``None``, in which case every set field has changed. Fields ``schema`` or its
+    nested schemas only dump are left out.
+    """
+    changed: Dict[str, Any] = _NestedChanges()
+    schema_fields = dict() if schema is None else _fields_by_attribute(schema.fields)
+
+    for field in dataclasses.fields(new):
+        path = prefix + field.name
+        access = _path_access(path, allowed)
+        schema_field = schema_fields.get(field.name)
+        if access is None or (schema_field is not None and schema_field.dump_only):
+            continue
+
+        new_value = getattr(new, field.name)
+        if new_value is MISSING:
+            continue
+
+        old_value = MISSING if old is None else getattr(old, field.name, MISSING)
+
+        if _is_instance(new_value) and (
+            type(old_value) is type(new_value) or access is _SOME
+        ):
+            if type(old_value) is not type(new_value):
+                old_value = None
+            nested = _changed_fields(
+                new_value,
+                old_value,
+                allowed,
+                _nested_schema(schema_field),
+                path + ".",
+            )
+            if nested:
+                changed[field.name] = nested
+        elif access is _SOME:
+            # Only some sub-fields may be updated, but there are none to pick from.
+            continue
+        elif not _values_equal(new_value, old_value):
+            changed[field.name] = new_value
+
+    return changed
+
+
+class _NestedChanges(dict):
+    """Changed fields of a nested dataclass, as opposed to a changed dict value"""
+
+
+def _select_changed(
+    schema: Schema, dumped: Dict[str, Any], changed: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Picks the keys for ``changed`` fields out of ``dumped``"""
+    selected: Dict[str, Any] = dict()
+
+    for name, value in changed.items():
+        field = schema.fields.get(name)
+        if field is None:
+            continue
+        key = name if field.data_key is None else field.data_key
+        if key not in dumped:
+            continue
+
+        item = dumped[key]
+        if isinstance(value, _NestedChanges) and isinstance(item, dict):
+            item = _select_changed(field.schema, item, value)  # type: ignore
+        selected[key] = item
+
+    return selected
+
+
+def _many_hook_names(schema_class: type, tags: Tuple[str, ...]) -> Set[str]:
+    """
+    Names of the hook methods for ``tags`` that are passed whole lists. Read from the
+    methods, as the layout of marshmallow's own hook bookkeeping changed in 3.13.
+    """
+    names: Set[str] = set()
+    seen: Set[str] = set()
+    for klass in schema_class.__mro__:
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+
+            hook_config = getattr(attr, "__marshmallow_hook__", None)
+            if not hook_config:
+                continue
+            for key, config in hook_config.items():
+                if isinstance(key, tuple):
+                    # Before 3.13: {(tag, pass_many): kwargs}
+                    tag, many = key
+                else:
+                    # {tag: [(pass_many, kwargs), ...]}
+                    tag, many = key, any(entry[0] for entry in config)
+                if tag in tags and many:
+                    names.add(name)
+
+    return names
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+
+def _fields_by_attribute(
+    schema_fields: Mapping[str, fields.Field]
+) -> Dict[str, fields.Field]:
+    return {field.attribute or name: field for name, field in schema_fields.items()}
+
+
+def _apply_loaded(
+    schema: Schema, instance: Any, loaded: Dict[str, Any], replace_frozen: bool
+) -> Any:
+    """Assigns a partial load onto ``instance``, updating nested dataclasses in place"""
+    fields_by_attribute = _fields_by_attribute(schema.load_fields)
+    changes: Dict[str, Any] = dict()
+
+    for name, value in loaded.items():
+        field = fields_by_attribute.get(name)
+        nested_schema = _nested_schema(field)
+
+        if nested_schema is not None and isinstance(value, dict):
+            current = getattr(instance, name, None)
+            if _is_instance(current):
+                updated = _apply_loaded(nested_schema, current, value, replace_frozen)
+                if updated is not current:
+                    changes[name] = updated
+                continue
+
+        changes[name] = _build_loaded(nested_schema, value)
+
+    return dataclass_update(instance, changes, replace_frozen)
+
+
+def _build_loaded(schema: Optional[Schema], value: Any) -> Any:
+    """Turns nested dicts from a dict-only load into new dataclasses"""
+    if schema is None or not hasattr(schema, "__model__"):
+        return value
+    if isinstance(value, list):
+        return [_build_loaded(schema, item) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    fields_by_attribute = _fields_by_attribute(schema.load_fields)
+    data = {
+        name: _build_loaded(_nested_schema(fields_by_attribute.get(name)), item)
+        for name, item in value.items()
+    }
+    return dataclass_from_dict(
+        schema.__model__,  # type: ignore
+        data,
+        use_defaults=schema.context.get("use_defaults", False),
+    )
+
+
+def _unbuilt_errors(schema: Schema, instance: Any, loaded: Dict[str, Any]) -> dict:
+    """
+    Errors for the nested values of a partial load that ``_apply_loaded`` would build
+    into new objects rather than apply to existing ones. Partial loads skip required
+    checks, so those values are checked here before anything is assigned.
+    """
+    errors: Dict[str, Any] = dict()
+
+    for name, field in schema.load_fields.items():
+        attribute = field.attribute or name
+        nested_schema = _nested_schema(field)
+        if nested_schema is None or attribute not in loaded:
+            continue
+
+        value = loaded[attribute]
+        current = getattr(instance, attribute, None)
+        if isinstance(value, dict) and _is_instance(current):
+            field_errors = _unbuilt_errors(nested_schema, current, value)
+        else:
+            field_errors = _missing_required(nested_schema, value)
+
+        if field_errors:
+            errors[field.data_key or name] = field_errors
+
+    return errors
+
+
+def _missing_required(schema: Schema, value: Any) -> dict:
+    """Errors for required fields missing from a partially loaded nested value"""
+    if isinstance(value, list):
+        item_errors = (_missing_required(schema, item) for item in value)
+        return {i: errors for i, errors in enumerate(item_errors) if errors}
+    if not isinstance(value, dict):
+        return dict()
+
+    errors: Dict[str, Any] = dict()
+    for name, field in schema.load_fields.items():
+        attribute = field.attribute or name
+        if attribute not in value:
+            if field.required:
+                errors[field.data_key or name] = field.make_error("required").messages
+            continue
+
+        nested_schema = _nested_schema(field)
+        if nested_schema is not None:
+            field_errors = _missing_required(nested_schema, value[attribute])
+            if field_errors:
+                errors[field.data_key or name] = field_errors
+
+    return errors
+
+
+def _nested_schema(field: Any) -> Optional[Schema]:
+    """Schema of a nested field, if it is one"""
+    if isinstance(field, fields.Nested):
+        return field.schema
+    if isinstance(field, fields.List) and isinstance(field.inner, fields.Nested):
+        return field.inner.schema
+    return None
+
+
+def _inner_fields(field: Any) -> List[Any]:
+    """The fields a container field converts its items with"""
+    if isinstance(field, fields.List):
+        return [field.inner]
+    if isinstance(field, fields.Tuple):
+        return list(field.tuple_fields)
+    if isinstance(field, fields.Mapping):
+        return [f for f in (field.key_field, field.value_field) if f is not None]
+    return []
+
+
+def _dumps_enum_names(field: Any, seen: Set[type]) -> bool:
+    """
+    Whether ``field``, or a field inside it, dumps enum members by name. ``seen``
+    holds the schema classes already checked, so recursive schemas terminate.
+    """
+    if isinstance(field, _GCEnum):
+        return not field.by_value
+    if isinstance(field, fields.Nested):
+        schema = field.schema
+        if type(schema) in seen:
+            return False
+        seen.add(type(schema))
+        return any(_dumps_enum_names(f, seen) for f in schema.fields.values())
+    return any(_dumps_enum_names(f, seen) for f in _inner_fields(field))
+
+
+# Whether all, or only some, of a dotted path's sub-fields may be updated.
+_ALL = "all"
+_SOME = "some"
+
+
+def _path_access(path: str, allowed: Optional[Set[str]]) -> Optional[str]:
+    """Whether ``path`` is allowed by ``UPDATE_ALLOWED``-style dotted paths"""
+    if allowed is None or path in allowed:
+        return _ALL
+
+    parts = path.split(".")
+    for i in range(1, len(parts)):
+        if ".".join(parts[:i]) in allowed:
+            return _ALL
+
+    nested_prefix = path + "."
+    if any(entry.startswith(nested_prefix) for entry in allowed):
+        return _SOME
+
+    return None
+
+
+def _is_instance(value: Any) -> bool:
+    """Whether value is a dataclass instance, rather than a dataclass type"""
+    return dataclasses.is_dataclass(value) and not isinstance(value, type)
+
+
+def _values_equal(new: Any, old: Any) -> bool:
+    """``new == old``. Values that can't be compared, like arrays, count as changed"""
+    try:
+        return bool(new == old)
+    except (TypeError, ValueError):
+        return False
+
+
+# Schema whose call is currently being recorded in its metrics registry.
+_MEASURING: "ContextVar[Optional[DataSchemaConcrete]]" = ContextVar(
+    "grahamcracker_measuring", default=None
+)
+
+# Set while a schema with compact errors is loading.
+_COMPACT_LOAD: "ContextVar[bool]" = ContextVar(
+    "grahamcracker_compact_load", default=False
+)
+
+# {(schema class, variant, id(obj)): (obj, dumped)} for the current dump call.
+_DUMP_MEMO: "ContextVar[Optional[Dict[Any, Any]]]" = ContextVar(
+    "grahamcracker_dump_memo", default=None
+)
+
+
+class _Unresolved:
+    pass
+
+
+_UNRESOLVED = _Unresolved()
+
+
+class _UncachedDump:
+    """Looks like a cache entry for dumps of objects that can't be cached"""
+
+    __slots__ = ("dumped", "json")
+
+    def __init__(self, dumped: Any) -> None:
+        self.dumped = dumped
+        self.json: Optional[str] = None
+
+
+def _copy_dumped(dumped: Any) -> Any:
+    """Copies the dicts and lists of a dump, so a cached dump isn't handed out"""
+    if isinstance(dumped, dict):
+        return type(dumped)((key, _copy_dumped(value)) for key, value in dumped.items())
+    if isinstance(dumped, list):
+        return [_copy_dumped(value) for value in dumped]
+    return dumped
+
+
+# Fields that dump nested dataclass instances themselves, or never hold any.
+_DATACLASS_SAFE_FIELDS = (
+    fields.Nested,
+    fields.String,
+    fields.Number,
+    fields.Boolean,
+    fields.UUID,
+    fields.DateTime,
+    fields.Date,
+    fields.Time,
+    fields.TimeDelta,
+    _BulkList,
+    _BulkDict,
+)
+
+
+def _keeps_dataclasses(field: fields.Field) -> bool:
+    """Whether ``field`` can be handed nested dataclass instances as-is"""
+    if isinstance(field, _DATACLASS_SAFE_FIELDS):
+        return True
+    if isinstance(field, fields.List):
+        return _keeps_dataclasses(field.inner)
+    if isinstance(field, fields.Mapping):
+        return (
+            field.value_field is not None
+            and _keeps_dataclasses(field.value_field)
+            and (field.key_field is None or _keeps_dataclasses(field.key_field))
+        )
+    return False
+
+
+# (attribute name, data key, field, types dumped as-is, type dumped in bulk)
+_DumpStep = Tuple[str, str, fields.Field, Tuple[type, ...], Optional[type]]
+
+
+def _dump_step(name: str, field: fields.Field, copies: bool) -> _DumpStep:
+    """
+    How the schema's ``_serialize`` dumps ``field``. Values of passthrough fields are
+    copied straight from the pre-dumped dict if they are already JSON-native.
+    Everything else, including missing values, goes through ``Field.serialize``.
+    """
+    key = name if field.data_key is None else field.data_key
+    if not copies or not getattr(field, "_json_passthrough", False):
+        return name, key, field, (), None
+
+    json_type = getattr(field, "_JSON_TYPE", None)
+    if json_type is not None:
+        return name, key, field, (json_type, type(None)), None
+
+    bulk = list if isinstance(field, fields.List) else dict
+    return name, key, field, (type(None),), bulk
+
+
+def _plain_value(value: Any) -> Any:
+    """Converts dataclasses in ``value`` to dicts, like ``dataclasses.asdict()``"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if type(value) in (list, tuple):
+        return type(value)(_plain_value(item) for item in value)
+    if type(value) is dict:
+        return {key: _plain_value(item) for key, item in value.items()}
+    return value
+
+
 class DataSchemaConcrete(Schema):
     __model__: Type[ObjType]  # type: ignore
 
@@ -53,6 +478,50 @@ class DataSchemaConcrete(Schema):
     methods. It has no actual effect on the schema by itself.
     """
 
+    DUMP_CACHE: bool = False
+    """
+    Cache dump results for frozen dataclass instances, so dumping the same instance
+    again is a lookup and a copy. Only dataclasses whose fields are all typed as
+    immutable, like scalars, frozen dataclasses, tuples and frozensets, are cached.
+    Can also be turned on per-instance with the ``dump_cache`` init param.
+
+    Nested dataclasses are then passed to nested schemas as instances, not as
+    ``dataclasses.asdict()`` dicts, so their ``pre_dump`` hooks receive the instance.
+    """
+
+    DUMP_CACHE_SIZE: int = 1024
+    """Maximum number of instances cached per schema class and ``only``/``exclude``."""
+
+    MEMOIZE_DUMPS: bool = False
+    """
+    Serialize each object only once per ``dump`` / ``dumps`` call. Later references to
+    the same instance reuse the earlier output. Can also be turned on per-instance with
+    the ``memoize_dumps`` init param. As with ``DUMP_CACHE``, nested schemas receive
+    nested dataclasses as instances.
+    """
+
+    COMPACT_ERRORS: bool = False
+    """
+    Defer formatting field error messages until ``messages`` is accessed on the
+    raised ``CompactValidationError``. Saves work when rejecting large amounts of
+    invalid data. Can also be turned on per-instance with the ``compact_errors`` init
+    param.
+    """
+
+    METRICS: Optional[MetricsRegistry] = None
+    """
+    ``MetricsRegistry`` to record ``load``, ``loads``, ``dump`` and ``dumps`` calls
+    in. Can also be set per-instance with the ``metrics`` init param, which also
+    applies to nested schemas.
+    """
+
+    TRACER: Optional[Tracer] = None
+    """
+    ``Tracer`` to call around ``load``, ``loads``, ``dump`` and ``dumps`` calls. Can
+    also be set per-instance with the ``tracer`` init param, which also applies to
+    nested schemas.
+    """
+
     _FAST_ENCODER: Type[FastEncoder] = FastEncoder
 
     def __init__(
@@ -69,6 +538,11 @@ class DataSchemaConcrete(Schema):
         load_dataclass: bool = True,
         use_defaults: bool = False,
         fast_dumps: bool = False,
+        dump_cache: bool = False,
+        memoize_dumps: bool = False,
+        compact_errors: bool = False,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
     ):
         if context is None:
             context = dict()
@@ -82,8 +556,31 @@ class DataSchemaConcrete(Schema):
         if use_defaults is True:
             context["use_defaults"] = use_defaults
 
+        # Nested schemas cache their own fragments when caching is turned on here.
+        if dump_cache is True:
+            context["dump_cache"] = dump_cache
+
+        if compact_errors is True:
+            context["compact_errors"] = compact_errors
+
+        if metrics is not None:
+            context["metrics"] = metrics
+
+        if tracer is not None:
+            context["tracer"] = tracer
+
         self.fast_dumps: bool = fast_dumps
         self.normalize_many: bool = normalize_many
+        self.memoize_dumps: bool = memoize_dumps or self.MEMOIZE_DUMPS
+        self._partial_loader: Optional[DataSchemaConcrete] = None
+        self._dump_cache: Union[DumpCache, None, _Unresolved] = _UNRESOLVED
+        self._plain_dump_names: Optional[Set[str]] = None
+        self._dump_plan: Optional[List[_DumpStep]] = None
+        self._lazy_errors_installed = False
+        self._trusted_loader: Optional[TrustedLoader] = None
+        self._many_load_hooks: Optional[bool] = None
+        self._many_dump_hooks: Optional[bool] = None
+        self._fast_dumps_supported: Optional[bool] = None
 
         super().__init__(
             only=only,  # type: ignore
@@ -96,6 +593,18 @@ class DataSchemaConcrete(Schema):
             unknown=unknown,  # type: ignore
         )
 
+        # Identifies schemas of the same class that dump objects the same way. The
+        # fields dumped already account for only, exclude and load_only.
+        self._dump_variant: FrozenSet[str] = frozenset(self.dump_fields)
+
+        self._metrics: Optional[MetricsRegistry] = self.context.get(
+            "metrics", self.METRICS
+        )
+        self._tracer: Optional[Tracer] = active_tracer(
+            self.context.get("tracer", self.TRACER)
+        )
+        self._instrumented = self._metrics is not None or self._tracer is not None
+
     @property
     def load_dataclass(self) -> bool:
         return self.context.get("load_dataclass", True)
@@ -104,14 +613,46 @@ class DataSchemaConcrete(Schema):
     def use_defaults(self) -> bool:
         return self.context.get("use_defaults", False)
 
+    @property
+    def compact_errors(self) -> bool:
+        return self.COMPACT_ERRORS or self.context.get("compact_errors", False)
+
     def load(  # type: ignore
         self,
         data: LoadType,
         many: Optional[bool] = None,
         partial: Optional[Union[bool, Sequence[str], Set[str]]] = None,
         unknown: Optional[str] = None,
+        trusted: bool = False,
     ) -> Union[ObjType, List[ObjType], dict, List[dict]]:
-        """Typed alias of ``marshmallow.Schema.load``"""
+        """
+        Typed alias of ``marshmallow.Schema.load``.
+
+        Data this library dumped itself, like records read back from our own storage,
+        can be loaded with ``trusted=True``. Fields then only convert values JSON
+        can't hold, like datetimes, UUIDs and nested dataclasses, before the
+        dataclass is built. Field defaults are applied to missing keys as usual, but
+        nothing is validated: required fields, ``allow_none``, validators and schema
+        hooks other than our own are all skipped, and unknown keys are ignored.
+        Invalid data gives undefined results rather than a ``ValidationError``.
+        ``partial`` and ``unknown`` other than ``EXCLUDE`` can't be combined with
+        ``trusted`` and raise ``ValueError``.
+        """
+        if self._instrumented and _MEASURING.get() is not self:
+            return self._measured(
+                "load",
+                data,
+                many,
+                lambda: self.load(data, many, partial, unknown, trusted),
+            )
+
+        if trusted:
+            check_trusted_options(partial, unknown)
+            return self._load_trusted(data, self.many if many is None else many)
+
+        if self.compact_errors:
+            return self._load_compact(data, many, partial, unknown)
+
         return super().load(
             data,  # type: ignore
             many=many,  # type: ignore
@@ -119,15 +660,70 @@ class DataSchemaConcrete(Schema):
             unknown=unknown,  # type: ignore
         )
 
+    def _load_compact(
+        self,
+        data: LoadType,
+        many: Optional[bool],
+        partial: Optional[Union[bool, Sequence[str], Set[str]]],
+        unknown: Optional[str],
+    ) -> Any:
+        """Loads with lazily formatted field errors"""
+        if not self._lazy_errors_installed:
+            for field in self.fields.values():
+                install_lazy_errors(field)
+            self._lazy_errors_installed = True
+
+        # Nested schemas leave their errors unformatted for the outermost load.
+        if _COMPACT_LOAD.get():
+            return super().load(
+                data, many=many, partial=partial, unknown=unknown  # type: ignore
+            )
+
+        token = _COMPACT_LOAD.set(True)
+        try:
+            return super().load(
+                data, many=many, partial=partial, unknown=unknown  # type: ignore
+            )
+        except ValidationError as error:
+            raise CompactValidationError(
+                error.messages,
+                error.field_name,
+                data=error.data,
+                valid_data=error.valid_data,
+                **error.kwargs,
+            ) from None
+        finally:
+            _COMPACT_LOAD.reset(token)
+
     def loads(  # type: ignore
         self,
-        data: Union[str, bytes],
+        data: Union[str, bytes, bytearray, memoryview, mmap.mmap],
         many: Optional[bool] = None,
         partial: Optional[Union[bool, Sequence[str], Set[str]]] = None,
         unknown: Optional[str] = None,
+        trusted: bool = False,
         **kwargs: Any
     ) -> Union[ObjType, List[ObjType], dict, List[dict]]:
-        """Typed alias of ``marshmallow.Schema.loads``"""
+        """
+        Typed alias of ``marshmallow.Schema.loads``. Also accepts UTF-8 in a
+        ``memoryview`` or ``mmap``, which is decoded without copying the bytes first.
+        See ``load`` for ``trusted``.
+        """
+        if self._instrumented and _MEASURING.get() is not self:
+            return self._measured(
+                "loads",
+                data,
+                many,
+                lambda: self.loads(data, many, partial, unknown, trusted, **kwargs),
+            )
+
+        if isinstance(data, (memoryview, mmap.mmap)):
+            data = decode_buffer(data)
+        if trusted:
+            check_trusted_options(partial, unknown)
+            return self.load(  # type: ignore
+                self.opts.render_module.loads(data, **kwargs), many=many, trusted=True
+            )
         return super().loads(
             data,  # type: ignore
             many=many,  # type: ignore
@@ -136,20 +732,462 @@ class DataSchemaConcrete(Schema):
             **kwargs
         )
 
+    def _load_trusted(self, data: Any, many: bool) -> Any:
+        """Loads ``data`` without validating it"""
+        loader = self._trusted_loader
+        if loader is None:
+            loader = self._trusted_loader = TrustedLoader(self)
+        if many and self.normalize_many and not isinstance(data, list):
+            data = [data]
+        return loader.load(data, many)
+
+    def load_file(
+        self,
+        file: FileType,
+        many: Optional[bool] = None,
+        partial: Optional[Union[bool, Sequence[str], Set[str]]] = None,
+        unknown: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Union[ObjType, List[ObjType], dict, List[dict]]:
+        """
+        Loads a JSON file from a path or file object. Regular files are
+        memory-mapped rather than read into memory.
+
+        When loading many objects from a JSON array, the file is decoded
+        incrementally and loaded ``batch_size`` items at a time, so the raw data of
+        the whole file is never held at once. Validation errors from every batch are
+        collected and raised together, indexed by position in the file.
+        """
+        _check_batch_size(batch_size)
+        many = self.many if many is None else bool(many)
+
+        with open_buffer(file) as data:
+            if (
+                many
+                and self.opts.render_module is json
+                and not self._has_many_load_hooks()
+                and is_json_array(data)
+            ):
+                return self._load_batches(
+                    iter_json_array(data), partial, unknown, batch_size
+                )
+
+            return self.loads(  # type: ignore
+                data, many=many, partial=partial, unknown=unknown
+            )
+
+    def load_bulk(
+        self,
+        data: Iterable[Any],
+        partial: Optional[Union[bool, Sequence[str], Set[str]]] = None,
+        unknown: Optional[str] = None,
+        batch_size: int = 10000,
+        freeze_gc: bool = False,
+    ) -> List[Any]:
+        """
+        Loads a large number of records, like ``load(data, many=True)``, with the
+        cyclic garbage collector paused (see ``bulk_ingestion``). ``data`` can be any
+        iterable, like a generator reading records from a file.
+
+        Records are loaded ``batch_size`` at a time. Validation errors from every batch
+        are collected and raised together, indexed by position in ``data``, and the
+        error's ``valid_data`` holds every record, as loaded or as far as it validated.
+
+        :param freeze_gc: Freeze the loaded objects into the permanent generation
+            when done, so later collections skip them.
+        """
+        _check_batch_size(batch_size)
+
+        with bulk_ingestion(freeze=freeze_gc):
+            if self._has_many_load_hooks():
+                # Hooks that see the whole list can't be run batch by batch.
+                return self.load(  # type: ignore
+                    list(data), many=True, partial=partial, unknown=unknown
+                )
+            return self._load_batches(data, partial, unknown, batch_size)
+
+    def _load_batches(
+        self,
+        items: Iterable[Any],
+        partial: Optional[Union[bool, Sequence[str], Set[str]]],
+        unknown: Optional[str],
+        batch_size: int,
+    ) -> List[Any]:
+        """
+        Loads ``items`` in batches, re-indexing errors to their overall position. The
+        ``valid_data`` of a raised error holds the loaded items of successful batches
+        and the ``valid_data`` of failed ones, by overall position.
+        """
+        errors: Dict[Any, Any] = dict()
+        loaded: List[Any] = list()
+
+        if isinstance(items, list):
+            for offset in range(0, len(items), batch_size):
+                batch = items[offset:offset + batch_size]
+                loaded.extend(
+                    self._load_batch(batch, offset, errors, partial, unknown)
+                )
+        else:
+            batch = list()
+            offset = 0
+            for item in items:
+                batch.append(item)
+                if len(batch) == batch_size:
+                    loaded.extend(
+                        self._load_batch(batch, offset, errors, partial, unknown)
+                    )
+                    offset += batch_size
+                    batch = list()
+            if batch:
+                loaded.extend(self._load_batch(batch, offset, errors, partial, unknown))
+
+        if errors:
+            if self.compact_errors:
+                raise CompactValidationError(errors, valid_data=loaded)
+            raise ValidationError(errors, valid_data=loaded)
+        return loaded
+
+    def _load_batch(
+        self,
+        batch: List[Any],
+        offset: int,
+        errors: Dict[Any, Any],
+        partial: Optional[Union[bool, Sequence[str], Set[str]]],
+        unknown: Optional[str],
+    ) -> List[Any]:
+        """
+        Loads ``batch``. Errors are added to ``errors`` instead of being raised, and
+        the ``valid_data`` of the error is returned for a batch with errors.
+        """
+        try:
+            return self.load(  # type: ignore
+                batch, many=True, partial=partial, unknown=unknown
+            )
+        except ValidationError as error:
+            if isinstance(error, CompactValidationError):
+                messages = error.raw_messages
+            else:
+                messages = error.messages
+            if not isinstance(messages, dict):
+                raise
+            for key, message in messages.items():
+                errors[key + offset if isinstance(key, int) else key] = message
+
+            valid_data = error.valid_data
+            if isinstance(valid_data, list) and len(valid_data) == len(batch):
+                return valid_data
+            return [None] * len(batch)
+
+    def _has_many_load_hooks(self) -> bool:
+        """Whether any load hooks, other than our own, need to see a whole list"""
+        if self._many_load_hooks is None:
+            names = _many_hook_names(
+                type(self), ("pre_load", "post_load", "validates_schema")
+            )
+            self._many_load_hooks = bool(names - {"normalize_many_load"})
+        return self._many_load_hooks
+
     def dump(
         self, obj: DumpType, many: Optional[bool] = None
     ) -> Union[dict, List[dict]]:
         """Typed alias of ``marshmallow.Schema.dump``"""
+        if self._instrumented and _MEASURING.get() is not self:
+            return self._measured("dump", obj, many, lambda: self.dump(obj, many))
+
+        memo = _DUMP_MEMO.get()
+        if memo is None and self.memoize_dumps:
+            # Nested schemas see the memo through the context variable.
+            token = _DUMP_MEMO.set(dict())
+            try:
+                return self.dump(obj, many=many)
+            finally:
+                _DUMP_MEMO.reset(token)
+
+        # Cached dumps hold strings where native dumps hold values, so the two can't
+        # share a cache.
+        cache = None if _NATIVE_DUMP.get() else self._get_dump_cache()
+        if cache is not None or memo is not None:
+            many = self.many if many is None else bool(many)
+            if not many:
+                return self._dump_one(obj, cache, memo)
+            if isinstance(obj, list) and not self._has_many_dump_hooks():
+                return [self._dump_one(item, cache, memo) for item in obj]
+
         return super().dump(obj, many=many)  # type: ignore
 
     def dumps(
         self, obj: DumpType, many: Optional[bool] = None, *args: Any, **kwargs: Any
     ) -> str:
         """Typed alias of ``marshmallow.Schema.dumps``"""
-        if self.fast_dumps:
-            return json.dumps(obj, cls=self._FAST_ENCODER)
+        if self._instrumented and _MEASURING.get() is not self:
+            return self._measured(
+                "dumps", obj, many, lambda: self.dumps(obj, many, *args, **kwargs)
+            )
+
+        if self.fast_dumps and self._supports_fast_dumps():
+            return json.dumps(obj, cls=self._FAST_ENCODER, memoize=self.memoize_dumps)
+
+        cache = self._get_dump_cache()
+        if cache is not None and not args and not kwargs and not (many or self.many):
+            entry = self._dump_cached(cache, obj)
+            if entry.json is None:
+                entry.json = self.opts.render_module.dumps(entry.dumped)
+            return entry.json
+
+        return super().dumps(obj, many=many, *args, **kwargs)  # type: ignore
+
+    def _measured(
+        self, operation: str, data: Any, many: Optional[bool], call: Callable[[], Any]
+    ) -> Any:
+        """Runs ``call`` while tracing it and recording it in the metrics registry"""
+        many = self.many if many is None else bool(many)
+        # loads takes a string, so its records are counted once parsed.
+        records = 0 if operation == "loads" else record_count(data, many)
+
+        if self._tracer is not None:
+            event = TraceEvent(
+                type(self).__name__, operation, records, current_trace_path()
+            )
+            call = functools.partial(trace_call, self._tracer, event, call)
+
+        # Calls this schema makes to itself, like dumps to dump, aren't recorded
+        # again.
+        token = _MEASURING.set(self)
+        try:
+            if self._metrics is None:
+                return call()
+            return self._record_metrics(operation, data, many, records, call)
+        finally:
+            _MEASURING.reset(token)
+
+    def _record_metrics(
+        self,
+        operation: str,
+        data: Any,
+        many: bool,
+        records: int,
+        call: Callable[[], Any],
+    ) -> Any:
+        bytes_in = byte_size(data) if operation == "loads" else 0
+        measurement = self._metrics.measure(  # type: ignore
+            type(self).__name__, operation, records, bytes_in
+        )
+
+        with measurement:
+            try:
+                result = call()
+            except ValidationError as error:
+                measurement.failed_fields = failed_fields(
+                    getattr(error, "raw_messages", error.messages)
+                )
+                raise
+
+            if operation == "loads":
+                measurement.records = record_count(result, many)
+            elif operation == "dumps":
+                measurement.bytes_out = byte_size(result)
+            return result
+
+    def dumpb(self, obj: DumpType, many: Optional[bool] = None) -> bytes:
+        """
+        Dumps ``obj`` to MessagePack bytes. Aware datetimes are packed as MessagePack
+        timestamps and UUIDs as 16-byte binary, other values as they would be in JSON.
+
+        The ``msgpack`` package is used if installed, otherwise a pure-Python encoder.
+        """
+        token = _NATIVE_DUMP.set(True)
+        try:
+            dumped = self.dump(obj, many=many)
+        finally:
+            _NATIVE_DUMP.reset(token)
+        return packb(dumped)
+
+    def loadb(
+        self,
+        data: Union[bytes, bytearray, memoryview],
+        many: Optional[bool] = None,
+        partial: Optional[Union[bool, Sequence[str], Set[str]]] = None,
+        unknown: Optional[str] = None,
+    ) -> Union[ObjType, List[ObjType], dict, List[dict]]:
+        """Loads MessagePack bytes, like those made by ``dumpb``"""
+        return self.load(  # type: ignore
+            unpackb(data), many=many, partial=partial, unknown=unknown
+        )
+
+    def _get_dump_cache(self) -> Optional[DumpCache]:
+        """The dump cache for this schema's class and variant, if caching is on"""
+        cache = self._dump_cache
+        if cache is _UNRESOLVED:
+            cache = None
+            if self.DUMP_CACHE or self.context.get("dump_cache", False):
+                cache = dump_cache_for(
+                    type(self), self._dump_variant, self.DUMP_CACHE_SIZE
+                )
+            self._dump_cache = cache
+
+        return cache  # type: ignore
+
+    def _dump_one(
+        self, obj: Any, cache: Optional[DumpCache], memo: Optional[Dict[Any, Any]]
+    ) -> Any:
+        """Dumps a single object through the dump memo and cache, when active"""
+        if memo is not None:
+            key = (type(self), self._dump_variant, id(obj))
+            # The memo holds on to obj, so its id can't be reused during this dump.
+            seen = memo.get(key)
+            if seen is not None and seen[0] is obj:
+                return seen[1]
+
+        if cache is not None:
+            entry = self._dump_cached(cache, obj)
+            # Cached dumps are shared, so each caller gets its own copy.
+            if isinstance(entry, _UncachedDump):
+                dumped = entry.dumped
+            else:
+                dumped = _copy_dumped(entry.dumped)
         else:
-            return super().dumps(obj, many=many, *args, **kwargs)  # type: ignore
+            dumped = super().dump(obj, many=False)
+
+        if memo is not None:
+            memo[key] = (obj, dumped)
+        return dumped
+
+    def _dump_cached(self, cache: DumpCache, obj: Any) -> Any:
+        """
+        Dumps one object through the cache. Only frozen dataclasses with immutable
+        field types are cached.
+        """
+        entry = cache.get(obj)
+        if entry is not None:
+            return entry
+
+        dumped = super().dump(obj, many=False)
+        if isinstance(obj, type) or not cacheable_class(type(obj)):
+            return _UncachedDump(dumped)
+        return cache.put(obj, dumped)
+
+    def _serialize(self, obj: Any, *, many: bool = False) -> Any:
+        """
+        As ``marshmallow.Schema._serialize``, but copies the values of JSON-native
+        passthrough fields straight through when dumping a dict.
+        """
+        if many and obj is not None:
+            return [self._serialize(item) for item in obj]
+        if type(obj) is not dict:
+            return super()._serialize(obj, many=many)
+
+        plan = self._dump_plan
+        if plan is None:
+            plan = self._dump_plan = self._build_dump_plan()
+
+        dumped = self.dict_class()
+        get_attribute = self.get_attribute
+        for name, key, field, native, bulk in plan:
+            if native:
+                value = obj.get(name, missing)
+                value_type = type(value)
+                if value_type in native:
+                    dumped[key] = value
+                    continue
+                if value_type is bulk:
+                    dumped[key] = field._serialize(value, name, obj)
+                    continue
+
+            value = field.serialize(name, obj, accessor=get_attribute)
+            if value is not missing:
+                dumped[key] = value
+
+        return dumped
+
+    def _build_dump_plan(self) -> List[_DumpStep]:
+        # Values can only be copied if they are looked up the way marshmallow would.
+        copies = type(self).get_attribute is Schema.get_attribute
+        return [
+            _dump_step(
+                name, field, copies and field.attribute is None and "." not in name
+            )
+            for name, field in self.dump_fields.items()
+        ]
+
+    def _reuses_nested_dumps(self) -> bool:
+        """Whether nested dataclasses are dumped through the dump cache or memo"""
+        if _DUMP_MEMO.get() is not None:
+            return True
+        return not _NATIVE_DUMP.get() and self._get_dump_cache() is not None
+
+    def _supports_fast_dumps(self) -> bool:
+        """
+        Whether the fast encoder dumps this schema correctly. It encodes enum members
+        by type, always by value, so schemas with fields that dump them by name use
+        the regular path.
+        """
+        if self._fast_dumps_supported is None:
+            seen = {type(self)}
+            self._fast_dumps_supported = not any(
+                _dumps_enum_names(f, seen) for f in self.fields.values()
+            )
+        return self._fast_dumps_supported
+
+    def _has_many_dump_hooks(self) -> bool:
+        """Whether any dump hooks need to see a whole list at once"""
+        if self._many_dump_hooks is None:
+            names = _many_hook_names(type(self), ("pre_dump", "post_dump"))
+            self._many_dump_hooks = bool(names)
+        return self._many_dump_hooks
+
+    def dump_delta(self, new: ObjType, old: ObjType) -> Dict[str, Any]:
+        """
+        Dumps only the fields of ``new`` that differ from ``old``. Nested dataclasses
+        are compared field-by-field, so only their changed fields are included.
+
+        When ``UPDATE_ALLOWED`` is set, only those fields are included. Nested fields
+        can be allowed with dotted paths like ``"address.city"``. Dump-only fields are
+        always left out, so the result can be loaded with ``partial=True``.
+        """
+        allowed = set(self.UPDATE_ALLOWED) if self.UPDATE_ALLOWED else None
+
+        changed = _changed_fields(new, old, allowed, self)
+        # Fields left out of ``changed`` can still be dumped from their defaults.
+        return _select_changed(self, self.dump(changed), changed)  # type: ignore
+
+    def load_into(
+        self, instance: ObjType, data: RecordType, replace_frozen: bool = False
+    ) -> ObjType:
+        """
+        Validates a partial payload and assigns only the fields it contains onto
+        ``instance``, recursing into nested dataclasses. Unlike
+        ``load(partial=True)``, no new objects are built for untouched fields.
+        Nested dataclasses that don't exist on ``instance`` yet are built from the
+        payload, so it must contain all their required fields.
+
+        Frozen dataclasses are updated through ``object.__setattr__``, or copied with
+        ``dataclasses.replace`` if ``replace_frozen`` is ``True``.
+
+        :return: ``instance``, or its updated copy when ``replace_frozen`` is set.
+        """
+        if self._partial_loader is None:
+            # Loading to dicts leaves nested dataclasses to be updated, not rebuilt.
+            self._partial_loader = type(self)(
+                only=self.only,  # type: ignore
+                exclude=self.exclude,  # type: ignore
+                context=dict(self.context),
+                load_only=self.load_only,  # type: ignore
+                dump_only=self.dump_only,  # type: ignore
+                unknown=self.unknown,
+                load_dataclass=False,
+                use_defaults=self.use_defaults,
+            )
+
+        loader = self._partial_loader
+        loaded = loader.load(data, partial=True)
+
+        # Nested objects that are built rather than updated need all their required
+        # fields.
+        errors = _unbuilt_errors(loader, instance, loaded)  # type: ignore
+        if errors:
+            raise ValidationError(errors, data=data)
+
+        return _apply_loaded(loader, instance, loaded, replace_frozen)  # type: ignore
 
     def validate(  # type: ignore
         self,
@@ -158,7 +1196,10 @@ class DataSchemaConcrete(Schema):
         partial: Optional[Union[bool, Sequence[str], Set[str]]] = None,
     ) -> Union[dict, List[dict]]:
         """Typed alias of ``marshmallow.Schema.validate``"""
-        return super().validate(data, many=many, partial=partial)  # type: ignore
+        errors = super().validate(data, many=many, partial=partial)  # type: ignore
+        if self._lazy_errors_installed:
+            errors = render_messages(errors)
+        return errors
 
     @pre_load(pass_many=True)
     def normalize_many_load(
@@ -191,12 +1232,30 @@ class DataSchemaConcrete(Schema):
     ) -> Union[Dict[str, Any], ObjType, _MissingType]:
         """
         ``marshmallow.pre_dump`` method. Passes through dicts, but converts dataclasses
-        using ``dataclasses.asdict()``
+        using ``dataclasses.asdict()``.
+
+        With the dump cache or dump memo active, nested dataclasses are left to their
+        nested schemas instead, so their dumps can be reused. Only values of fields
+        that can't dump dataclasses themselves then go through ``asdict()``.
         """
         dumped: Union[Mapping[str, Any], ObjType, _MissingType]
 
-        if dataclasses.is_dataclass(data):
+        if dataclasses.is_dataclass(data) and not self._reuses_nested_dumps():
             dumped = dataclasses.asdict(data)
+        elif dataclasses.is_dataclass(data):
+            plain_names = self._plain_dump_names
+            if plain_names is None:
+                plain_names = self._plain_dump_names = {
+                    field.attribute or name
+                    for name, field in self.fields.items()
+                    if not _keeps_dataclasses(field)
+                }
+            dumped = {
+                f.name: _plain_value(getattr(data, f.name))
+                if f.name in plain_names
+                else getattr(data, f.name)
+                for f in dataclasses.fields(data)
+            }
         else:
             dumped = data
 
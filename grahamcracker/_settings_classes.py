@@ -46,6 +46,8 @@ class Garams:
     dump_only: Default[bool] = DEFAULT
     error_messages: Default[Dict[str, str]] = DEFAULT
     metadata: Default[Dict[str, Any]] = DEFAULT
+    by_value: Default[bool] = DEFAULT
+    as_array: Default[bool] = DEFAULT
 
 
 def gfield(
@@ -80,11 +82,13 @@ def gfield(
 class _SchemaGenSettings:
     data_class: Any
     base: Type[Schema]
-    type_handlers: "Dict[Type[Any], Type[HandlerType]]"
+    type_handlers: "MutableMapping[Type[Any], Type[HandlerType]]"
     field_docstrings: Dict[str, str]
     type_var_index: "Dict[TypeVar, Type]" = (  # type: ignore
         dc_field(default_factory=dict)
     )
+    # Set when generating a schema for a parameterized generic, like Page[Item].
+    alias: Any = None
 
 
 @dataclass
@@ -0,0 +1,97 @@
+from contextvars import ContextVar
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Union
+
+
+TracePath = Tuple[Union[str, int], ...]
+
+
+class TraceEvent(NamedTuple):
+    """Passed to ``Tracer`` callbacks"""
+
+    schema: str
+    """Name of the schema class."""
+    operation: str
+    """
+    ``"load"``, ``"loads"``, ``"dump"`` or ``"dumps"`` for schema calls.
+    ``"nested_load"`` or ``"nested_dump"`` for nested fields.
+    """
+    records: int
+    """Number of records passed in. Always 0 for ``loads``, as it takes a string."""
+    path: TracePath
+    """
+    Names of the nested fields leading to this call from the outermost schema. Empty
+    for the outermost schema.
+    """
+
+
+class Tracer:
+    """
+    Receives callbacks around schema loads and dumps, to report them as spans in a
+    tracing system. This base class does nothing; subclass it and pass an instance
+    to a schema's ``tracer`` init param, or set it as the ``TRACER`` class attribute.
+    Nested schemas use the tracer of the schema they are nested in.
+    """
+
+    trace_nested: bool = False
+    """
+    Also trace each ``NestedOptional`` field, with the nested schema as the event
+    schema. Each nested schema call is traced either way.
+    """
+
+    def start(self, event: TraceEvent) -> Any:
+        """Called before an operation. The return value is passed to ``end``"""
+        return None
+
+    def end(self, event: TraceEvent, span: Any, error: Optional[BaseException]) -> None:
+        """
+        Called after an operation, with the value ``start`` returned and the error it
+        raised, if any.
+        """
+
+
+_TRACE_PATH: ContextVar[TracePath] = ContextVar("grahamcracker_trace_path", default=())
+
+
+def current_trace_path() -> TracePath:
+    """Path of nested fields being loaded or dumped in this context"""
+    return _TRACE_PATH.get()
+
+
+def trace_call(tracer: Tracer, event: TraceEvent, call: Callable[[], Any]) -> Any:
+    """Runs ``call`` between the tracer's callbacks"""
+    span = tracer.start(event)
+    try:
+        result = call()
+    except BaseException as error:
+        tracer.end(event, span, error)
+        raise
+    tracer.end(event, span, None)
+    return result
+
+
+def trace_nested(
+    tracer: Tracer,
+    schema: str,
+    name: str,
+    operation: str,
+    value: Any,
+    call: Callable[[], Any],
+) -> Any:
+    """Runs a nested field's ``call`` with ``name`` added to the trace path"""
+    path = _TRACE_PATH.get() + (name,)
+    token = _TRACE_PATH.set(path)
+    try:
+        if not tracer.trace_nested:
+            return call()
+        records = len(value) if isinstance(value, list) else 1
+        event = TraceEvent(schema, operation, records, path)
+        return trace_call(tracer, event, call)
+    finally:
+        _TRACE_PATH.reset(token)
+
+
+def active_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """``None`` for the do-nothing base tracer, so it costs nothing"""
+    if tracer is None or type(tracer) is Tracer:
+        return None
+    return tracer
@@ -0,0 +1,187 @@
+import datetime
+import uuid
+from marshmallow import EXCLUDE, fields, missing
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from ._field_conversion import (
+    EmailStr,
+    URLStr,
+    _GCArray,
+    _GCEmail,
+    _GCURL,
+    _ISO_FORMATS,
+)
+from ._load_dataclass import dataclass_from_dict
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._schema_classes import DataSchemaConcrete
+
+
+Converter = Optional[Callable[[Any], Any]]
+
+# Fields whose loaded values are the JSON values themselves.
+_JSON_NATIVE = (fields.String, fields.Integer, fields.Float, fields.Boolean)
+# Subclasses of the above that still convert.
+_CONVERTING = (fields.UUID, fields.Email, fields.URL, fields.Decimal)
+
+
+def _to_uuid(value: Any) -> Any:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+
+
+def _temporal_converter(field: fields.Field) -> Converter:
+    if isinstance(field, fields.Date):
+        from_iso: Callable[[str], Any] = datetime.date.fromisoformat
+    elif isinstance(field, fields.Time):
+        from_iso = datetime.time.fromisoformat
+    else:
+        from_iso = datetime.datetime.fromisoformat
+
+    if getattr(field, "format", None) not in _ISO_FORMATS:
+        return _field_converter(field)
+
+    def convert(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        try:
+            return from_iso(value)
+        except ValueError:
+            # Forms fromisoformat doesn't know, like a "Z" suffix before Python 3.11.
+            return field._deserialize(value, None, None)
+
+    return convert
+
+
+def _field_converter(field: fields.Field) -> Converter:
+    """Converts through the field itself, without its validators"""
+
+    def convert(value: Any) -> Any:
+        return field._deserialize(value, None, None)
+
+    return convert
+
+
+def _list_converter(inner: Converter) -> Converter:
+    if inner is None:
+        return None
+
+    def convert(value: Any) -> Any:
+        return [None if item is None else inner(item) for item in value]
+
+    return convert
+
+
+def _dict_converter(key: Converter, value: Converter) -> Converter:
+    if key is None and value is None:
+        return None
+
+    def convert(mapping: Any) -> Any:
+        return {
+            k if key is None else key(k): v if v is None or value is None else value(v)
+            for k, v in mapping.items()
+        }
+
+    return convert
+
+
+def _nested_converter(field: fields.Nested) -> Converter:
+    # The nested schema is resolved on first use, so schemas nesting themselves don't
+    # build plans forever.
+    def convert(value: Any) -> Any:
+        schema = field.schema
+        load_trusted = getattr(schema, "_load_trusted", None)
+        if load_trusted is None:
+            return field._deserialize(value, None, None)
+        return load_trusted(value, field.many)
+
+    return convert
+
+
+def converter_for(field: fields.Field) -> Converter:
+    """
+    Function converting a trusted JSON value for ``field``, or ``None`` if the value
+    is used as-is
+    """
+    if isinstance(field, _GCEmail):
+        return EmailStr
+    if isinstance(field, _GCURL):
+        return URLStr
+    if isinstance(field, fields.UUID):
+        return _to_uuid
+    if isinstance(field, _JSON_NATIVE) and not isinstance(field, _CONVERTING):
+        return None
+    if isinstance(field, (fields.DateTime, fields.Time)):
+        return _temporal_converter(field)
+    if isinstance(field, fields.Nested):
+        return _nested_converter(field)
+    if isinstance(field, fields.List) and not isinstance(field, _GCArray):
+        return _list_converter(converter_for(field.inner))
+    if isinstance(field, fields.Dict):
+        return _dict_converter(
+            None if field.key_field is None else converter_for(field.key_field),
+            None if field.value_field is None else converter_for(field.value_field),
+        )
+    return _field_converter(field)
+
+
+def _load_default(field: fields.Field) -> Any:
+    # load_default replaced missing in marshmallow 3.13.
+    try:
+        return field.load_default
+    except AttributeError:  # pragma: no cover
+        return field.missing
+
+
+def check_trusted_options(partial: Any, unknown: Optional[str]) -> None:
+    """Rejects load options trusted loads can't honor, rather than ignoring them"""
+    if partial:
+        raise ValueError("partial can not be used with trusted loads")
+    if unknown is not None and unknown != EXCLUDE:
+        raise ValueError("trusted loads always exclude unknown fields")
+
+
+class TrustedLoader:
+    """
+    Loads data a schema dumped itself, skipping validation. Built once per schema
+    instance from its load fields.
+    """
+
+    def __init__(self, schema: "DataSchemaConcrete") -> None:
+        self.schema = schema
+        # (data key, attribute name, converter, default)
+        self.plan: List[Tuple[str, str, Converter, Any]] = [
+            (
+                field.data_key or name,
+                field.attribute or name,
+                converter_for(field),
+                _load_default(field),
+            )
+            for name, field in schema.load_fields.items()
+        ]
+
+    def load_one(self, data: Dict[str, Any]) -> Any:
+        loaded: Dict[str, Any] = dict()
+        for key, attribute, convert, default in self.plan:
+            try:
+                value = data[key]
+            except KeyError:
+                # Defaults are applied like in a validated load.
+                if default is not missing:
+                    loaded[attribute] = default() if callable(default) else default
+                continue
+            if convert is not None and value is not None:
+                value = convert(value)
+            loaded[attribute] = value
+
+        schema = self.schema
+        if not schema.load_dataclass:
+            return loaded
+        return dataclass_from_dict(
+            schema.__model__, loaded, use_defaults=schema.use_defaults
+        )
+
+    def load(self, data: Any, many: bool) -> Any:
+        if not many:
+            return self.load_one(data)
+        load_one = self.load_one
+        return [None if item is None else load_one(item) for item in data]
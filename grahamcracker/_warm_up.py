@@ -0,0 +1,234 @@
+import importlib
+import pkgutil
+import sys
+import threading
+from dataclasses import dataclass, is_dataclass
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Type,
+    Union,
+)
+from typing_inspect_isle import get_parameters
+
+from ._convert import dataclass_schema
+from ._handler_registry import HandlerRegistry
+from ._schema_classes import DataSchemaConcrete
+from ._settings_classes import HandlerType
+
+
+@dataclass
+class WarmUpProgress:
+    """Passed to the ``progress`` callback of ``warm_up`` after each schema"""
+
+    done: int
+    """Number of schemas warmed so far, including this one."""
+    total: int
+    """Total number of schemas to warm."""
+    data_class: Any
+    """Dataclass of the schema that was just warmed."""
+    schema: Optional[Type[DataSchemaConcrete]]
+    """The warmed schema, or ``None`` if warming it failed."""
+
+
+class WarmUp:
+    """Handle returned by ``warm_up``. Holds warmed schemas and instances"""
+
+    def __init__(
+        self, type_handlers: "MutableMapping[Type[Any], Type[HandlerType]]"
+    ) -> None:
+        self.type_handlers: "MutableMapping[Type[Any], Type[HandlerType]]" = (
+            type_handlers
+        )
+        """Type handlers the schemas were generated with."""
+        self.schemas: Dict[Any, Type[DataSchemaConcrete]] = dict()
+        """``{dataclass: schema}`` of warmed schemas."""
+        self.instances: Dict[Any, List[DataSchemaConcrete]] = dict()
+        """``{dataclass: [schema instance, ...]}``, one instance per variant."""
+        self.errors: Dict[Any, BaseException] = dict()
+        """
+        ``{dataclass: error}`` for schemas that failed to warm, and ``{module name:
+        error}`` for modules that failed to import.
+        """
+        self.thread: Optional[threading.Thread] = None
+        """Thread running the warm-up when ``background=True``."""
+        self._finished = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether the warm-up has finished"""
+        return self._finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the warm-up finishes. Returns ``False`` on timeout"""
+        return self._finished.wait(timeout)
+
+
+def warm_up(
+    *modules: Union[ModuleType, str],
+    type_handlers: "Optional[MutableMapping[Type[Any], Type[HandlerType]]]" = None,
+    variants: Iterable[Mapping[str, Any]] = (),
+    background: bool = False,
+    progress: Optional[Callable[[WarmUpProgress], None]] = None,
+) -> WarmUp:
+    """
+    Generates and primes schemas for the dataclasses and ``schema_for`` schemas found
+    in ``modules``, so the first real load or dump doesn't pay for it.
+
+    Each schema is instantiated once with default arguments and once per entry in
+    ``variants``, and every instance runs a dummy load and dump.
+
+    :param modules: Modules, packages, or their import names. Packages are searched
+        recursively.
+    :param type_handlers: ``{type, Schema}`` mapping to generate schemas with. A new
+        ``HandlerRegistry`` is used if not passed.
+    :param variants: Keyword arguments for additional schema instances, like
+        ``{"many": True}`` or ``{"load_dataclass": False}``.
+    :param background: Run on a daemon thread and return immediately.
+    :param progress: Called with a ``WarmUpProgress`` after each schema.
+
+    :return: ``WarmUp`` handle. Call ``WarmUp.wait()`` to block on a background run.
+    """
+    if type_handlers is None:
+        type_handlers = HandlerRegistry()
+
+    handle = WarmUp(type_handlers)
+    variants = [dict()] + [dict(v) for v in variants]
+
+    def run() -> None:
+        try:
+            _run_warm_up(handle, modules, variants, progress)  # type: ignore
+        finally:
+            handle._finished.set()
+
+    if background:
+        handle.thread = threading.Thread(
+            target=run, name="grahamcracker-warm-up", daemon=True
+        )
+        handle.thread.start()
+    else:
+        run()
+
+    return handle
+
+
+def _run_warm_up(
+    handle: WarmUp,
+    modules: Iterable[Union[ModuleType, str]],
+    variants: List[Dict[str, Any]],
+    progress: Optional[Callable[[WarmUpProgress], None]],
+) -> None:
+    """Generates and primes every schema found in modules"""
+    targets = _find_targets(modules, handle.errors)
+
+    for done, (data_class, schema) in enumerate(targets.items(), start=1):
+        try:
+            schema = _warm_schema(handle, data_class, schema, variants)
+        except Exception as error:
+            handle.errors[data_class] = error
+            schema = None
+
+        if progress is not None:
+            progress(WarmUpProgress(done, len(targets), data_class, schema))
+
+
+def _warm_schema(
+    handle: WarmUp,
+    data_class: Any,
+    schema: Optional[Type[DataSchemaConcrete]],
+    variants: List[Dict[str, Any]],
+) -> Type[DataSchemaConcrete]:
+    """Generates a schema if needed, then instantiates and primes its variants"""
+    if schema is None:
+        existing = handle.type_handlers.get(data_class)
+        if isinstance(existing, type) and issubclass(existing, DataSchemaConcrete):
+            schema = existing
+        else:
+            schema = dataclass_schema(data_class, type_handlers=handle.type_handlers)
+
+    instances = [schema(**kwargs) for kwargs in variants]
+    for instance in instances:
+        data: Any = [] if instance.many else {}
+        instance.validate(data)
+        instance.dump(data)
+
+    handle.schemas[data_class] = schema
+    handle.instances[data_class] = instances
+    return schema
+
+
+def _find_targets(
+    modules: Iterable[Union[ModuleType, str]], errors: Dict[Any, BaseException]
+) -> Dict[Any, Optional[Type[DataSchemaConcrete]]]:
+    """
+    Finds ``{dataclass: schema}`` for the modules. Schema is ``None`` for dataclasses
+    that don't have a ``schema_for`` schema in the searched modules. Modules that
+    fail to import are added to ``errors`` by name.
+    """
+    targets: Dict[Any, Optional[Type[DataSchemaConcrete]]] = dict()
+
+    for module in _iter_modules(modules, errors):
+        for obj in list(vars(module).values()):
+            if not isinstance(obj, type):
+                continue
+
+            # Schemas made by dataclass_schema report grahamcracker as their module,
+            # so any generated schema found is used.
+            if issubclass(obj, DataSchemaConcrete):
+                data_class = getattr(obj, "__model__", None)
+                if data_class is not None:
+                    targets[data_class] = obj
+            elif (
+                is_dataclass(obj)
+                and obj.__module__ == module.__name__
+                and not get_parameters(obj)
+            ):
+                targets.setdefault(obj, None)
+
+    return targets
+
+
+def _iter_modules(
+    modules: Iterable[Union[ModuleType, str]], errors: Dict[Any, BaseException]
+) -> Iterable[ModuleType]:
+    """Imports modules, and all submodules of packages"""
+
+    def record_error(name: str) -> None:
+        errors[name] = sys.exc_info()[1]  # type: ignore
+
+    for module_or_name in modules:
+        if isinstance(module_or_name, str):
+            imported = _import(module_or_name, errors)
+            if imported is None:
+                continue
+            module: ModuleType = imported
+        else:
+            module = module_or_name
+        yield module
+
+        package_path = getattr(module, "__path__", None)
+        if package_path is None:
+            continue
+
+        for info in pkgutil.walk_packages(
+            package_path, prefix=module.__name__ + ".", onerror=record_error
+        ):
+            submodule = _import(info.name, errors)
+            if submodule is not None:
+                yield submodule
+
+
+def _import(name: str, errors: Dict[Any, BaseException]) -> Optional[ModuleType]:
+    """Imports a module, adding the error to ``errors`` if that fails"""
+    try:
+        return importlib.import_module(name)
+    except Exception as error:
+        errors[name] = error
+        return None
@@ -0,0 +1,109 @@
+"""
+Measures loading many records with ``load(many=True)`` against ``load_bulk``, which
+pauses the cyclic garbage collector and loads in batches.
+
+Each variant is timed in a fresh interpreter, so garbage collector state doesn't carry
+over between them. Usage:
+
+    python zdevelop/benchmarks/bench_bulk_load.py [record count] [runs]
+"""
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+
+
+REPO_PATH = pathlib.Path(__file__).parent.parent.parent
+
+TIMER = """
+import datetime
+import gc
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+from grahamcracker import schema_for, DataSchemaConcrete
+
+
+@dataclass
+class Tag:
+    name: str
+    weight: float
+
+
+@dataclass
+class Record:
+    id: uuid.UUID
+    name: str
+    count: int
+    created: datetime.datetime
+    tags: List[Tag]
+    note: Optional[str] = None
+
+
+@schema_for(Record)
+class RecordSchema(DataSchemaConcrete):
+    pass
+
+
+data = [
+    {{
+        "id": str(uuid.UUID(int=index)),
+        "name": f"record {{index}}",
+        "count": index,
+        "created": "2020-01-02T03:04:05.000006+00:00",
+        "tags": [{{"name": "a", "weight": 1.5}}, {{"name": "b", "weight": 2.5}}],
+    }}
+    for index in range({count})
+]
+schema = RecordSchema()
+collections = sum(stat["collections"] for stat in gc.get_stats())
+
+start = time.perf_counter()
+if {bulk}:
+    loaded = schema.load_bulk(data)
+else:
+    loaded = schema.load(data, many=True)
+elapsed = time.perf_counter() - start
+
+collections = sum(stat["collections"] for stat in gc.get_stats()) - collections
+print(elapsed, collections)
+"""
+
+
+def time_load(count: int, bulk: bool) -> tuple:
+    """Loads ``count`` records in a fresh interpreter"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(REPO_PATH)
+
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(count=count, bulk=bulk)],
+        env=env,
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.split()
+
+    return float(output[0]), int(output[1])
+
+
+def run(count: int, runs: int) -> None:
+    medians = dict()
+
+    for label, bulk in (("load", False), ("load_bulk", True)):
+        results = [time_load(count, bulk) for _ in range(runs)]
+        medians[label] = statistics.median(r[0] for r in results)
+        print(
+            f"{label:>9}: {medians[label] * 1000:8.1f} ms median over {runs} runs "
+            f"({count} records, {results[-1][1]} gc collections)"
+        )
+
+    print(f"  speedup: {medians['load'] / medians['load_bulk']:.2f}x")
+
+
+if __name__ == "__main__":
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    run_count = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    run(record_count, run_count)
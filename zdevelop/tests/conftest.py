@@ -5,3 +5,17 @@ import sys
 min_version = pytest.mark.skipif(
     sys.version_info[:2] < (3, 7), reason="Test requires Python 3.7 or Higher"
 )
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+requires_numpy = pytest.mark.skipif(numpy is None, reason="Test requires numpy")
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+requires_msgpack = pytest.mark.skipif(msgpack is None, reason="Test requires msgpack")
@@ -0,0 +1,162 @@
+import gc
+import threading
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from marshmallow import ValidationError, post_load
+
+from grahamcracker import (
+    CompactValidationError,
+    DataSchemaConcrete,
+    bulk_ingestion,
+    schema_for,
+)
+
+
+@dataclass
+class Reading:
+    sensor: str
+    value: float
+
+
+@schema_for(Reading)
+class ReadingSchema(DataSchemaConcrete):
+    pass
+
+
+def readings(count: int) -> List[dict]:
+    return [{"sensor": f"s{index}", "value": float(index)} for index in range(count)]
+
+
+class TestBulkIngestion:
+    def test_pauses_gc(self):
+        assert gc.isenabled()
+
+        with bulk_ingestion():
+            assert not gc.isenabled()
+
+        assert gc.isenabled()
+
+    def test_nested(self):
+        with bulk_ingestion():
+            with bulk_ingestion():
+                pass
+            assert not gc.isenabled()
+
+        assert gc.isenabled()
+
+    def test_leaves_disabled_gc_disabled(self):
+        gc.disable()
+        try:
+            with bulk_ingestion():
+                pass
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_restores_on_error(self):
+        with pytest.raises(ValueError):
+            with bulk_ingestion():
+                raise ValueError
+
+        assert gc.isenabled()
+
+    def test_concurrent(self):
+        entered = threading.Event()
+        release = threading.Event()
+
+        def ingest():
+            with bulk_ingestion():
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=ingest)
+        thread.start()
+        entered.wait(5)
+
+        with bulk_ingestion():
+            pass
+        # The other thread's ingestion is still running.
+        assert not gc.isenabled()
+
+        release.set()
+        thread.join(5)
+        assert gc.isenabled()
+
+    def test_freeze(self):
+        try:
+            with bulk_ingestion(freeze=True):
+                pass
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+
+class TestLoadBulk:
+    def test_list(self):
+        data = readings(25)
+
+        loaded = ReadingSchema().load_bulk(data, batch_size=10)
+
+        assert loaded == [Reading(f"s{index}", float(index)) for index in range(25)]
+        assert gc.isenabled()
+
+    def test_iterable(self):
+        loaded = ReadingSchema().load_bulk(iter(readings(25)), batch_size=10)
+
+        assert loaded == ReadingSchema().load(readings(25), many=True)
+
+    def test_errors_indexed(self):
+        data = readings(25)
+        data[3]["value"] = "bad"
+        data[21]["sensor"] = None
+
+        with pytest.raises(ValidationError) as error:
+            ReadingSchema().load_bulk(data, batch_size=10)
+
+        assert set(error.value.messages) == {3, 21}
+        assert gc.isenabled()
+
+    @pytest.mark.parametrize("iterable", [list, iter])
+    def test_valid_data(self, iterable):
+        data = readings(25)
+        data[12]["value"] = "bad"
+
+        with pytest.raises(ValidationError) as error:
+            ReadingSchema().load_bulk(iterable(data), batch_size=10)
+
+        valid_data = error.value.valid_data
+        assert len(valid_data) == 25
+        assert valid_data[3] == Reading("s3", 3.0)
+        assert valid_data[11] == {"sensor": "s11", "value": 11.0}
+        assert valid_data[12] == {"sensor": "s12"}
+        assert valid_data[24] == Reading("s24", 24.0)
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_bad_batch_size(self, batch_size):
+        with pytest.raises(ValueError):
+            ReadingSchema().load_bulk(iter(readings(5)), batch_size=batch_size)
+
+    def test_compact_errors(self):
+        data = readings(25)
+        data[12]["value"] = "bad"
+
+        with pytest.raises(CompactValidationError) as error:
+            ReadingSchema(compact_errors=True).load_bulk(data, batch_size=10)
+
+        assert list(error.value.messages) == [12]
+
+    def test_many_hooks(self):
+        class CountingSchema(ReadingSchema):
+            @post_load(pass_many=True)
+            def count(self, data, many, **kwargs):
+                self.counts.append(len(data))
+                return data
+
+        schema = CountingSchema()
+        schema.counts = []
+
+        schema.load_bulk(readings(25), batch_size=10)
+
+        assert schema.counts == [25]
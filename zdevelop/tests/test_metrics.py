@@ -0,0 +1,224 @@
+import math
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from marshmallow import ValidationError
+
+from grahamcracker import DataSchemaConcrete, MetricsRegistry, schema_for
+
+
+@dataclass
+class Tag:
+    label: str
+
+
+@dataclass
+class Post:
+    title: str
+    views: int
+    tags: List[Tag]
+    parent: Optional[Tag] = None
+
+
+@schema_for(Post)
+class PostSchema(DataSchemaConcrete):
+    pass
+
+
+def counter(registry, name, **labels):
+    samples = registry.as_dict()[f"grahamcracker_{name}_total"]["samples"]
+    return sum(s["value"] for s in samples if labels.items() <= s["labels"].items())
+
+
+def latency(registry, **labels):
+    samples = registry.as_dict()["grahamcracker_latency_seconds"]["samples"]
+    return next(s for s in samples if s["labels"] == labels)
+
+
+POST = {"title": "a", "views": 1, "tags": [{"label": "x"}, {"label": "y"}]}
+
+
+class TestMetrics:
+    def test_load(self):
+        registry = MetricsRegistry()
+        schema = PostSchema(many=True, metrics=registry)
+
+        schema.load([POST, POST, POST])
+
+        assert counter(registry, "calls", schema="PostSchema", operation="load") == 1
+        assert counter(registry, "records", schema="PostSchema", operation="load") == 3
+        assert latency(registry, schema="PostSchema", operation="load")["count"] == 1
+
+    def test_nested_schemas_recorded(self):
+        registry = MetricsRegistry()
+
+        PostSchema(metrics=registry).load(POST)
+
+        assert counter(registry, "calls", schema="TagSchema") == 1
+        assert counter(registry, "records", schema="TagSchema") == 2
+
+    def test_loads_bytes_and_records(self):
+        registry = MetricsRegistry()
+        schema = PostSchema(many=True, metrics=registry)
+        data = schema.dumps([POST, POST])
+        registry.reset()
+
+        schema.loads(data)
+
+        assert counter(registry, "bytes_in") == len(data)
+        assert counter(registry, "records", schema="PostSchema") == 2
+        # loads calls load internally, which is not recorded a second time.
+        assert counter(registry, "calls", schema="PostSchema") == 1
+
+    def test_loads_bytes_non_ascii(self):
+        registry = MetricsRegistry()
+        schema = PostSchema(metrics=registry)
+        data = '{"title": "é ü", "views": 1, "tags": []}'
+
+        schema.loads(data)
+
+        assert counter(registry, "bytes_in") == len(data.encode("utf-8"))
+
+    @pytest.mark.parametrize("fast_dumps", [False, True])
+    def test_dumps(self, fast_dumps):
+        registry = MetricsRegistry()
+        schema = PostSchema(metrics=registry, fast_dumps=fast_dumps)
+        post = PostSchema().load(POST)
+
+        dumped = schema.dumps(post)
+
+        assert counter(registry, "bytes_out") == len(dumped)
+        assert counter(registry, "calls", schema="PostSchema", operation="dumps") == 1
+        assert counter(registry, "calls", schema="PostSchema", operation="dump") == 0
+
+    def test_validation_failures(self):
+        registry = MetricsRegistry()
+        schema = PostSchema(many=True, metrics=registry)
+        bad = dict(POST, views="x", title=None)
+
+        with pytest.raises(ValidationError):
+            schema.load([bad, bad, POST])
+
+        assert counter(registry, "validation_failures", field="views") == 2
+        assert counter(registry, "validation_failures", field="title") == 2
+        assert counter(registry, "calls", schema="PostSchema") == 1
+
+    def test_compact_failures(self):
+        registry = MetricsRegistry()
+        schema = PostSchema(metrics=registry, compact_errors=True)
+
+        with pytest.raises(ValidationError):
+            schema.load(dict(POST, views="x"))
+
+        assert counter(registry, "validation_failures", field="views") == 1
+
+    def test_class_attribute(self):
+        registry = MetricsRegistry()
+
+        @dataclass
+        class Counted:
+            value: int
+
+        @schema_for(Counted)
+        class CountedSchema(DataSchemaConcrete):
+            METRICS = registry
+
+        CountedSchema().load({"value": 1})
+
+        assert counter(registry, "calls") == 1
+
+    def test_off_by_default(self):
+        schema = PostSchema()
+
+        assert schema._metrics is None
+        assert schema.load(POST).title == "a"
+
+    def test_threads(self):
+        registry = MetricsRegistry()
+        schema = PostSchema(metrics=registry)
+
+        def run():
+            for _ in range(50):
+                schema.load(POST)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter(registry, "calls", schema="PostSchema") == 200
+        assert len(registry._shards) == 4
+
+    def test_histogram_buckets(self):
+        registry = MetricsRegistry(buckets=[1.0, 0.5])
+        schema = PostSchema(metrics=registry)
+
+        schema.load(POST)
+
+        sample = latency(registry, schema="PostSchema", operation="load")
+        assert list(sample["buckets"]) == [0.5, 1.0, math.inf]
+        assert sample["buckets"][math.inf] == 1
+        assert sample["sum"] > 0
+
+    def test_render_text(self):
+        registry = MetricsRegistry(buckets=[0.5, 1])
+        PostSchema(metrics=registry).load(POST)
+
+        text = registry.render_text()
+
+        assert "# TYPE grahamcracker_calls_total counter\n" in text
+        assert (
+            'grahamcracker_calls_total{schema="PostSchema",operation="load"} 1\n'
+        ) in text
+        assert "# TYPE grahamcracker_latency_seconds histogram\n" in text
+        assert (
+            'grahamcracker_latency_seconds_bucket{schema="PostSchema",'
+            'operation="load",le="0.5"} 1\n'
+        ) in text
+        assert (
+            'grahamcracker_latency_seconds_bucket{schema="PostSchema",'
+            'operation="load",le="+Inf"} 1\n'
+        ) in text
+        assert (
+            'grahamcracker_latency_seconds_count{schema="PostSchema",'
+            'operation="load"} 1\n'
+        ) in text
+        # Metrics without samples are left out.
+        assert "bytes_out" not in text
+
+    def test_render_empty(self):
+        assert MetricsRegistry().render_text() == ""
+
+    def test_label_escaping(self):
+        registry = MetricsRegistry()
+        with registry.measure('a"b\\c\n', "load"):
+            pass
+
+        assert 'schema="a\\"b\\\\c\\n"' in registry.render_text()
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        PostSchema(metrics=registry).load(POST)
+
+        registry.reset()
+
+        assert counter(registry, "calls") == 0
+
+    def test_reset_other_threads(self):
+        registry = MetricsRegistry()
+        schema = PostSchema(metrics=registry)
+        thread = threading.Thread(target=schema.load, args=(POST,))
+        thread.start()
+        thread.join(5)
+
+        registry.reset()
+        assert counter(registry, "calls") == 0
+
+        schema.load(POST)
+        thread = threading.Thread(target=schema.load, args=(POST,))
+        thread.start()
+        thread.join(5)
+        assert counter(registry, "calls", schema="PostSchema") == 2
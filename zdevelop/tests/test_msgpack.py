@@ -0,0 +1,232 @@
+import datetime
+import uuid
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from grahamcracker import DataSchemaConcrete, EmailStr, schema_for
+from grahamcracker._msgpack import ExtType, packb, unpackb
+from zdevelop.tests.conftest import msgpack, requires_msgpack
+
+
+UTC = datetime.timezone.utc
+
+VALUES = [
+    None,
+    True,
+    False,
+    0,
+    127,
+    128,
+    255,
+    256,
+    2 ** 16,
+    2 ** 32,
+    2 ** 64 - 1,
+    -1,
+    -32,
+    -33,
+    -129,
+    -(2 ** 15) - 1,
+    -(2 ** 31) - 1,
+    -(2 ** 63),
+    1.5,
+    -0.25,
+    "",
+    "a",
+    "é" * 40,
+    "x" * 300,
+    "x" * 70000,
+    b"",
+    b"\x00\x01",
+    b"x" * 300,
+    [],
+    list(range(20)),
+    [1, "a", [None, {}]],
+    {},
+    {"a": 1, "b": [1, 2]},
+    {str(i): i for i in range(20)},
+    {1: "int key"},
+]
+
+TIMESTAMPS = [
+    datetime.datetime(1970, 1, 1, tzinfo=UTC),
+    datetime.datetime(2020, 5, 17, 12, 30, tzinfo=UTC),
+    datetime.datetime(2020, 5, 17, 12, 30, 1, 123456, tzinfo=UTC),
+    datetime.datetime(2200, 1, 1, tzinfo=UTC),
+    datetime.datetime(1900, 1, 1, 0, 0, 0, 500, tzinfo=UTC),
+]
+
+
+class TestCodec:
+    @pytest.mark.parametrize("value", VALUES)
+    def test_round_trip(self, value):
+        assert unpackb(packb(value, use_backend=False), use_backend=False) == value
+
+    @pytest.mark.parametrize("value", TIMESTAMPS)
+    def test_timestamp(self, value):
+        packed = packb(value, use_backend=False)
+        loaded = unpackb(packed, use_backend=False)
+
+        assert loaded == value
+        assert loaded.tzinfo is not None
+
+    def test_timestamp_sizes(self):
+        # timestamp 32, timestamp 64 and timestamp 96
+        assert len(packb(TIMESTAMPS[1], use_backend=False)) == 6
+        assert len(packb(TIMESTAMPS[2], use_backend=False)) == 10
+        assert len(packb(TIMESTAMPS[4], use_backend=False)) == 15
+
+    def test_timestamp_other_timezone(self):
+        value = datetime.datetime(
+            2020, 1, 1, 8, tzinfo=datetime.timezone(datetime.timedelta(hours=8))
+        )
+
+        loaded = unpackb(packb(value, use_backend=False), use_backend=False)
+
+        assert loaded == value
+        assert loaded.tzinfo == UTC
+
+    def test_naive_datetime_rejected(self):
+        with pytest.raises(TypeError):
+            packb(datetime.datetime(2020, 1, 1), use_backend=False)
+
+    def test_uuid_as_bin(self):
+        value = uuid.uuid4()
+
+        assert unpackb(packb(value, use_backend=False), use_backend=False) == (
+            value.bytes
+        )
+
+    def test_str_subclass(self):
+        packed = packb(EmailStr("a@b.com"), use_backend=False)
+
+        assert packed == packb("a@b.com", use_backend=False)
+
+    def test_ext_type(self):
+        value = ExtType(5, b"abc")
+
+        assert unpackb(packb(value, use_backend=False), use_backend=False) == value
+
+    def test_unsupported(self):
+        with pytest.raises(TypeError):
+            packb(object(), use_backend=False)
+
+    def test_int_overflow(self):
+        with pytest.raises(OverflowError):
+            packb(2 ** 64, use_backend=False)
+
+    def test_truncated(self):
+        with pytest.raises(ValueError):
+            unpackb(packb([1, 2, 3], use_backend=False)[:-1], use_backend=False)
+
+    def test_extra_data(self):
+        with pytest.raises(ValueError):
+            unpackb(packb(1, use_backend=False) + b"\x01", use_backend=False)
+
+    @requires_msgpack
+    @pytest.mark.parametrize("value", VALUES + TIMESTAMPS)
+    def test_matches_msgpack(self, value):
+        packed = packb(value, use_backend=False)
+
+        assert packed == msgpack.packb(value, use_bin_type=True, datetime=True)
+        assert unpackb(packed) == unpackb(packed, use_backend=False)
+
+
+@dataclass
+class Contact:
+    email: EmailStr
+    added: datetime.datetime
+
+
+@dataclass
+class Account:
+    id: uuid.UUID
+    created: datetime.datetime
+    birthday: datetime.date
+    contacts: List[Contact] = field(default_factory=list)
+    ids: List[uuid.UUID] = field(default_factory=list)
+    last_seen: Optional[datetime.datetime] = None
+
+
+@schema_for(Account)
+class AccountSchema(DataSchemaConcrete):
+    pass
+
+
+def make_account() -> Account:
+    return Account(
+        id=uuid.uuid4(),
+        created=datetime.datetime(2020, 1, 1, 12, tzinfo=UTC),
+        birthday=datetime.date(1990, 6, 1),
+        contacts=[
+            Contact(EmailStr("a@b.com"), datetime.datetime(2020, 2, 2, tzinfo=UTC))
+        ],
+        ids=[uuid.uuid4(), uuid.uuid4()],
+        last_seen=datetime.datetime(2020, 3, 3, 10, 30),
+    )
+
+
+class TestSchemaBinary:
+    def test_round_trip(self):
+        account = make_account()
+        schema = AccountSchema()
+
+        loaded = schema.loadb(schema.dumpb(account))
+
+        assert loaded == account
+        assert isinstance(loaded.contacts[0].email, EmailStr)
+
+    def test_native_values(self):
+        account = make_account()
+
+        raw = unpackb(AccountSchema().dumpb(account))
+
+        assert raw["id"] == account.id.bytes
+        assert raw["created"] == account.created
+        assert raw["contacts"][0]["added"] == account.contacts[0].added
+        assert raw["ids"] == [value.bytes for value in account.ids]
+        # Dates and naive datetimes have no binary form.
+        assert raw["birthday"] == "1990-06-01"
+        assert raw["last_seen"] == "2020-03-03T10:30:00"
+
+    def test_smaller_than_json(self):
+        account = make_account()
+        schema = AccountSchema()
+
+        assert len(schema.dumpb(account)) < len(schema.dumps(account).encode())
+
+    def test_many(self):
+        accounts = [make_account(), make_account()]
+        schema = AccountSchema()
+
+        assert schema.loadb(schema.dumpb(accounts, many=True), many=True) == accounts
+
+    def test_dump_unchanged(self):
+        account = make_account()
+        schema = AccountSchema()
+
+        schema.dumpb(account)
+        dumped = schema.dump(account)
+
+        assert dumped["id"] == str(account.id)
+        assert dumped["created"] == account.created.isoformat()
+        assert dumped["ids"] == [str(value) for value in account.ids]
+
+    def test_dump_cache_not_shared(self):
+        account = make_account()
+        schema = AccountSchema(dump_cache=True)
+
+        schema.dump(account)
+        raw = unpackb(schema.dumpb(account))
+        dumped = schema.dump(account)
+
+        assert raw["created"] == account.created
+        assert dumped["created"] == account.created.isoformat()
+
+    def test_load_json_values(self):
+        account = make_account()
+        schema = AccountSchema()
+
+        assert schema.loadb(packb(schema.dump(account))) == account
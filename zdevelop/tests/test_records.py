@@ -0,0 +1,244 @@
+import datetime
+import io
+import uuid
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from grahamcracker import (
+    DataSchemaConcrete,
+    RecordLayout,
+    RecordReader,
+    RecordWriter,
+    dataclass_schema,
+    schema_for,
+)
+
+
+UTC = datetime.timezone.utc
+
+
+@dataclass
+class Reading:
+    id: uuid.UUID
+    sensor: int
+    value: float
+    ok: bool
+    taken: datetime.datetime
+    day: datetime.date
+    previous: Optional[float] = None
+
+
+@schema_for(Reading)
+class ReadingSchema(DataSchemaConcrete):
+    pass
+
+
+def make_readings(count: int) -> List[Reading]:
+    return [
+        Reading(
+            id=uuid.uuid4(),
+            sensor=i,
+            value=i / 4,
+            ok=i % 2 == 0,
+            taken=datetime.datetime(2020, 1, 1, 0, 0, i % 60, i, tzinfo=UTC),
+            day=datetime.date(2020, 1, 1 + i % 28),
+            previous=None if i % 3 else float(i),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def layout() -> RecordLayout:
+    return RecordLayout(ReadingSchema)
+
+
+@pytest.fixture
+def record_file(tmp_path, layout):
+    readings = make_readings(100)
+    path = tmp_path / "readings.gcr"
+    with RecordWriter(str(path), layout, buffer_records=7) as writer:
+        writer.write_many(readings)
+    return path, readings
+
+
+class TestRecordLayout:
+    def test_fixed_size(self, layout):
+        # 16 + 8 + 8 + 1 + 8 + 4 + (1 + 8)
+        assert layout.record_size == 54
+        assert layout.names == [
+            "id",
+            "sensor",
+            "value",
+            "ok",
+            "taken",
+            "day",
+            "previous",
+        ]
+
+    def test_round_trip(self, layout):
+        reading = make_readings(1)[0]
+
+        assert layout.unpack(layout.pack(reading)) == reading
+
+    def test_dict(self, layout):
+        reading = make_readings(1)[0]
+
+        assert layout.pack(reading.__dict__) == layout.pack(reading)
+
+    def test_schema_instance(self, layout):
+        assert RecordLayout(ReadingSchema()).fingerprint == layout.fingerprint
+
+    def test_fingerprint_changes(self, layout):
+        @dataclass
+        class Reading:
+            id: uuid.UUID
+            sensor: int
+
+        assert RecordLayout(dataclass_schema(Reading)).fingerprint != (
+            layout.fingerprint
+        )
+
+    def test_unsupported_field(self):
+        @dataclass
+        class Named:
+            name: str
+
+        with pytest.raises(TypeError):
+            RecordLayout(dataclass_schema(Named))
+
+    def test_empty_layout(self):
+        @dataclass
+        class Empty:
+            pass
+
+        with pytest.raises(TypeError):
+            RecordLayout(dataclass_schema(Empty))
+
+    def test_time_unsupported(self):
+        @dataclass
+        class Alarm:
+            at: datetime.time
+
+        with pytest.raises(TypeError):
+            RecordLayout(dataclass_schema(Alarm))
+
+    def test_init_false_field(self):
+        @dataclass
+        class Counter:
+            start: int
+            count: int = field(init=False, default=0)
+
+        layout = RecordLayout(dataclass_schema(Counter))
+        counter = Counter(1)
+        counter.count = 5
+
+        assert layout.unpack(layout.pack(counter)) == counter
+
+    def test_aware_datetime_required(self, layout):
+        reading = make_readings(1)[0]
+        reading.taken = reading.taken.replace(tzinfo=None)
+
+        with pytest.raises(ValueError):
+            layout.pack(reading)
+
+    def test_timezone_converted(self, layout):
+        reading = make_readings(1)[0]
+        reading.taken = datetime.datetime(
+            2020, 1, 1, 8, tzinfo=datetime.timezone(datetime.timedelta(hours=8))
+        )
+
+        loaded = layout.unpack(layout.pack(reading))
+
+        assert loaded.taken == reading.taken
+        assert loaded.taken.tzinfo == UTC
+
+
+class TestRecordFiles:
+    def test_read_all(self, record_file, layout):
+        path, readings = record_file
+
+        with RecordReader(path, layout) as reader:
+            assert len(reader) == 100
+            assert list(reader) == readings
+
+    def test_random_access(self, record_file, layout):
+        path, readings = record_file
+
+        with RecordReader(path, layout) as reader:
+            assert reader[42] == readings[42]
+            assert reader[-1] == readings[-1]
+            assert reader[10:20:3] == readings[10:20:3]
+            assert reader.raw(3)[1] == 3
+            with pytest.raises(IndexError):
+                reader[100]
+
+    def test_file_object(self, layout):
+        readings = make_readings(5)
+        stream = io.BytesIO()
+
+        writer = RecordWriter(stream, layout)
+        writer.write_many(readings)
+        writer.flush()
+
+        assert writer.count == 5
+        assert len(stream.getvalue()) == 44 + 5 * layout.record_size
+
+    def test_empty(self, tmp_path, layout):
+        path = tmp_path / "empty.gcr"
+        RecordWriter(str(path), layout).close()
+
+        with RecordReader(path, layout) as reader:
+            assert len(reader) == 0
+            assert list(reader) == []
+
+    def test_layout_mismatch(self, record_file):
+        path, _ = record_file
+
+        @dataclass
+        class Other:
+            sensor: int
+
+        with pytest.raises(ValueError):
+            RecordReader(path, RecordLayout(dataclass_schema(Other)))
+
+    def test_not_a_record_file(self, tmp_path, layout):
+        path = tmp_path / "other.gcr"
+        path.write_bytes(b"x" * 100)
+
+        with pytest.raises(ValueError):
+            RecordReader(path, layout)
+
+    def test_truncated(self, record_file, layout):
+        path, _ = record_file
+        path.write_bytes(path.read_bytes()[:-1])
+
+        with pytest.raises(ValueError):
+            RecordReader(path, layout)
+
+    def test_value_out_of_range(self, tmp_path, layout):
+        reading = make_readings(1)[0]
+        reading.sensor = 2 ** 70
+
+        with RecordWriter(str(tmp_path / "bad.gcr"), layout) as writer:
+            with pytest.raises(ValueError):
+                writer.write(reading)
+
+    def test_load_dataclass_false(self, record_file):
+        path, readings = record_file
+        layout = RecordLayout(ReadingSchema(load_dataclass=False))
+
+        with RecordReader(path, layout) as reader:
+            assert reader[0] == readings[0].__dict__
+
+    def test_close_after_partial_iteration(self, record_file, layout):
+        path, readings = record_file
+
+        reader = RecordReader(path, layout)
+        for reading in reader:
+            break
+        reader.close()
+
+        assert reading == readings[0]
@@ -2,8 +2,20 @@ import pytest
 import json
 import datetime
 import pytz
+import gc
+import threading
+import time
 import uuid
-from dataclasses import dataclass, field, asdict
+import weakref
+from collections import OrderedDict
+from enum import Enum, IntEnum
+from dataclasses import (
+    dataclass,
+    field,
+    asdict,
+    fields as dataclasses_fields,
+    make_dataclass,
+)
 from typing import (
     Optional,
     List,
@@ -12,8 +24,21 @@ from typing import (
     Generic,
     TypeVar,
     Mapping,
+    Tuple,
+    FrozenSet,
+)
+from marshmallow import (
+    ValidationError,
+    Schema,
+    fields,
+    post_load,
+    pre_dump,
+    pre_load,
+    validates,
 )
-from marshmallow import ValidationError, Schema, fields, post_load, pre_dump, validates
+from marshmallow import class_registry
+from marshmallow.exceptions import RegistryError
+from decimal import Decimal
 from fractions import Fraction
 
 
@@ -27,8 +52,14 @@ from grahamcracker import (
     URLStr,
     gfield,
     MISSING,
+    HandlerRegistry,
+    CompactValidationError,
 )
-from zdevelop.tests.conftest import min_version
+from grahamcracker import _convert
+from grahamcracker._dump_cache import cacheable_class
+from grahamcracker._fast_conversion import FastEncoder, generate_converter_dict
+from grahamcracker._field_conversion import FIELD_CONVERSION
+from zdevelop.tests.conftest import min_version, requires_numpy, numpy
 
 
 @dataclass
@@ -174,6 +205,26 @@ class HasTime:
     value: datetime.time
 
 
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class Size(IntEnum):
+    SMALL = 1
+    LARGE = 2
+
+
+@dataclass
+class HasEnum:
+    value: Color
+
+
+@dataclass
+class HasIntEnum:
+    value: Size
+
+
 class FractionSchema(Schema):
     numerator = fields.Int()
     denominator = fields.Int()
@@ -295,6 +346,8 @@ class TestLoadDump:
         (HasDate(test_date), {"value": test_date.isoformat()}, None, None),
         (HasTime(test_time), {"value": test_time.isoformat()}, None, None),
         (HasBool(True), {"value": True}, None, None),
+        (HasEnum(Color.RED), {"value": "red"}, None, None),
+        (HasIntEnum(Size.LARGE), {"value": 2}, None, None),
         (HasBool(False), {"value": False}, None, None),
         # Optional List Data First
         (
@@ -805,6 +858,428 @@ class TestLoadDefaults:
         assert loaded.value2 is MISSING
 
 
+class TestEnum:
+    def test_enum_by_name(self):
+        @dataclass
+        class X:
+            value: Color = gfield(garams=Garams(by_value=False))
+
+        schema = dataclass_schema(X)
+
+        assert schema().load({"value": "BLUE"}) == X(Color.BLUE)
+        assert schema().dump(X(Color.BLUE)) == {"value": "BLUE"}
+        assert "value" in schema().validate({"value": "blue"})
+
+    def test_enum_by_name_in_containers(self):
+        @dataclass
+        class X:
+            values: List[Color] = gfield(garams=Garams(by_value=False))
+            lookup: Dict[str, Optional[Color]] = gfield(garams=Garams(by_value=False))
+
+        schema = dataclass_schema(X)()
+        data = {"values": ["RED", "BLUE"], "lookup": {"a": "BLUE", "b": None}}
+
+        loaded = schema.load(data)
+
+        assert loaded == X([Color.RED, Color.BLUE], {"a": Color.BLUE, "b": None})
+        assert schema.dump(loaded) == data
+        assert "by_value" not in schema.fields["values"].metadata
+
+    def test_enum_by_name_fast_dumps(self):
+        @dataclass
+        class Inner:
+            value: Color = gfield(garams=Garams(by_value=False))
+
+        @dataclass
+        class Outer:
+            inner: List[Inner]
+            value: Color
+
+        obj = Outer([Inner(Color.BLUE)], Color.RED)
+
+        dumped = dataclass_schema(Outer)(fast_dumps=True).dumps(obj)
+
+        assert json.loads(dumped) == {"inner": [{"value": "BLUE"}], "value": "red"}
+
+    def test_enum_invalid_value(self):
+        schema = dataclass_schema(HasEnum)
+
+        result = schema().validate({"value": "green"})
+        assert result == {"value": ["Must be one of: red, blue."]}
+
+    def test_enum_unhashable_value(self):
+        schema = dataclass_schema(HasEnum)
+
+        result = schema().validate({"value": ["red"]})
+        assert "value" in result
+
+    def test_optional_enum_list(self):
+        @dataclass
+        class X:
+            values: List[Optional[Color]]
+
+        schema = dataclass_schema(X)
+        data = X([Color.RED, None])
+
+        assert schema().load({"values": ["red", None]}) == data
+        assert json.loads(schema(fast_dumps=True).dumps(data)) == {
+            "values": ["red", None]
+        }
+
+    def test_enum_custom_handler(self):
+        class ColorField(fields.Field):
+            def _serialize(self, value, attr, obj, **kwargs):
+                return value.name.lower()
+
+            def _deserialize(self, value, attr, data, **kwargs):
+                return Color[value.upper()]
+
+        schema = dataclass_schema(HasEnum, type_handlers={Color: ColorField})
+
+        assert schema().load({"value": "blue"}) == HasEnum(Color.BLUE)
+        assert schema().dump(HasEnum(Color.BLUE)) == {"value": "blue"}
+
+
+class TestFastPrimitives:
+    stock_fields = {
+        str: fields.Str,
+        int: fields.Int,
+        float: fields.Float,
+        bool: fields.Bool,
+        uuid.UUID: fields.UUID,
+    }
+
+    @pytest.mark.parametrize(
+        "field_type, value, expected",
+        [
+            (str, "value", "value"),
+            (int, 10, 10),
+            (int, "10", 10),
+            (float, 1, 1.0),
+            (float, 1.5, 1.5),
+            (float, "1.5", 1.5),
+            (bool, False, False),
+            (bool, "true", True),
+            (uuid.UUID, str(test_uuid), test_uuid),
+        ],
+    )
+    def test_load(self, field_type: type, value: Any, expected: Any):
+        @dataclass
+        class X:
+            value: field_type
+
+        loaded = dataclass_schema(X)().load({"value": value})
+
+        assert loaded.value == expected
+        assert type(loaded.value) is type(expected)
+
+    @pytest.mark.parametrize(
+        "field_type, value",
+        [
+            (str, 10),
+            (int, "ten"),
+            (int, True),
+            (float, float("nan")),
+            (float, float("inf")),
+            (float, 10 ** 400),
+            (bool, "maybe"),
+            (uuid.UUID, "not a uuid"),
+            (uuid.UUID, 10),
+            (str, None),
+        ],
+    )
+    def test_error_messages_unchanged(self, field_type: type, value: Any):
+        @dataclass
+        class X:
+            value: field_type
+
+        stock_schema = Schema.from_dict(
+            {"value": self.stock_fields[field_type](required=True, allow_none=False)}
+        )
+
+        result = dataclass_schema(X)().validate({"value": value})
+
+        assert result
+        assert result == stock_schema().validate({"value": value})
+        assert dataclass_schema(X)().validate({}) == stock_schema().validate({})
+
+    def test_validator_uses_stock_field(self):
+        schema = dataclass_schema(HasValidator)
+        assert type(schema().fields["num"]) is fields.Int
+
+    def test_error_messages_uses_stock_field(self):
+        @dataclass
+        class X:
+            text: str = gfield(garams=Garams(error_messages={"null": "No nulls."}))
+
+        schema = dataclass_schema(X)
+
+        assert type(schema().fields["text"]) is fields.Str
+        assert schema().validate({"text": None}) == {"text": ["No nulls."]}
+
+
+class TestContainerFastPaths:
+    @pytest.mark.parametrize(
+        "field_type, value, expected",
+        [
+            (List[str], ["a", "b"], ["a", "b"]),
+            (List[int], [1, 2], [1, 2]),
+            (List[int], [1, "2"], [1, 2]),
+            (List[float], [1, 2.5], [1.0, 2.5]),
+            (List[bool], [True, False], [True, False]),
+            (List[Optional[int]], [1, None], [1, None]),
+            (List[uuid.UUID], [str(test_uuid)], [test_uuid]),
+            (Dict[str, int], {"one": 1, "two": 2}, {"one": 1, "two": 2}),
+            (Dict[str, float], {"one": 1}, {"one": 1.0}),
+            (Dict[str, Optional[str]], {"one": None}, {"one": None}),
+            (Dict[str, uuid.UUID], {"id": str(test_uuid)}, {"id": test_uuid}),
+        ],
+    )
+    def test_load_dump(self, field_type: Any, value: Any, expected: Any):
+        @dataclass
+        class X:
+            value: field_type
+
+        schema = dataclass_schema(X)
+        loaded = schema().load({"value": value})
+
+        assert loaded.value == expected
+        assert loaded.value is not value
+        assert schema().load(schema().dump(loaded)) == loaded
+
+    def test_dumped_list_is_copy(self):
+        data = HasList(["value1", "value2"])
+        dumped = dataclass_schema(HasList)().dump(data)
+
+        assert dumped == {"text_list": ["value1", "value2"]}
+        assert dumped["text_list"] is not data.text_list
+
+    @pytest.mark.parametrize(
+        "field_type, stock_field, value",
+        [
+            (List[int], fields.List(fields.Int()), [1, "two", True]),
+            (List[str], fields.List(fields.Str()), ["one", 2, None]),
+            (List[float], fields.List(fields.Float()), [1.0, float("nan")]),
+            (List[int], fields.List(fields.Int()), "not a list"),
+            (
+                Dict[str, int],
+                fields.Dict(keys=fields.Str(), values=fields.Int()),
+                {"one": 1, "two": "two", "three": None},
+            ),
+            (
+                Dict[str, int],
+                fields.Dict(keys=fields.Str(), values=fields.Int()),
+                ["not a dict"],
+            ),
+        ],
+    )
+    def test_errors_unchanged(self, field_type: Any, stock_field: Any, value: Any):
+        @dataclass
+        class X:
+            value: field_type
+
+        stock_field.required = True
+        stock_schema = Schema.from_dict({"value": stock_field})
+
+        result = dataclass_schema(X)().validate({"value": value})
+
+        assert result
+        assert result == stock_schema().validate({"value": value})
+
+
+class TestTemporalFields:
+    def test_datetime_list(self):
+        @dataclass
+        class X:
+            values: List[Optional[datetime.datetime]]
+
+        schema = dataclass_schema(X)
+        data = X([test_datetime, None])
+        data_dict = {"values": [test_datetime.isoformat(), None]}
+
+        assert schema().load(data_dict) == data
+        assert schema().dump(data) == data_dict
+        assert json.loads(schema(fast_dumps=True).dumps(data)) == data_dict
+
+    def test_date_time_lists(self):
+        @dataclass
+        class X:
+            dates: List[datetime.date]
+            times: List[datetime.time]
+
+        schema = dataclass_schema(X)
+        data = X([test_date], [test_time])
+        data_dict = {"dates": [test_date.isoformat()], "times": ["12:00:00"]}
+
+        assert schema().load(data_dict) == data
+        assert schema().dump(data) == data_dict
+
+    def test_datetime_zulu(self):
+        loaded = dataclass_schema(HasDateTime)().load(
+            {"value": "2020-01-02T03:04:05.5Z"}
+        )
+        assert loaded.value == datetime.datetime(
+            2020, 1, 2, 3, 4, 5, 500000, tzinfo=datetime.timezone.utc
+        )
+
+    @staticmethod
+    def spy_from_iso(monkeypatch, field):
+        calls = []
+        from_iso = type(field)._FROM_ISO
+
+        def spy(value):
+            calls.append(value)
+            return from_iso(value)
+
+        monkeypatch.setattr(type(field), "_FROM_ISO", spy)
+        return calls
+
+    def test_non_padded_datetime_falls_back(self, monkeypatch):
+        schema = dataclass_schema(HasDateTime)()
+        calls = self.spy_from_iso(monkeypatch, schema.fields["value"])
+
+        assert schema.load({"value": "2020-1-2T3:04"}) == HasDateTime(
+            datetime.datetime(2020, 1, 2, 3, 4)
+        )
+        assert calls == []
+
+        # Only that value fell back; the next one still takes the fast path.
+        loaded = schema.load({"value": "2020-01-02T03:04:00"})
+        assert loaded.value == datetime.datetime(2020, 1, 2, 3, 4)
+        assert calls == ["2020-01-02T03:04:00"]
+
+    def test_datetime_zulu_fast_path(self, monkeypatch):
+        schema = dataclass_schema(HasDateTime)()
+        calls = self.spy_from_iso(monkeypatch, schema.fields["value"])
+
+        loaded = schema.load({"value": "2020-01-02T03:04:05Z"})
+
+        assert loaded.value == datetime.datetime(
+            2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+        )
+        assert calls == ["2020-01-02T03:04:05+00:00"]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2020-01-02T03:04:05Z",
+            "2020-01-02T03:04:05+05:00",
+            "2020-01-02T03:04:05-0530",
+            "2020-01-02T03:04:05+05",
+        ],
+    )
+    def test_datetime_offset_matches_marshmallow(self, value):
+        schema = dataclass_schema(HasDateTime)()
+        expected = fields.DateTime().deserialize(value)
+
+        loaded = schema.load({"value": value}).value
+
+        assert loaded == expected
+        assert loaded.utcoffset() == expected.utcoffset()
+        assert loaded.isoformat() == expected.isoformat()
+
+    def test_datetime_hour_offset_falls_back(self, monkeypatch):
+        schema = dataclass_schema(HasDateTime)()
+        calls = self.spy_from_iso(monkeypatch, schema.fields["value"])
+
+        schema.load({"value": "2020-01-02T03:04:05+05"})
+
+        assert calls == []
+
+    def test_invalid_datetime_list_errors(self):
+        @dataclass
+        class X:
+            values: List[datetime.datetime]
+
+        result = dataclass_schema(X)().validate(
+            {"values": ["2020-01-02T03:04:00", "not a datetime"]}
+        )
+        assert result == {"values": {1: ["Not a valid datetime."]}}
+
+
+@requires_numpy
+class TestArrayFields:
+    def test_float_list_as_array(self):
+        @dataclass
+        class X:
+            trace: List[float] = gfield(garams=Garams(as_array=True))
+
+        schema = dataclass_schema(X)
+        loaded = schema().load({"trace": [1, 2.5, 3.0]})
+
+        assert isinstance(loaded.trace, numpy.ndarray)
+        assert loaded.trace.dtype == numpy.float64
+        assert loaded.trace.tolist() == [1.0, 2.5, 3.0]
+
+        assert schema().dump(loaded) == {"trace": [1.0, 2.5, 3.0]}
+        assert json.loads(schema(fast_dumps=True).dumps(loaded)) == {
+            "trace": [1.0, 2.5, 3.0]
+        }
+
+    def test_int_list_as_array(self):
+        @dataclass
+        class X:
+            counts: List[int] = gfield(garams=Garams(as_array=True))
+
+        schema = dataclass_schema(X)
+        loaded = schema().load({"counts": [1, 2, 3]})
+
+        assert loaded.counts.dtype == numpy.int64
+        assert schema().dump(loaded) == {"counts": [1, 2, 3]}
+
+    def test_ndarray_annotation(self):
+        @dataclass
+        class X:
+            trace: numpy.ndarray
+
+        schema = dataclass_schema(X)
+        loaded = schema().load({"trace": [0.5, 1.5]})
+
+        assert loaded.trace.tolist() == [0.5, 1.5]
+        assert schema().dump(loaded) == {"trace": [0.5, 1.5]}
+
+    @pytest.mark.parametrize(
+        "trace",
+        [
+            [1.0, "not a number", 2.0],
+            [1.0, True],
+            [1.0, None],
+            [1.0, float("nan")],
+            "not a list",
+        ],
+    )
+    def test_array_errors_match_list(self, trace: Any):
+        @dataclass
+        class ListX:
+            trace: List[float]
+
+        @dataclass
+        class ArrayX:
+            trace: List[float] = gfield(garams=Garams(as_array=True))
+
+        list_errors = dataclass_schema(ListX)().validate({"trace": trace})
+        array_errors = dataclass_schema(ArrayX)().validate({"trace": trace})
+
+        assert array_errors
+        assert array_errors == list_errors
+
+    def test_int_array_out_of_range(self):
+        @dataclass
+        class X:
+            counts: List[int] = gfield(garams=Garams(as_array=True))
+
+        result = dataclass_schema(X)().validate({"counts": [1, 2 ** 70]})
+        assert result == {"counts": ["Values must fit in int64."]}
+
+    def test_as_array_bad_type_raises(self):
+        @dataclass
+        class X:
+            names: List[str] = gfield(garams=Garams(as_array=True))
+
+        with pytest.raises(TypeError):
+            dataclass_schema(X)
+
+
 class TestTypeHandlers:
     def test_type_handler_add_func(self):
         @dataclass
@@ -953,6 +1428,1497 @@ class TestTypeHandlers:
         schema().dump(WithUUID(uuid.uuid4()))
         assert UUIDCustom.set_value == "something"
 
+    @min_version
+    def test_generic_parameterization_cached(self):
+        @dataclass
+        class Page(Generic[Var]):
+            items: List[Var]
+            total: int
+
+        type_handlers = {}
+
+        PageSchema = dataclass_schema(Page[Simple], type_handlers=type_handlers)
+
+        assert PageSchema.__name__ == "PageSimpleSchema"
+        assert type_handlers[Page[Simple]] is PageSchema
+        assert dataclass_schema(Page[Simple], type_handlers=type_handlers) is PageSchema
+
+        loaded = PageSchema().load({"items": [{"text": "a"}], "total": 1})
+        assert loaded == Page([Simple("a")], 1)
+
+    @min_version
+    def test_generic_parameterization_shares_fields(self):
+        @dataclass
+        class Page(Generic[Var]):
+            items: List[Var]
+            total: int
+
+        type_handlers = {}
+
+        SimplePage = dataclass_schema(Page[Simple], type_handlers=type_handlers)
+        BoolPage = dataclass_schema(Page[HasBool], type_handlers=type_handlers)
+
+        assert SimplePage is not BoolPage
+        total = SimplePage._declared_fields["total"]
+        assert BoolPage._declared_fields["total"] is total
+        assert BoolPage._declared_fields["items"] is not (
+            SimplePage._declared_fields["items"]
+        )
+
+        loaded = BoolPage().load({"items": [{"value": True}], "total": 1})
+        assert loaded == Page([HasBool(True)], 1)
+
+    @min_version
+    def test_generic_parameterization_nested(self):
+        @dataclass
+        class Page(Generic[Var]):
+            items: List[Var]
+
+        @dataclass
+        class Pages:
+            simple: Page[Simple]
+            other: Optional[Page[HasBool]] = None
+
+        type_handlers = {}
+
+        PagesSchema = dataclass_schema(Pages, type_handlers=type_handlers)
+
+        assert Page[Simple] in type_handlers
+        assert Page[HasBool] in type_handlers
+        assert PagesSchema._declared_fields["simple"].nested is (
+            type_handlers[Page[Simple]]
+        )
+
+        data = {"simple": {"items": [{"text": "a"}]}, "other": {"items": []}}
+        loaded = PagesSchema().load(data)
+        assert loaded == Pages(Page([Simple("a")]), Page([]))
+        assert PagesSchema().dump(loaded) == data
+
+
+@dataclass
+class Address:
+    street: str
+    city: str
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+    address: Optional[Address] = None
+    tags: List[str] = field(default_factory=list)
+
+
+class TestDumpDelta:
+    def test_changed_fields_only(self):
+        schema = dataclass_schema(Person)()
+        old = Person("a", 1, Address("x", "y"))
+        new = Person("a", 2, Address("x", "y"), ["t"])
+
+        assert schema.dump_delta(new, old) == {"age": 2, "tags": ["t"]}
+
+    def test_no_changes(self):
+        schema = dataclass_schema(Person)()
+        person = Person("a", 1, Address("x", "y"))
+
+        assert schema.dump_delta(person, Person("a", 1, Address("x", "y"))) == {}
+
+    def test_nested(self):
+        schema = dataclass_schema(Person)()
+        old = Person("a", 1, Address("x", "y"))
+        new = Person("a", 1, Address("x", "z"))
+
+        assert schema.dump_delta(new, old) == {"address": {"city": "z"}}
+
+    def test_nested_added(self):
+        schema = dataclass_schema(Person)()
+        old = Person("a", 1)
+        new = Person("a", 1, Address("x", "z"))
+
+        assert schema.dump_delta(new, old) == {"address": {"street": "x", "city": "z"}}
+
+    def test_nested_removed(self):
+        schema = dataclass_schema(Person)()
+        old = Person("a", 1, Address("x", "y"))
+        new = Person("a", 1)
+
+        assert schema.dump_delta(new, old) == {"address": None}
+
+    def test_update_allowed(self):
+        @schema_for(Person)
+        class PersonSchema(DataSchemaConcrete):
+            UPDATE_ALLOWED = ["age", "address.city"]
+
+        schema = PersonSchema()
+        old = Person("a", 1, Address("x", "y"))
+        new = Person("b", 2, Address("w", "z"))
+
+        assert schema.dump_delta(new, old) == {"age": 2, "address": {"city": "z"}}
+
+    def test_update_allowed_parent(self):
+        @schema_for(Person)
+        class PersonSchema(DataSchemaConcrete):
+            UPDATE_ALLOWED = ["address"]
+
+        schema = PersonSchema()
+        old = Person("a", 1, Address("x", "y"))
+        new = Person("b", 2, Address("w", "y"))
+
+        assert schema.dump_delta(new, old) == {"address": {"street": "w"}}
+
+    def test_dump_only_skipped(self):
+        @dataclass
+        class X:
+            id: int = field(metadata={"garams": Garams(dump_only=True)})
+            value: str = "a"
+
+        schema = dataclass_schema(X)()
+
+        assert schema.dump_delta(X(2, "b"), X(1, "a")) == {"value": "b"}
+
+    def test_nested_dump_only_skipped(self):
+        @dataclass
+        class Inner:
+            a: int
+            b: int = field(metadata={"garams": Garams(dump_only=True)})
+
+        @dataclass
+        class Outer:
+            inner: Inner
+
+        schema = dataclass_schema(Outer)()
+
+        delta = schema.dump_delta(Outer(Inner(1, 5)), Outer(Inner(0, 4)))
+
+        assert delta == {"inner": {"a": 1}}
+        assert schema.load(delta, partial=True).inner.a == 1
+
+    def test_missing_skipped(self):
+        schema = dataclass_schema(Person)()
+        old = Person("a", 1)
+        new = Person(MISSING, 2)
+
+        assert schema.dump_delta(new, old) == {"age": 2}
+
+    def test_partial_load(self):
+        schema = dataclass_schema(Person)()
+        old = Person("a", 1, Address("x", "y"))
+        new = Person("a", 2, Address("x", "z"))
+
+        delta = schema.dump_delta(new, old)
+        loaded = dataclass_schema(Person)(load_dataclass=False).load(
+            delta, partial=True
+        )
+
+        assert loaded == {"age": 2, "address": {"city": "z"}}
+
+
+@dataclass(frozen=True)
+class FrozenAddress:
+    street: str
+    city: str
+
+
+@dataclass(frozen=True)
+class FrozenPerson:
+    name: str
+    address: FrozenAddress
+
+
+@dataclass
+class Team:
+    name: str
+    members: List[Person]
+    lead: Optional[Person] = None
+
+
+class TestLoadInto:
+    def test_assigns_present_fields(self):
+        schema = dataclass_schema(Person)()
+        address = Address("x", "y")
+        person = Person("a", 1, address)
+
+        result = schema.load_into(person, {"age": "2"})
+
+        assert result is person
+        assert person == Person("a", 2, address)
+        assert person.address is address
+
+    def test_nested_in_place(self):
+        schema = dataclass_schema(Person)()
+        address = Address("x", "y")
+        person = Person("a", 1, address)
+
+        schema.load_into(person, {"address": {"city": "z"}})
+
+        assert person.address is address
+        assert address == Address("x", "z")
+
+    def test_nested_new(self):
+        schema = dataclass_schema(Person)()
+        person = Person("a", 1)
+
+        schema.load_into(person, {"address": {"street": "x", "city": "z"}})
+
+        assert person.address == Address("x", "z")
+
+    def test_nested_many_rebuilt(self):
+        schema = dataclass_schema(Team)(use_defaults=True)
+        team = Team("t", [])
+
+        schema.load_into(
+            team,
+            {
+                "members": [{"name": "a", "age": 1}],
+                "lead": {
+                    "name": "b",
+                    "age": 2,
+                    "address": {"street": "x", "city": "y"},
+                },
+            },
+        )
+
+        assert team.members == [Person("a", 1)]
+        assert team.lead == Person("b", 2, Address("x", "y"))
+
+    def test_nested_new_missing_required(self):
+        schema = dataclass_schema(Team)()
+        team = Team("t", [Person("a", 1)])
+
+        with pytest.raises(ValidationError) as error:
+            schema.load_into(
+                team,
+                {"name": "u", "members": [{"name": "b", "age": 2}, {"name": "c"}]},
+            )
+
+        assert error.value.messages == {
+            "members": {1: {"age": ["Missing data for required field."]}}
+        }
+        assert team == Team("t", [Person("a", 1)])
+
+    def test_nested_in_place_then_new_missing_required(self):
+        schema = dataclass_schema(Team)()
+        team = Team("t", [], Person("a", 1))
+
+        with pytest.raises(ValidationError) as error:
+            schema.load_into(team, {"lead": {"address": {"city": "z"}}})
+
+        assert error.value.messages == {
+            "lead": {"address": {"street": ["Missing data for required field."]}}
+        }
+        assert team.lead == Person("a", 1)
+
+    def test_validation_error(self):
+        schema = dataclass_schema(Person)()
+        person = Person("a", 1)
+
+        with pytest.raises(ValidationError):
+            schema.load_into(person, {"age": "not a number"})
+
+        assert person.age == 1
+
+    def test_frozen_set_in_place(self):
+        schema = dataclass_schema(FrozenPerson)()
+        address = FrozenAddress("x", "y")
+        person = FrozenPerson("a", address)
+
+        result = schema.load_into(person, {"name": "b", "address": {"city": "z"}})
+
+        assert result is person
+        assert person.name == "b"
+        assert person.address is address
+        assert address.city == "z"
+
+    def test_frozen_replace(self):
+        schema = dataclass_schema(FrozenPerson)()
+        address = FrozenAddress("x", "y")
+        person = FrozenPerson("a", address)
+
+        result = schema.load_into(
+            person, {"address": {"city": "z"}}, replace_frozen=True
+        )
+
+        assert result is not person
+        assert result == FrozenPerson("a", FrozenAddress("x", "z"))
+        assert person == FrozenPerson("a", FrozenAddress("x", "y"))
+
+    def test_frozen_replace_unchanged(self):
+        schema = dataclass_schema(FrozenPerson)()
+        person = FrozenPerson("a", FrozenAddress("x", "y"))
+
+        assert schema.load_into(person, {}, replace_frozen=True) is person
+
+
+@dataclass(frozen=True)
+class FrozenCatalog:
+    name: str
+    address: FrozenAddress
+    entries: List[FrozenAddress] = field(default_factory=list)
+
+
+class TestDumpCache:
+    def test_cached_dump(self):
+        @schema_for(FrozenAddress)
+        class AddressSchema(DataSchemaConcrete):
+            DUMP_CACHE = True
+
+        address = FrozenAddress("x", "y")
+
+        first = AddressSchema().dump(address)
+        second = AddressSchema().dump(address)
+
+        assert first == second == {"street": "x", "city": "y"}
+        assert second is not first
+        cache = AddressSchema()._get_dump_cache()
+        assert cache.get(address).dumped == first
+        assert cache.get(FrozenAddress("x", "y")) is None
+
+    def test_not_cached_by_default(self):
+        schema = dataclass_schema(FrozenAddress)()
+        address = FrozenAddress("x", "y")
+
+        assert schema.dump(address) is not schema.dump(address)
+
+    def test_mutable_not_cached(self):
+        @schema_for(Address)
+        class AddressSchema(DataSchemaConcrete):
+            DUMP_CACHE = True
+
+        schema = AddressSchema()
+        address = Address("x", "y")
+
+        assert schema.dump(address) == {"street": "x", "city": "y"}
+        address.city = "z"
+        assert schema.dump(address) == {"street": "x", "city": "z"}
+
+    def test_variants(self):
+        @schema_for(FrozenAddress)
+        class AddressSchema(DataSchemaConcrete):
+            DUMP_CACHE = True
+
+        address = FrozenAddress("x", "y")
+
+        full = AddressSchema().dump(address)
+        only = AddressSchema(only=["city"]).dump(address)
+        exclude = AddressSchema(exclude=["city"]).dump(address)
+
+        assert full == {"street": "x", "city": "y"}
+        assert only == {"city": "y"}
+        assert exclude == {"street": "x"}
+        assert AddressSchema(only=["city"])._get_dump_cache().get(address).dumped == (
+            only
+        )
+
+    def test_load_only_variants(self):
+        @schema_for(FrozenAddress)
+        class AddressSchema(DataSchemaConcrete):
+            DUMP_CACHE = True
+
+        first = FrozenAddress("x", "y")
+        second = FrozenAddress("x", "y")
+
+        AddressSchema().dump(first)
+        AddressSchema(load_only=["street"]).dump(second)
+
+        assert AddressSchema(load_only=["street"]).dump(first) == {"city": "y"}
+        assert AddressSchema().dump(second) == {"street": "x", "city": "y"}
+
+    @pytest.mark.parametrize(
+        "dump_cache, received", [(False, dict), (True, FrozenAddress)]
+    )
+    def test_nested_pre_dump_input(self, dump_cache, received):
+        seen = list()
+
+        class AddressSchema(Schema):
+            street = fields.Str()
+            city = fields.Str()
+
+            @pre_dump
+            def record(self, data, **kwargs):
+                seen.append(type(data))
+                return data
+
+        schema_class = dataclass_schema(
+            FrozenCatalog, type_handlers={FrozenAddress: AddressSchema}
+        )
+        schema_class(dump_cache=dump_cache).dump(
+            FrozenCatalog("a", FrozenAddress("x", "y"))
+        )
+
+        assert seen == [received]
+
+    def test_nested_fragments(self):
+        schema = dataclass_schema(FrozenCatalog)(dump_cache=True)
+        address = FrozenAddress("x", "y")
+        catalog = FrozenCatalog("a", address, [address])
+
+        dumped = schema.dump(catalog)
+        other = schema.dump(FrozenCatalog("b", address))
+
+        assert dumped == {
+            "name": "a",
+            "address": {"street": "x", "city": "y"},
+            "entries": [{"street": "x", "city": "y"}],
+        }
+        assert other["address"] == dumped["address"]
+        assert other["address"] is not dumped["address"]
+        # The list field makes catalogs uncacheable, but their addresses are cached.
+        assert schema._get_dump_cache().get(catalog) is None
+        address_cache = schema.fields["address"].schema._get_dump_cache()
+        assert address_cache.get(address) is not None
+
+    def test_many(self):
+        schema = dataclass_schema(FrozenAddress)(many=True, dump_cache=True)
+        address = FrozenAddress("x", "y")
+
+        dumped = schema.dump([address, address])
+
+        assert dumped == [{"street": "x", "city": "y"}] * 2
+        assert dumped[0] is not dumped[1]
+
+    def test_dumps(self):
+        schema = dataclass_schema(FrozenAddress)(dump_cache=True)
+        address = FrozenAddress("x", "y")
+
+        text = schema.dumps(address)
+
+        assert json.loads(text) == {"street": "x", "city": "y"}
+        assert schema.dumps(address) is text
+
+    def test_size_bound(self):
+        @schema_for(FrozenAddress)
+        class AddressSchema(DataSchemaConcrete):
+            DUMP_CACHE = True
+            DUMP_CACHE_SIZE = 2
+
+        schema = AddressSchema()
+        addresses = [FrozenAddress("x", str(i)) for i in range(3)]
+        for address in addresses:
+            schema.dump(address)
+
+        cache = schema._get_dump_cache()
+        assert cache.get(addresses[0]) is None
+        assert cache.get(addresses[2]) is not None
+        assert len(cache) == 2
+
+    def test_collected_instances_dropped(self):
+        schema = dataclass_schema(FrozenAddress)(dump_cache=True)
+
+        schema.dump(FrozenAddress("x", "y"))
+
+        assert len(schema._get_dump_cache()) == 0
+
+    def test_mutable_field_types_not_cached(self):
+        @dataclass(frozen=True)
+        class Tagged:
+            name: str
+            tags: List[str]
+
+        schema = dataclass_schema(Tagged)(dump_cache=True)
+        tagged = Tagged("a", ["x"])
+
+        assert schema.dump(tagged) == {"name": "a", "tags": ["x"]}
+        tagged.tags.append("y")
+        assert schema.dump(tagged) == {"name": "a", "tags": ["x", "y"]}
+        assert schema._get_dump_cache().get(tagged) is None
+
+    def test_immutable_field_types_cached(self):
+        @dataclass(frozen=True)
+        class Route:
+            color: Color
+            start: Optional[FrozenAddress] = None
+
+        schema = dataclass_schema(Route)(dump_cache=True)
+        route = Route(Color.RED, FrozenAddress("x", "y"))
+
+        schema.dump(route)
+
+        assert schema._get_dump_cache().get(route) is not None
+
+    def test_cacheable_containers(self):
+        @dataclass(frozen=True)
+        class Immutable:
+            stops: Tuple[FrozenAddress, ...]
+            zones: FrozenSet[int]
+
+        @dataclass(frozen=True)
+        class Mutable:
+            stops: Tuple[List[int], ...]
+
+        assert cacheable_class(Immutable)
+        assert not cacheable_class(Mutable)
+        assert not cacheable_class(Address)
+
+    def test_returned_dump_is_a_copy(self):
+        schema = dataclass_schema(FrozenPerson)(dump_cache=True)
+        person = FrozenPerson("a", FrozenAddress("x", "y"))
+
+        dumped = schema.dump(person)
+        dumped["name"] = "b"
+        dumped["address"]["city"] = "z"
+
+        assert schema.dump(person) == {
+            "name": "a",
+            "address": {"street": "x", "city": "y"},
+        }
+
+
+@dataclass
+class Listing:
+    name: str
+    owner: Person
+    backup: Optional[Person] = None
+
+
+class TestDumpMemo:
+    def test_shared_reused(self):
+        schema = dataclass_schema(Listing)(many=True, memoize_dumps=True)
+        owner = Person("a", 1)
+        listings = [Listing(str(i), owner) for i in range(3)]
+
+        dumped = schema.dump(listings)
+
+        assert dumped[0]["owner"] == {
+            "name": "a",
+            "age": 1,
+            "address": None,
+            "tags": [],
+        }
+        assert dumped[1]["owner"] is dumped[0]["owner"]
+        assert dumped[2]["owner"] is dumped[0]["owner"]
+
+    def test_off_by_default(self):
+        schema = dataclass_schema(Listing)(many=True)
+        owner = Person("a", 1)
+
+        dumped = schema.dump([Listing("a", owner), Listing("b", owner)])
+
+        assert dumped[0]["owner"] == dumped[1]["owner"]
+        assert dumped[0]["owner"] is not dumped[1]["owner"]
+
+    def test_class_attribute(self):
+        @schema_for(Listing)
+        class ListingSchema(DataSchemaConcrete):
+            MEMOIZE_DUMPS = True
+
+        owner = Person("a", 1)
+        dumped = ListingSchema().dump(Listing("a", owner, owner))
+
+        assert dumped["backup"] is dumped["owner"]
+
+    def test_per_call(self):
+        schema = dataclass_schema(Listing)(memoize_dumps=True)
+        owner = Person("a", 1)
+
+        first = schema.dump(Listing("a", owner))
+        owner.age = 2
+        second = schema.dump(Listing("a", owner))
+
+        assert first["owner"]["age"] == 1
+        assert second["owner"]["age"] == 2
+
+    def test_variants_kept_apart(self):
+        schema = dataclass_schema(Listing)(
+            only=["name", "owner.name", "backup"], memoize_dumps=True
+        )
+        owner = Person("a", 1)
+
+        dumped = schema.dump(Listing("a", owner, owner))
+
+        assert dumped["owner"] == {"name": "a"}
+        assert dumped["backup"] == {"name": "a", "age": 1, "address": None, "tags": []}
+
+    def test_fast_dumps(self):
+        schema = dataclass_schema(Listing)(
+            many=True, memoize_dumps=True, fast_dumps=True
+        )
+        owner = Person("a", 1)
+
+        dumped = json.loads(schema.dumps([Listing("a", owner), Listing("b", owner)]))
+
+        assert dumped[0]["owner"] == dumped[1]["owner"]
+        assert dumped[1]["owner"]["name"] == "a"
+
+
+class TestLoadFile:
+    @staticmethod
+    def write(tmp_path, data, encoding="utf-8"):
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data), encoding=encoding)
+        return path
+
+    def test_path(self, tmp_path):
+        people = [Person(str(i), i, Address("s", "c"), ["t"]) for i in range(25)]
+        schema = dataclass_schema(Person)(many=True)
+        path = self.write(tmp_path, schema.dump(people))
+
+        assert schema.load_file(str(path), batch_size=7) == people
+        assert schema.load_file(path) == people
+
+    def test_file_object(self, tmp_path):
+        schema = dataclass_schema(Person)()
+        path = self.write(tmp_path, {"name": "a", "age": 1})
+
+        with open(path, "rb") as binary:
+            assert schema.load_file(binary) == Person("a", 1)
+        with open(path, "r") as text:
+            assert schema.load_file(text) == Person("a", 1)
+
+    def test_stream(self):
+        import io
+
+        schema = dataclass_schema(Person)()
+        stream = io.BytesIO(b'[{"name": "a", "age": 1}]')
+
+        assert schema.load_file(stream, many=True) == [Person("a", 1)]
+
+    def test_bom(self, tmp_path):
+        schema = dataclass_schema(Person)()
+        path = self.write(tmp_path, [{"name": "é", "age": 1}], encoding="utf-8-sig")
+
+        assert schema.load_file(path, many=True) == [Person("é", 1)]
+
+    def test_object_with_many(self, tmp_path):
+        schema = dataclass_schema(Person)(normalize_many=True)
+        path = self.write(tmp_path, {"name": "a", "age": 1})
+
+        assert schema.load_file(path, many=True) == [Person("a", 1)]
+
+    def test_empty_array(self, tmp_path):
+        schema = dataclass_schema(Person)(many=True)
+
+        assert schema.load_file(self.write(tmp_path, [])) == []
+
+    def test_errors_indexed_by_file_position(self, tmp_path):
+        schema = dataclass_schema(Person)(many=True)
+        data = [{"name": str(i), "age": i} for i in range(10)]
+        data[2]["age"] = "x"
+        data[8]["age"] = "y"
+
+        with pytest.raises(ValidationError) as info:
+            schema.load_file(self.write(tmp_path, data), batch_size=3)
+
+        assert set(info.value.messages) == {2, 8}
+
+    def test_invalid_json(self, tmp_path):
+        schema = dataclass_schema(Person)(many=True)
+        path = tmp_path / "data.json"
+        path.write_text('[{"name": "a", "age": 1} {"name": "b", "age": 2}]')
+
+        with pytest.raises(json.JSONDecodeError):
+            schema.load_file(path)
+
+    def test_many_hooks_see_whole_list(self, tmp_path):
+        @dataclass
+        class Counted:
+            value: int
+
+        @schema_for(Counted)
+        class CountedSchema(DataSchemaConcrete):
+            @pre_load(pass_many=True)
+            def count(self, data, many, **kwargs):
+                if many:
+                    data = [dict(item, value=len(data)) for item in data]
+                return data
+
+        path = self.write(tmp_path, [{"value": 0}] * 5)
+
+        loaded = CountedSchema(many=True).load_file(path, batch_size=2)
+
+        assert loaded == [Counted(5)] * 5
+
+    @pytest.mark.parametrize(
+        "hook_config",
+        [
+            # marshmallow < 3.13
+            {("post_load", True): {}},
+            {"post_load": [(True, {})]},
+        ],
+    )
+    def test_many_hook_layouts(self, hook_config):
+        from grahamcracker._schema_classes import _many_hook_names
+
+        class HookedSchema(DataSchemaConcrete):
+            def hook(self, data, **kwargs):
+                return data
+
+            hook.__marshmallow_hook__ = hook_config
+
+        assert _many_hook_names(HookedSchema, ("post_load",)) == {"hook"}
+        assert _many_hook_names(HookedSchema, ("pre_dump",)) == set()
+
+    def test_loads_memoryview(self):
+        schema = dataclass_schema(Person)()
+        data = '\ufeff{"name": "é", "age": 1}'.encode("utf-8")
+
+        assert schema.loads(memoryview(data)) == Person("é", 1)
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 64])
+    def test_chunked(self, chunk_size):
+        from grahamcracker._json_stream import iter_json_array
+
+        items = [1234, -5.5e10, "é ü", None, True, [1, [2, {}]], {"a": "b,]"}, ""]
+        data = (" \n" + json.dumps(items, indent=2) + "\n").encode()
+
+        assert list(iter_json_array(data, chunk_size=chunk_size)) == items
+        assert list(iter_json_array(data.decode(), chunk_size=chunk_size)) == items
+
+    @pytest.mark.parametrize(
+        "data", ["", "{}", "[1,]", "[1 2]", "[1", "[1] 2", "[,1]", "[tru]"]
+    )
+    def test_invalid(self, data):
+        from grahamcracker._json_stream import iter_json_array
+
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(data.encode(), chunk_size=2))
+
+
+@dataclass
+class Roster:
+    name: str
+    members: List[Person]
+    scores: Dict[str, int] = field(default_factory=dict)
+    lead: Optional[Person] = None
+
+
+ROSTER_INVALID = [
+    {"name": 1, "members": [{"name": "a", "age": "x"}, {"age": 2}]},
+    {"members": "no", "scores": {"a": "b"}, "lead": {"name": "a", "age": None}},
+    {"name": "a", "members": [], "extra": 1},
+    [],
+]
+
+
+class TestCompactErrors:
+    @pytest.mark.parametrize("data", ROSTER_INVALID)
+    def test_messages_unchanged(self, data):
+        schema_class = dataclass_schema(Roster)
+
+        with pytest.raises(ValidationError) as expected:
+            schema_class().load(data)
+        with pytest.raises(CompactValidationError) as compact:
+            schema_class(compact_errors=True).load(data)
+
+        assert compact.value.messages == expected.value.messages
+        assert str(compact.value) == str(expected.value)
+
+    def test_formatting_deferred(self):
+        schema = dataclass_schema(Roster)(compact_errors=True)
+
+        with pytest.raises(CompactValidationError) as info:
+            schema.load(ROSTER_INVALID[0])
+
+        raw = info.value.raw_messages
+        assert not isinstance(raw["name"][0], str)
+        assert not isinstance(raw["members"][0]["age"][0], str)
+
+    def test_compact(self):
+        schema = dataclass_schema(Roster)(compact_errors=True)
+
+        with pytest.raises(CompactValidationError) as info:
+            schema.load(ROSTER_INVALID[0])
+
+        assert sorted(info.value.compact(), key=str) == sorted(
+            [
+                (("name",), "invalid", {}),
+                (("members", 0, "age"), "invalid", {"input": "x"}),
+                (("members", 1, "name"), "required", {}),
+            ],
+            key=str,
+        )
+
+    def test_class_attribute(self):
+        @dataclass
+        class Strict:
+            value: int
+
+        @schema_for(Strict)
+        class StrictSchema(DataSchemaConcrete):
+            COMPACT_ERRORS = True
+
+        with pytest.raises(CompactValidationError) as info:
+            StrictSchema().loads('{"value": "x"}')
+
+        assert info.value.messages == {"value": ["Not a valid integer."]}
+
+    def test_validate_rendered(self):
+        schema = dataclass_schema(Roster)(compact_errors=True)
+
+        with pytest.raises(CompactValidationError):
+            schema.load(ROSTER_INVALID[0])
+        errors = schema.validate(ROSTER_INVALID[0])
+
+        assert errors["name"] == ["Not a valid string."]
+
+    def test_valid_load(self):
+        schema = dataclass_schema(Roster)(compact_errors=True)
+
+        loaded = schema.load({"name": "a", "members": [{"name": "b", "age": 1}]})
+
+        assert loaded == Roster("a", [Person("b", 1)])
+
+    def test_compact_nested_in_regular(self):
+        @dataclass
+        class Inner:
+            value: int
+
+        @schema_for(Inner)
+        class InnerSchema(DataSchemaConcrete):
+            COMPACT_ERRORS = True
+
+        class OuterSchema(Schema):
+            inner = fields.Nested(InnerSchema)
+
+        with pytest.raises(ValidationError) as info:
+            OuterSchema().load({"inner": {"value": "x"}})
+
+        assert type(info.value) is ValidationError
+        assert info.value.messages == {"inner": {"value": ["Not a valid integer."]}}
+
+    def test_load_file(self, tmp_path):
+        schema = dataclass_schema(Person)(many=True, compact_errors=True)
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps([{"name": "a", "age": 1}, {"name": "b"}] * 3))
+
+        with pytest.raises(CompactValidationError) as info:
+            schema.load_file(path, batch_size=2)
+
+        assert info.value.messages == {
+            i: {"age": ["Missing data for required field."]} for i in (1, 3, 5)
+        }
+
+
+class TestLazySchemaFor:
+    def test_deferred_until_instantiated(self):
+        @dataclass
+        class Y:
+            number: int
+            x: Simple
+
+        type_handlers = {}
+
+        @schema_for(Y, type_handlers=type_handlers, lazy=True)
+        class YSchema(DataSchemaConcrete):
+            pass
+
+        assert type_handlers[Y] is YSchema
+        assert Simple not in type_handlers
+
+        loaded = YSchema().load({"number": 1, "x": {"text": "a"}})
+
+        assert loaded == Y(1, Simple("a"))
+        assert Simple in type_handlers
+        assert type_handlers[Y] is YSchema
+
+    def test_class_attribute_access(self):
+        @dataclass
+        class X:
+            value: str
+
+        @schema_for(X, lazy=True)
+        class XSchema(DataSchemaConcrete):
+            pass
+
+        assert XSchema.__model__ is X
+        assert set(XSchema._declared_fields) == {"value"}
+
+    def test_keeps_schema_methods(self):
+        @dataclass
+        class X:
+            value: int
+
+        @schema_for(X, lazy=True)
+        class XSchema(DataSchemaConcrete):
+            extra = fields.Str(required=False)
+
+            @validates("value")
+            def check_value(self, value: int) -> None:
+                if value > 4:
+                    raise ValidationError("too big")
+
+        assert set(XSchema._declared_fields) == {"value", "extra"}
+        assert XSchema().validate({"value": 5}) == {"value": ["too big"]}
+        assert XSchema().dump(X(1)) == {"value": 1}
+
+    def test_nested_before_generation(self):
+        @dataclass
+        class X:
+            value: str
+
+        @dataclass
+        class Y:
+            x: X
+
+        type_handlers = {}
+
+        @schema_for(X, type_handlers=type_handlers, lazy=True)
+        class XSchema(DataSchemaConcrete):
+            pass
+
+        YSchema = dataclass_schema(Y, type_handlers=type_handlers)
+
+        assert YSchema._declared_fields["x"].nested is XSchema
+        assert YSchema().load({"x": {"value": "a"}}) == Y(X("a"))
+
+    def test_docstring(self):
+        @dataclass
+        class X:
+            """Docstring Stuff"""
+
+            value: str
+
+        @schema_for(X, lazy=True)
+        class XSchema(DataSchemaConcrete):
+            pass
+
+        assert XSchema.__doc__ == "Docstring Stuff"
+
+
+class TestHandlerRegistry:
+    def test_mapping(self):
+        registry = HandlerRegistry({str: fields.Str})
+
+        registry[int] = fields.Int
+        registry.update({float: fields.Float})
+        del registry[str]
+
+        assert dict(registry) == {int: fields.Int, float: fields.Float}
+        assert len(registry) == 2
+        assert registry.get(str) is None
+
+    def test_field_handlers(self):
+        registry = HandlerRegistry({str: fields.Str})
+        first = registry.field_handlers
+
+        registry[int] = fields.Int
+        registry[Simple] = dataclass_schema(Simple)
+        del registry[str]
+        registry.add_generated(int, dataclass_schema(Simple))
+
+        assert first == {(str, fields.Str)}
+        assert registry.field_handlers == frozenset()
+
+        registry[float] = fields.Float
+        assert registry.field_handlers == {(float, fields.Float)}
+
+    def test_fast_encoder_skips_schemas(self, monkeypatch):
+        registry = HandlerRegistry()
+        dataclass_schema(Simple, type_handlers=registry)
+
+        def fail(*args):
+            raise AssertionError("registry scanned")
+
+        monkeypatch.setattr(HandlerRegistry, "items", fail)
+
+        class Encoder(FastEncoder, type_handlers=registry):
+            pass
+
+        pending = Encoder._pending_handlers
+        assert (datetime.datetime, FIELD_CONVERSION[datetime.datetime]) in pending
+        assert Simple not in dict(pending)
+
+    def test_as_type_handlers(self):
+        @dataclass
+        class Y:
+            x: Simple
+
+        registry = HandlerRegistry()
+
+        YSchema = dataclass_schema(Y, type_handlers=registry)
+
+        assert registry[Y] is YSchema
+        assert Simple in registry
+        assert YSchema().load({"x": {"text": "a"}}) == Y(Simple("a"))
+
+    def test_generate_deduplicates(self):
+        registry = HandlerRegistry()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            registry[Simple] = "schema"
+            return "schema"
+
+        results = []
+
+        def worker():
+            results.append(registry.generate(Simple, factory))
+
+        first = threading.Thread(target=worker)
+        first.start()
+        started.wait(5)
+
+        others = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in others:
+            thread.start()
+        release.set()
+
+        for thread in [first] + others:
+            thread.join(5)
+
+        assert calls == [1]
+        assert results == ["schema"] * 5
+
+    def test_generate_error_shared(self):
+        registry = HandlerRegistry()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def factory():
+            started.set()
+            release.wait(5)
+            raise ValueError("bad")
+
+        def worker():
+            try:
+                registry.generate(Simple, factory)
+            except ValueError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(errors) == 3
+        assert Simple not in registry
+
+    def test_generate_reentrant(self):
+        registry = HandlerRegistry()
+
+        def inner():
+            return "inner"
+
+        def outer():
+            return registry.generate(Simple, inner)
+
+        assert registry.generate(Simple, outer) == "inner"
+
+    def test_concurrent_generation(self):
+        @dataclass
+        class Shared:
+            text: str
+
+        @dataclass
+        class A:
+            shared: Shared
+
+        @dataclass
+        class B:
+            shared: Shared
+
+        registry = HandlerRegistry()
+        schemas = {}
+
+        def worker(data_class):
+            schemas[data_class] = dataclass_schema(data_class, type_handlers=registry)
+
+        threads = [threading.Thread(target=worker, args=(dc,)) for dc in (A, B)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        shared_schema = registry[Shared]
+        assert schemas[A]._declared_fields["shared"].nested is shared_schema
+        assert schemas[B]._declared_fields["shared"].nested is shared_schema
+
+    def test_top_level_deduplicated(self, monkeypatch):
+        registry = HandlerRegistry()
+        build = _convert._build_schema
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_build(*args):
+            calls.append(args[0])
+            started.set()
+            release.wait(5)
+            return build(*args)
+
+        monkeypatch.setattr(_convert, "_build_schema", slow_build)
+        schemas = []
+
+        def worker():
+            schemas.append(dataclass_schema(Simple, type_handlers=registry))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        threads[0].start()
+        started.wait(5)
+        threads[1].start()
+        while not registry._waiting:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert calls == [Simple]
+        assert schemas[0] is schemas[1]
+
+    def test_top_level_not_reused(self):
+        registry = HandlerRegistry()
+
+        first = dataclass_schema(Simple, type_handlers=registry)
+
+        assert dataclass_schema(Simple, type_handlers=registry) is not first
+
+    @staticmethod
+    def make_models(count):
+        return [
+            make_dataclass(f"Dynamic{index}", [("text", str)]) for index in range(count)
+        ]
+
+    def test_max_generated(self):
+        registry = HandlerRegistry(max_generated=2)
+        first, second, third = self.make_models(3)
+
+        dataclass_schema(first, type_handlers=registry)
+        dataclass_schema(second, type_handlers=registry)
+        # Using the first schema makes the second the least recently used.
+        assert registry[first] is not None
+        dataclass_schema(third, type_handlers=registry)
+
+        assert first in registry
+        assert second not in registry
+        assert third in registry
+        # Declared handlers are never evicted.
+        assert registry[str] is fields.Str
+
+    def test_max_generated_regenerates(self):
+        @dataclass
+        class Parent:
+            child: Simple
+
+        registry = HandlerRegistry(max_generated=1)
+        schema = dataclass_schema(Parent, type_handlers=registry)
+        dataclass_schema(self.make_models(1)[0], type_handlers=registry)
+
+        assert Parent not in registry
+        assert schema().load({"child": {"text": "a"}}) == Parent(Simple("a"))
+        assert dataclass_schema(Parent, type_handlers=registry) is not schema
+
+    @pytest.mark.parametrize(
+        "options", [{"max_generated": 2}, {"weak_generated": True}]
+    )
+    def test_declared_not_evicted(self, options):
+        @dataclass
+        class Custom:
+            text: str
+
+        @dataclass
+        class Parent:
+            child: Custom
+
+        class CustomSchema(Schema):
+            text = fields.Str()
+
+            @post_load
+            def mark(self, data, **kwargs):
+                return Custom(data["text"] + "!")
+
+        registry = HandlerRegistry({Custom: CustomSchema}, **options)
+        for model in self.make_models(3):
+            dataclass_schema(model, type_handlers=registry)
+        gc.collect()
+
+        assert registry[Custom] is CustomSchema
+        loaded = dataclass_schema(Parent, type_handlers=registry)().load(
+            {"child": {"text": "a"}}
+        )
+        assert loaded == Parent(Custom("a!"))
+
+    def test_weak_generated(self):
+        registry = HandlerRegistry(weak_generated=True)
+        kept, dropped = self.make_models(2)
+
+        kept_schema = dataclass_schema(kept, type_handlers=registry)
+        dataclass_schema(dropped, type_handlers=registry)
+        gc.collect()
+
+        assert registry[kept] is kept_schema
+        assert dropped not in registry
+        assert len(registry) == len(FIELD_CONVERSION) + 1
+
+    def test_weak_generated_releases_models(self):
+        registry = HandlerRegistry(weak_generated=True)
+        model = self.make_models(1)[0]
+        model_ref = weakref.ref(model)
+
+        dataclass_schema(model, type_handlers=registry)().load({"text": "a"})
+        del model
+        gc.collect()
+        # Dead entries are dropped on the next write.
+        dataclass_schema(Simple, type_handlers=registry)
+        gc.collect()
+
+        assert model_ref() is None
+
+    def test_bounded_not_in_class_registry(self):
+        registry = HandlerRegistry(max_generated=10)
+        model = make_dataclass("Unregistered", [("text", str)])
+
+        dataclass_schema(model, type_handlers=registry)
+
+        with pytest.raises(RegistryError):
+            class_registry.get_class("UnregisteredSchema")
+
+    def test_bounded_exact_match(self):
+        @dataclass
+        class Base:
+            text: str
+
+        @dataclass
+        class Derived(Base):
+            number: int = 0
+
+        registry = HandlerRegistry(max_generated=10)
+        base_schema = dataclass_schema(Base, type_handlers=registry)
+
+        assert list(registry.candidates(Base)) == [(Base, base_schema)]
+        assert Base not in dict(registry.candidates(Derived))
+
+
+@dataclass
+class Passthrough:
+    text: str
+    number: int
+    ratio: float
+    flag: bool
+    names: List[str]
+    counts: Dict[str, int]
+    when: datetime.datetime
+    note: Optional[str] = None
+
+
+class TestPassthroughDump:
+    def test_fields_marked(self):
+        schema = dataclass_schema(Passthrough)()
+        marked = {
+            name
+            for name, field in schema.fields.items()
+            if getattr(field, "_json_passthrough", False)
+        }
+        assert marked == {"text", "number", "ratio", "flag", "names", "counts", "note"}
+
+    def test_validated_fields_not_marked(self):
+        @dataclass
+        class Validated:
+            text: str = gfield(garams=Garams(validate=lambda value: True))
+
+        field = dataclass_schema(Validated)().fields["text"]
+        assert not getattr(field, "_json_passthrough", False)
+
+    def test_dump(self):
+        when = datetime.datetime(2020, 1, 1)
+        data = Passthrough("a", 1, 1.5, True, ["b"], {"c": 2}, when)
+
+        dumped = dataclass_schema(Passthrough)().dump(data)
+
+        assert dumped == {
+            "text": "a",
+            "number": 1,
+            "ratio": 1.5,
+            "flag": True,
+            "names": ["b"],
+            "counts": {"c": 2},
+            "when": when.isoformat(),
+            "note": None,
+        }
+        assert dumped["names"] is not data.names
+        assert dumped["counts"] is not data.counts
+
+    def test_dump_key_order(self):
+        data = Passthrough("a", 1, 1.5, True, [], {}, datetime.datetime(2020, 1, 1))
+
+        dumped = dataclass_schema(Passthrough)().dump(data)
+
+        assert list(dumped) == [f.name for f in dataclasses_fields(Passthrough)]
+
+    def test_dump_converts_other_types(self):
+        data = Passthrough(
+            EmailStr("a@b.com"), True, 1, 1, ["b", 2], {"c": 2.0}, None  # type: ignore
+        )
+
+        dumped = dataclass_schema(Passthrough)().dump(data)
+
+        assert type(dumped["text"]) is str
+        assert dumped["number"] == 1 and type(dumped["number"]) is int
+        assert dumped["ratio"] == 1.0 and type(dumped["ratio"]) is float
+        assert dumped["flag"] is True
+        assert dumped["names"] == ["b", "2"]
+        assert dumped["counts"] == {"c": 2}
+        assert dumped["when"] is None
+
+    def test_dump_data_key(self):
+        @dataclass
+        class Keyed:
+            text: str = gfield(garams=Garams(data_key="Text"))
+
+        assert dataclass_schema(Keyed)().dump(Keyed("a")) == {"Text": "a"}
+
+    def test_dump_missing(self):
+        schema = dataclass_schema(Passthrough)()
+
+        # Missing values still get their defaults.
+        assert schema.dump({"text": "a"}) == {"text": "a", "note": None}
+
+
+class TestFastEncoder:
+    class Color(Enum):
+        RED = "red"
+
+    class Stamp(datetime.datetime):
+        pass
+
+    class Id(uuid.UUID):
+        pass
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (Stamp(2020, 1, 1), "2020-01-01T00:00:00"),
+            (
+                Id("7b5dbfa2-6d6c-4d1c-8bd2-8bb1d3e4d0a1"),
+                "7b5dbfa2-6d6c-4d1c-8bd2-8bb1d3e4d0a1",
+            ),
+            (Decimal("1.10"), "1.10"),
+            ({1}, [1]),
+            (frozenset({"a"}), ["a"]),
+            (Color.RED, "red"),
+            (b"\x00\xff", "AP8="),
+            (bytearray(b"ab"), "YWI="),
+        ],
+    )
+    def test_encode(self, value, expected):
+        assert json.loads(json.dumps(value, cls=FastEncoder)) == expected
+
+    def test_dispatch_cached(self):
+        class Encoder(FastEncoder):
+            pass
+
+        class Day(datetime.date):
+            pass
+
+        json.dumps(Day(2020, 1, 1), cls=Encoder)
+
+        assert Day in Encoder._dispatch
+        assert Day not in FastEncoder._dispatch
+
+    def test_unsupported(self):
+        with pytest.raises(TypeError):
+            json.dumps(object(), cls=FastEncoder)
+
+    def test_converter_tables_shared(self):
+        @dataclass
+        class A:
+            when: datetime.datetime
+
+        @dataclass
+        class B:
+            a: A
+
+        registry = HandlerRegistry()
+        schema_a = dataclass_schema(A, type_handlers=registry)
+        schema_b = dataclass_schema(B, type_handlers=registry)
+        data = B(A(datetime.datetime(2020, 1, 1)))
+
+        assert json.loads(schema_b(fast_dumps=True).dumps(data)) == {
+            "a": {"when": "2020-01-01T00:00:00"}
+        }
+        schema_a(fast_dumps=True).dumps(data.a)
+
+        converters_a = schema_a._FAST_ENCODER.CONVERTERS
+        converters_b = schema_b._FAST_ENCODER.CONVERTERS
+        assert converters_a is converters_b
+        assert converters_a is generate_converter_dict(FIELD_CONVERSION)
+        # Schemas are never used as converters.
+        assert A not in converters_b
+
+    def test_converters_built_on_first_use(self):
+        @dataclass
+        class Lazy:
+            when: datetime.datetime
+
+        schema = dataclass_schema(Lazy, type_handlers=HandlerRegistry())
+        assert schema._FAST_ENCODER._pending_handlers is not None
+
+        schema(fast_dumps=True).dumps(Lazy(datetime.datetime(2020, 1, 1)))
+
+        assert schema._FAST_ENCODER._pending_handlers is None
+
+    def test_converters_snapshot_handlers(self):
+        class Custom:
+            pass
+
+        class CustomField(fields.Field):
+            def _serialize(self, value, attr, obj, **kwargs):
+                return "custom"
+
+        @dataclass
+        class Holder:
+            value: dict
+
+        type_handlers = dict(FIELD_CONVERSION)
+        schema = dataclass_schema(Holder, type_handlers=type_handlers)
+        type_handlers[Custom] = CustomField
+
+        with pytest.raises(TypeError):
+            schema(fast_dumps=True).dumps(Holder({"a": Custom()}))
+
+    def test_converter_tables_bounded(self, monkeypatch):
+        from grahamcracker import _fast_conversion
+
+        monkeypatch.setattr(_fast_conversion, "_MAX_CONVERTER_TABLES", 2)
+        monkeypatch.setattr(_fast_conversion, "_CONVERTER_TABLES", OrderedDict())
+
+        for index in range(4):
+            custom = type(f"Custom{index}", (), {})
+            generate_converter_dict({custom: fields.Str})
+
+        assert len(_fast_conversion._CONVERTER_TABLES) == 2
+
+    def test_converter_fields_shared(self):
+        class Custom:
+            pass
+
+        class CustomField(fields.Field):
+            def _serialize(self, value, attr, obj, **kwargs):
+                return "custom"
+
+        base = generate_converter_dict(FIELD_CONVERSION)
+        extended = generate_converter_dict(dict(FIELD_CONVERSION, **{"x": 1}))
+        with_custom = generate_converter_dict({**FIELD_CONVERSION, Custom: CustomField})
+
+        assert extended is base
+        assert with_custom is not base
+        assert with_custom[datetime.datetime] is base[datetime.datetime]
+        assert isinstance(with_custom[Custom], CustomField)
+
+    def test_fast_dumps(self):
+        @dataclass
+        class Extended:
+            when: datetime.datetime
+            tags: List[str]
+
+        data = Extended(self.Stamp(2020, 1, 1), ["a"])
+        schema = dataclass_schema(Extended)(fast_dumps=True)
+
+        assert json.loads(schema.dumps(data)) == {
+            "when": "2020-01-01T00:00:00",
+            "tags": ["a"],
+        }
+
 
 def test_marshmallow_method_validators():
     @schema_for(Simple)
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from marshmallow import ValidationError
+
+from grahamcracker import (
+    DataSchemaConcrete,
+    MetricsRegistry,
+    TraceEvent,
+    Tracer,
+    schema_for,
+)
+
+
+@dataclass
+class LineItem:
+    sku: str
+    quantity: int
+
+
+@dataclass
+class Customer:
+    name: str
+
+
+@dataclass
+class Order:
+    id: int
+    lines: List[LineItem]
+    customer: Optional[Customer] = None
+
+
+@schema_for(Order)
+class OrderSchema(DataSchemaConcrete):
+    pass
+
+
+ORDER = {
+    "id": 1,
+    "lines": [{"sku": "a", "quantity": 1}, {"sku": "b", "quantity": 2}],
+    "customer": {"name": "c"},
+}
+
+
+class RecordingTracer(Tracer):
+    def __init__(self, trace_nested=False):
+        self.trace_nested = trace_nested
+        self.calls = []
+
+    def start(self, event):
+        self.calls.append(("start", event))
+        return len(self.calls)
+
+    def end(self, event, span, error):
+        self.calls.append(("end", event, span, error))
+
+    @property
+    def started(self):
+        return [call[1] for call in self.calls if call[0] == "start"]
+
+
+class TestTracer:
+    def test_schema_calls(self):
+        tracer = RecordingTracer()
+
+        OrderSchema(tracer=tracer).load(ORDER)
+
+        assert tracer.started == [
+            TraceEvent("OrderSchema", "load", 1, ()),
+            TraceEvent("LineItemSchema", "load", 2, ("lines",)),
+            TraceEvent("CustomerSchema", "load", 1, ("customer",)),
+        ]
+
+    def test_start_and_end_pair(self):
+        tracer = RecordingTracer()
+
+        OrderSchema(tracer=tracer).load(ORDER)
+
+        assert tracer.calls[0][0] == "start"
+        assert tracer.calls[-1] == (
+            "end",
+            TraceEvent("OrderSchema", "load", 1, ()),
+            1,
+            None,
+        )
+
+    def test_nested_fields(self):
+        tracer = RecordingTracer(trace_nested=True)
+        order = OrderSchema().load(ORDER)
+
+        OrderSchema(tracer=tracer).dump(order)
+
+        assert tracer.started == [
+            TraceEvent("OrderSchema", "dump", 1, ()),
+            TraceEvent("LineItemSchema", "nested_dump", 2, ("lines",)),
+            TraceEvent("LineItemSchema", "dump", 2, ("lines",)),
+            TraceEvent("CustomerSchema", "nested_dump", 1, ("customer",)),
+            TraceEvent("CustomerSchema", "dump", 1, ("customer",)),
+        ]
+
+    def test_dumps_not_traced_twice(self):
+        tracer = RecordingTracer()
+        order = OrderSchema().load(ORDER)
+
+        OrderSchema(tracer=tracer).dumps(order)
+
+        assert [e.operation for e in tracer.started if e.schema == "OrderSchema"] == [
+            "dumps"
+        ]
+
+    def test_error(self):
+        tracer = RecordingTracer()
+
+        with pytest.raises(ValidationError):
+            OrderSchema(tracer=tracer).load(dict(ORDER, id="x"))
+
+        _, event, _, error = tracer.calls[-1]
+        assert event.schema == "OrderSchema"
+        assert isinstance(error, ValidationError)
+
+    def test_class_attribute(self):
+        tracer = RecordingTracer()
+
+        @dataclass
+        class Traced:
+            value: int
+
+        @schema_for(Traced)
+        class TracedSchema(DataSchemaConcrete):
+            TRACER = tracer
+
+        TracedSchema().load({"value": 1})
+
+        assert tracer.started == [TraceEvent("TracedSchema", "load", 1, ())]
+
+    def test_base_tracer_is_inactive(self):
+        schema = OrderSchema(tracer=Tracer())
+
+        assert schema._tracer is None
+        assert not schema._instrumented
+        assert schema.load(ORDER).id == 1
+
+    def test_with_metrics(self):
+        tracer = RecordingTracer()
+        registry = MetricsRegistry()
+
+        OrderSchema(tracer=tracer, metrics=registry, many=True).load([ORDER] * 3)
+
+        assert tracer.started[0] == TraceEvent("OrderSchema", "load", 3, ())
+        calls = registry.as_dict()["grahamcracker_calls_total"]["samples"]
+        assert {s["labels"]["schema"] for s in calls} == {
+            "OrderSchema",
+            "LineItemSchema",
+            "CustomerSchema",
+        }
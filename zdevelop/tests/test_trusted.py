@@ -0,0 +1,197 @@
+import datetime
+import enum
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pytest
+
+from grahamcracker import (
+    DataSchemaConcrete,
+    EmailStr,
+    MetricsRegistry,
+    URLStr,
+    schema_for,
+)
+from grahamcracker._load_dataclass import MISSING
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@dataclass
+class Tag:
+    name: str
+    created: datetime.datetime
+
+
+@dataclass
+class Record:
+    id: uuid.UUID
+    name: str
+    count: int
+    price: float
+    active: bool
+    created: datetime.datetime
+    day: datetime.date
+    at: datetime.time
+    color: Color
+    email: EmailStr
+    site: URLStr
+    tags: List[Tag]
+    scores: Dict[str, int]
+    main: Optional[Tag] = None
+    nickname: Optional[str] = None
+
+
+@schema_for(Record)
+class RecordSchema(DataSchemaConcrete):
+    pass
+
+
+NOW = datetime.datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc)
+
+RECORD = Record(
+    id=uuid.UUID("7b5dbfa2-6d6c-4d1c-8bd2-8bb1d3e4d0a1"),
+    name="record",
+    count=3,
+    price=1.5,
+    active=True,
+    created=NOW,
+    day=NOW.date(),
+    at=NOW.time(),
+    color=Color.BLUE,
+    email=EmailStr("someone@example.com"),
+    site=URLStr("https://example.com"),
+    tags=[Tag("a", NOW), Tag("b", NOW)],
+    scores={"x": 1},
+    main=Tag("main", NOW),
+)
+
+
+class TestTrustedLoad:
+    def test_matches_load(self):
+        schema = RecordSchema()
+        dumped = schema.dump(RECORD)
+
+        loaded = schema.load(dumped, trusted=True)
+
+        assert loaded == schema.load(dumped)
+        assert loaded == RECORD
+        assert isinstance(loaded.email, EmailStr)
+        assert isinstance(loaded.site, URLStr)
+        assert isinstance(loaded.tags[0], Tag)
+
+    def test_many(self):
+        schema = RecordSchema()
+        dumped = schema.dump([RECORD, RECORD], many=True)
+
+        assert schema.load(dumped, many=True, trusted=True) == [RECORD, RECORD]
+
+    def test_loads(self):
+        schema = RecordSchema()
+
+        loaded = schema.loads(schema.dumps(RECORD), trusted=True)
+
+        assert loaded == RECORD
+
+    def test_skips_validation(self):
+        dumped = RecordSchema().dump(RECORD)
+        dumped["name"] = 10
+        dumped["email"] = "not an email"
+        dumped["unknown"] = "ignored"
+
+        loaded = RecordSchema().load(dumped, trusted=True)
+
+        assert loaded.name == 10
+        assert loaded.email == "not an email"
+
+    def test_missing_values(self):
+        dumped = RecordSchema().dump(RECORD)
+        del dumped["count"]
+
+        loaded = RecordSchema().load(dumped, trusted=True)
+
+        assert loaded.count is MISSING
+
+    def test_missing_values_defaults(self):
+        dumped = RecordSchema().dump(RECORD)
+        del dumped["main"]
+        del dumped["nickname"]
+
+        loaded = RecordSchema().load(dumped, trusted=True)
+
+        assert loaded == RecordSchema().load(dumped)
+        assert loaded.main is None
+        assert loaded.nickname is None
+
+    @pytest.mark.parametrize(
+        "options", [{"partial": True}, {"partial": ["name"]}, {"unknown": "raise"}]
+    )
+    def test_unsupported_options(self, options):
+        schema = RecordSchema()
+        dumped = schema.dump(RECORD)
+
+        with pytest.raises(ValueError):
+            schema.load(dumped, trusted=True, **options)
+        with pytest.raises(ValueError):
+            schema.loads(schema.dumps(RECORD), trusted=True, **options)
+
+    def test_unknown_exclude(self):
+        dumped = RecordSchema().dump(RECORD)
+
+        assert RecordSchema().load(dumped, trusted=True, unknown="exclude") == RECORD
+
+    def test_missing_values_use_defaults(self):
+        dumped = RecordSchema().dump(RECORD)
+        del dumped["main"]
+
+        loaded = RecordSchema(use_defaults=True).load(dumped, trusted=True)
+
+        assert loaded.main is None
+
+    def test_none_values(self):
+        dumped = RecordSchema().dump(RECORD)
+        dumped["main"] = None
+        dumped["created"] = None
+
+        loaded = RecordSchema().load(dumped, trusted=True)
+
+        assert loaded.main is None
+        assert loaded.created is None
+
+    def test_no_dataclass(self):
+        schema = RecordSchema(load_dataclass=False)
+        dumped = schema.dump(RECORD)
+
+        loaded = schema.load(dumped, trusted=True)
+
+        assert isinstance(loaded, dict)
+        assert loaded["tags"][0] == {"name": "a", "created": NOW}
+
+    def test_normalize_many(self):
+        schema = RecordSchema(normalize_many=True)
+
+        loaded = schema.load(schema.dump(RECORD), many=True, trusted=True)
+
+        assert loaded == [RECORD]
+
+    def test_metrics(self):
+        registry = MetricsRegistry()
+        schema = RecordSchema(metrics=registry)
+
+        schema.loads(schema.dumps(RECORD), trusted=True)
+
+        calls = registry.as_dict()["grahamcracker_calls_total"]["samples"]
+        assert {"schema": "RecordSchema", "operation": "loads"} in [
+            sample["labels"] for sample in calls
+        ]
+
+    @pytest.mark.parametrize("value", ["2020-01-02T03:04:05.000006Z", NOW])
+    def test_datetime_forms(self, value):
+        dumped = RecordSchema().dump(RECORD)
+        dumped["created"] = value
+
+        assert RecordSchema().load(dumped, trusted=True).created == NOW
@@ -0,0 +1,152 @@
+import sys
+from dataclasses import dataclass
+from typing import Generic, List, TypeVar
+
+from grahamcracker import (
+    DataSchemaConcrete,
+    HandlerRegistry,
+    schema_for,
+    warm_up,
+)
+
+
+Var = TypeVar("Var")
+
+
+@dataclass
+class Author:
+    name: str
+
+
+@dataclass
+class Book:
+    title: str
+    authors: List[Author]
+
+
+@dataclass
+class Page(Generic[Var]):
+    items: List[Var]
+
+
+@dataclass
+class Review:
+    stars: int
+
+
+@schema_for(Review)
+class ReviewSchema(DataSchemaConcrete):
+    pass
+
+
+@dataclass
+class Broken:
+    value: "NotDefined"  # noqa: F821
+
+
+THIS_MODULE = sys.modules[__name__]
+
+
+class TestWarmUp:
+    def test_finds_schemas(self):
+        result = warm_up(THIS_MODULE)
+
+        assert result.done
+        assert set(result.schemas) == {Author, Book, Review}
+        assert result.schemas[Review] is ReviewSchema
+        assert result.schemas[Book]().load(
+            {"title": "a", "authors": [{"name": "b"}]}
+        ) == Book("a", [Author("b")])
+
+    def test_nested_reused(self):
+        result = warm_up(THIS_MODULE)
+
+        book_schema = result.schemas[Book]
+        assert book_schema._declared_fields["authors"].nested is (
+            result.schemas[Author]
+        )
+        assert isinstance(result.type_handlers, HandlerRegistry)
+
+    def test_errors_collected(self):
+        result = warm_up(THIS_MODULE)
+
+        assert set(result.errors) == {Broken}
+
+    def test_variants(self):
+        result = warm_up(THIS_MODULE, variants=[{"many": True}])
+
+        default, many = result.instances[Author]
+        assert not default.many
+        assert many.many
+        assert many.load([{"name": "a"}]) == [Author("a")]
+
+    def test_type_handlers(self):
+        type_handlers = {}
+
+        result = warm_up(THIS_MODULE, type_handlers=type_handlers)
+
+        assert result.type_handlers is type_handlers
+        assert type_handlers[Author] is result.schemas[Author]
+
+    def test_module_name(self):
+        result = warm_up(__name__)
+
+        assert Author in result.schemas
+
+    def test_progress(self):
+        reports = []
+
+        warm_up(THIS_MODULE, progress=reports.append)
+
+        assert [r.done for r in reports] == [1, 2, 3, 4]
+        assert all(r.total == 4 for r in reports)
+        broken = next(r for r in reports if r.data_class is Broken)
+        assert broken.schema is None
+
+    def test_background(self):
+        reports = []
+
+        result = warm_up(THIS_MODULE, background=True, progress=reports.append)
+
+        assert result.wait(10)
+        assert result.done
+        assert not result.thread.is_alive()
+        assert len(reports) == 4
+        assert Book in result.schemas
+
+    def test_package(self):
+        import zdevelop.tests
+        from zdevelop.tests.test_schema import Simple
+
+        result = warm_up(zdevelop.tests)
+
+        assert Simple in result.schemas
+
+    def test_import_errors_collected(self, tmp_path, monkeypatch):
+        package = tmp_path / "warm_up_package"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "good.py").write_text(
+            "from dataclasses import dataclass\n"
+            "\n"
+            "@dataclass\n"
+            "class Good:\n"
+            "    value: int\n"
+        )
+        (package / "bad.py").write_text("import not_a_real_module\n")
+        (package / "bad_package").mkdir()
+        (package / "bad_package" / "__init__.py").write_text("raise RuntimeError\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        result = warm_up("warm_up_package", "not_a_real_module", background=True)
+
+        assert result.wait(10)
+        assert set(result.errors) == {
+            "warm_up_package.bad",
+            "warm_up_package.bad_package",
+            "not_a_real_module",
+        }
+        assert isinstance(result.errors["warm_up_package.bad"], ImportError)
+        assert isinstance(result.errors["warm_up_package.bad_package"], RuntimeError)
+        good = sys.modules["warm_up_package.good"].Good
+        assert good in result.schemas